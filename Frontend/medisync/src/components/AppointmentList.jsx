@@ -30,7 +30,7 @@ export default function AppointmentsList({ appointments, cancelAppointment }) {
             <span className={getStatusClass(apt.status)}>
               {apt.status.charAt(0).toUpperCase() + apt.status.slice(1)}
             </span>
-            <button onClick={() => cancelAppointment(apt.id)} className="appointment-cancel-btn">
+            <button onClick={() => cancelAppointment(apt.id)} className="appointment-cancel-btn" data-testid="appointment-cancel">
               Cancel
             </button>
           </div>
@@ -66,6 +66,7 @@ export default function FindDoctors({
               <Search size={18} style={{ color: '#999', marginRight: '8px' }} />
               <input
                 type="text"
+                data-testid="doctor-search-input"
                 placeholder="Search doctors..."
                 value={localSearchTerm}
                 onChange={(e) => {
@@ -133,7 +134,7 @@ export default function FindDoctors({
             style={{ padding: '10px 12px', border: '1px solid #ddd', borderRadius: '8px', backgroundColor: 'white', minWidth: '180px', height: '44px' }}
           />
           
-          <button className="btn btn-primary" onClick={handleSearch}>Search</button>
+          <button className="btn btn-primary" data-testid="doctor-search-button" onClick={handleSearch}>Search</button>
         </div>
         
         {/* Loading State */}
@@ -159,7 +160,7 @@ export default function FindDoctors({
               const specialization = doctor.specialization || 'General Practitioner';
               const image = doctor.profileImage || '/src/assets/Elogo.png';
               return (
-                <div key={doctor.doctorId || doctor.id} className="card" style={{ height: '350px', display: 'flex', flexDirection: 'column', position: 'relative' }}>
+                <div key={doctor.doctorId || doctor.id} className="card" data-testid="doctor-card" style={{ height: '350px', display: 'flex', flexDirection: 'column', position: 'relative' }}>
                   <div style={{ position: 'absolute', top: '10px', right: '10px', zIndex: 1 }}>
                     <FavoriteButton
                       doctorId={doctor.doctorId || doctor.id}
@@ -192,6 +193,7 @@ export default function FindDoctors({
                     
                     <button 
                       className="btn btn-primary"
+                      data-testid="book-now"
                       onClick={() => navigate(`/book/${doctor.doctorId || doctor.id}`)}
                       style={{ width: '100%', marginTop: 'auto', background: 'linear-gradient(135deg, #1976D2 0%, #0D47A1 100%)', border: 'none' }}
                     >
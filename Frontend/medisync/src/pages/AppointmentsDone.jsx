@@ -107,7 +107,7 @@ export default function AppointmentsDone() {
         ) : (
           <div className="appointments-grid">
             {appointments.map((appointment) => (
-              <div key={appointment.appointmentId} className="appointment-card">
+              <div key={appointment.appointmentId} className="appointment-card" data-testid="appointment-card">
                 <div className="appointment-header">
                   <div className="doctor-info">
                     <h3>{appointment.doctor}</h3>
@@ -276,7 +276,7 @@ export default function BookAppointment() {
                 <div className="no-slots">No available slots.</div>
               )}
               {getAvailableSlotsForDoctor().map(slot => (
-                <div key={slot.id} className="slot-card">
+                <div key={slot.id} className="slot-card" data-testid="slot-card">
                   <div className="slot-meta">
                     <div className="slot-row">
                       <div className="slot-field">
@@ -304,6 +304,7 @@ export default function BookAppointment() {
                     <div className="slot-fee">Rs. {slot.price ?? doctor.consultationFee}</div>
                     <button
                       className="btn-primary"
+                      data-testid="slot-book"
                       disabled={(slot.availableSlots ?? 0) <= 0 || (isBooking && bookingSlotId === slot.id)}
                       onClick={() => handleConfirmBooking(slot)}
                     >
@@ -545,6 +545,7 @@ export default function UserAccount() {
                   </div>
                   <div className="button-group">
                     <button
+                      data-testid="profile-edit"
                       onClick={() => {
                         setEditMode(true)
                         setImagePreview(profile.imageBase64 || null)
@@ -589,7 +590,7 @@ export default function UserAccount() {
                     </div>
                   </div>
                   <div className="button-group">
-                    <button type="submit" disabled={saving}>
+                    <button type="submit" data-testid="profile-save" disabled={saving}>
                       {saving ? "Saving..." : "Save"}
                     </button>
                     <button
@@ -204,7 +204,7 @@ const AdminSchedules = () => {
                             </tr>
                         ) : (
                             schedules.map(schedule => (
-                                <tr key={schedule.scheduleId}>
+                                <tr key={schedule.scheduleId} data-testid="schedule-row" data-schedule-id={schedule.scheduleId}>
                                     <td>{schedule.doctorName}</td>
                                     <td>{schedule.doctorSpecialization}</td>
                                     <td>{new Date(schedule.scheduleDate).toLocaleDateString()}</td>
@@ -1,5 +1,6 @@
 using OpenQA.Selenium;
 using OpenQA.Selenium.Chrome;
+using OpenQA.Selenium.Remote;
 using OpenQA.Selenium.Support.UI;
 using WebDriverManager;
 using WebDriverManager.DriverConfigs.Impl;
@@ -12,6 +13,8 @@ namespace SeleniumTests.Utils
         protected WebDriverWait wait;
         protected const string BASE_URL = "http://localhost:5173"; // React app URL
         protected const int TIMEOUT_SECONDS = 15;
+        // Shared local grid (Tests/UI/browser_grid.py), e.g. http://127.0.0.1:4444
+        private static readonly string? GridUrl = Environment.GetEnvironmentVariable("BROWSER_GRID_URL");
 
         public TestBase()
         {
@@ -22,8 +25,11 @@ namespace SeleniumTests.Utils
         {
             LogStep("Setting up Chrome driver...");
             
-            // Kill any existing Chrome processes first
-            KillExistingChromeProcesses();
+            // Kill any existing Chrome processes first (not with the grid: they are its warm browsers)
+            if (string.IsNullOrEmpty(GridUrl))
+            {
+                KillExistingChromeProcesses();
+            }
             
             var options = new ChromeOptions();
             
@@ -54,6 +60,15 @@ namespace SeleniumTests.Utils
             
             try
             {
+                if (!string.IsNullOrEmpty(GridUrl))
+                {
+                    LogStep($"Requesting Chrome from browser grid at {GridUrl}...");
+                    driver = new RemoteWebDriver(new Uri(GridUrl), options);
+                    ConfigureTimeouts();
+                    LogStep("Remote ChromeDriver initialized successfully");
+                    return;
+                }
+                
                 LogStep("Using WebDriverManager to setup compatible ChromeDriver...");
                 
                 // Use WebDriverManager to automatically download compatible driver
@@ -71,13 +86,7 @@ namespace SeleniumTests.Utils
                 
                 // Let Selenium Manager handle driver compatibility automatically
                 driver = new ChromeDriver(options);
-                
-                // Set conservative timeouts
-                driver.Manage().Timeouts().ImplicitWait = TimeSpan.FromSeconds(3);
-                driver.Manage().Timeouts().PageLoad = TimeSpan.FromSeconds(30);
-                driver.Manage().Timeouts().AsynchronousJavaScript = TimeSpan.FromSeconds(15);
-                
-                wait = new WebDriverWait(driver, TimeSpan.FromSeconds(TIMEOUT_SECONDS));
+                ConfigureTimeouts();
                 
                 LogStep($"ChromeDriver initialized successfully");
             }
@@ -88,6 +97,16 @@ namespace SeleniumTests.Utils
             }
         }
         
+        private void ConfigureTimeouts()
+        {
+            // Set conservative timeouts
+            driver.Manage().Timeouts().ImplicitWait = TimeSpan.FromSeconds(3);
+            driver.Manage().Timeouts().PageLoad = TimeSpan.FromSeconds(30);
+            driver.Manage().Timeouts().AsynchronousJavaScript = TimeSpan.FromSeconds(15);
+            
+            wait = new WebDriverWait(driver, TimeSpan.FromSeconds(TIMEOUT_SECONDS));
+        }
+        
         private void KillExistingChromeProcesses()
         {
             try
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Record and replay the API responses the frontend receives.
+
+Record mode reads Chrome's DevTools Network events (from the performance
+log) and stores every /api/ response the page received in a cassette:
+
+    <cassette>/index.json   key -> responses (status, content type, body slice)
+    <cassette>/bodies.bin   response bodies, each distinct body stored once
+
+Keys are "METHOD /path?query <sha256 of the request body>[:16]"; paths are
+lower-cased because the frontend mixes /api/booking and /api/Booking. A key
+recorded several times (favorites check before and after a toggle) replays
+its responses in recorded order, the last one repeating.
+
+Replay mode serves the cassette from a local HTTP server - bodies.bin is
+memory-mapped, so responses are sent straight from the page cache - and
+points the frontend at it through window.__API_BASE. The suite then needs
+only the frontend: no backend, no database.
+
+Usage:
+    pytest --record-cassette cassettes/full     # backend running, one process
+    pytest --replay-cassette cassettes/full     # no backend needed
+    python api_cassette.py serve cassettes/full --port 5001
+    python api_cassette.py info cassettes/full
+"""
+import argparse
+import base64
+import hashlib
+import json
+import mmap
+import os
+import threading
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+
+INDEX_FILE = "index.json"
+BODIES_FILE = "bodies.bin"
+API_PREFIX = "/api/"
+
+
+def cassette_key(method, url, body=b""):
+    """Index key of a request: method, lower-cased path + query and request body hash."""
+    parts = urlsplit(url)
+    path = parts.path.lower() + (f"?{parts.query}" if parts.query else "")
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return f"{method.upper()} {path} {hashlib.sha256(body or b'').hexdigest()[:16]}"
+
+
+def _load_index(root):
+    try:
+        with open(os.path.join(root, INDEX_FILE), encoding="utf-8") as index_file:
+            return json.load(index_file)
+    except FileNotFoundError:
+        return {}
+
+
+class CassetteWriter:
+    """
+    Append-only cassette writer (thread-safe). Re-recording into an existing
+    cassette adds to it; identical bodies are stored once.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._index = _load_index(root)
+        self._bodies = open(os.path.join(root, BODIES_FILE), "ab")
+        self._offsets = {
+            entry["sha256"]: (entry["offset"], entry["length"])
+            for entries in self._index.values() for entry in entries
+        }
+        self._lock = threading.Lock()
+
+    def add(self, method, url, request_body, status, content_type, body):
+        """Store one response to the request (method, url, request_body)."""
+        sha256 = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            if sha256 not in self._offsets:
+                self._offsets[sha256] = (self._bodies.tell(), len(body))
+                self._bodies.write(body)
+            offset, length = self._offsets[sha256]
+            self._index.setdefault(cassette_key(method, url, request_body), []).append({
+                "status": status,
+                "content_type": content_type,
+                "sha256": sha256,
+                "offset": offset,
+                "length": length,
+            })
+
+    def close(self):
+        with self._lock:
+            self._bodies.close()
+            tmp_path = os.path.join(self.root, INDEX_FILE + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as index_file:
+                json.dump(self._index, index_file, indent=1, sort_keys=True)
+            os.replace(tmp_path, os.path.join(self.root, INDEX_FILE))
+
+
+class Cassette:
+    """
+    Read side of a cassette: index in memory, bodies memory-mapped.
+    Requests that were never recorded are kept in `misses`.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.index = _load_index(root)
+        self._file = open(os.path.join(root, BODIES_FILE), "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        # mmap cannot map an empty file
+        self._bodies = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._cursors = defaultdict(int)
+        self._lock = threading.Lock()
+        self.misses = []
+
+    def lookup(self, method, url, body=b""):
+        """
+        Next recorded response for a request.
+
+        Returns:
+            (status, content_type, body as a memoryview) or None if not recorded
+        """
+        key = cassette_key(method, url, body)
+        if key not in self.index:
+            with self._lock:
+                self.misses.append(key)
+            return None
+        entries = self.index[key]
+        with self._lock:
+            position = self._cursors[key]
+            self._cursors[key] = position + 1
+        entry = entries[min(position, len(entries) - 1)]
+        body = memoryview(self._bodies)[entry["offset"]:entry["offset"] + entry["length"]]
+        return entry["status"], entry["content_type"], body
+
+    def rewind(self):
+        """Start every key's response sequence from the beginning again."""
+        with self._lock:
+            self._cursors.clear()
+
+    def close(self):
+        if isinstance(self._bodies, mmap.mmap):
+            self._bodies.close()
+        self._file.close()
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _cors_headers(self):
+        self.send_header("Access-Control-Allow-Origin", self.headers.get("Origin") or "*")
+        self.send_header("Access-Control-Allow-Credentials", "true")
+        self.send_header("Access-Control-Allow-Headers", self.headers.get("Access-Control-Request-Headers") or "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, PUT, PATCH, DELETE, OPTIONS")
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self._cors_headers()
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _replay(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        request_body = self.rfile.read(length) if length else b""
+        found = self.server.cassette.lookup(self.command, self.path, request_body)
+        if found is None:
+            status, content_type = 404, "application/json"
+            body = json.dumps({"message": f"Not recorded: {self.command} {self.path}"}).encode("utf-8")
+        else:
+            status, content_type, body = found
+        self.send_response(status)
+        self._cors_headers()
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _replay
+
+
+class CassetteServer:
+    """
+    Serve a cassette over HTTP in a background thread.
+
+    Args:
+        cassette: Cassette (or cassette directory) to replay
+        host, port: Where to listen; port 0 picks a free port
+    """
+
+    def __init__(self, cassette, host="127.0.0.1", port=0):
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+        self._server = ThreadingHTTPServer((host, port), _ReplayHandler)
+        self._server.daemon_threads = True
+        self._server.cassette = self.cassette
+        self.url = f"http://{host}:{self._server.server_address[1]}"
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="cassette-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve in the calling thread (for the command line)."""
+        self._server.serve_forever()
+
+    def stop(self):
+        if self._thread is not None:
+            self._server.shutdown()
+        self._server.server_close()
+        self.cassette.close()
+
+
+def enable_performance_log(chrome_options):
+    """Ask Chrome for DevTools events in the performance log (needed to record)."""
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def install_replay(driver, api_url):
+    """Point the frontend's API_BASE at `api_url` on every page loaded from now on."""
+    driver.execute_cdp_cmd(
+        "Page.addScriptToEvaluateOnNewDocument",
+        {"source": f"window.__API_BASE = {json.dumps(api_url)};"},
+    )
+
+
+class CassetteRecorder:
+    """
+    Record the /api/ responses a driver's pages receive into a CassetteWriter.
+
+    The driver must be created with enable_performance_log(). Events are read
+    from the performance log on every driver.get (response bodies are only
+    available while their page is loaded) and on finish().
+    """
+
+    def __init__(self, driver, writer):
+        self.driver = driver
+        self.writer = writer
+        self.recorded = 0
+        self._requests = {}
+        self._responses = {}
+        # Keep bodies around long enough to fetch them after the page used them
+        driver.execute_cdp_cmd("Network.enable", {
+            "maxTotalBufferSize": 100 * 1024 * 1024,
+            "maxResourceBufferSize": 20 * 1024 * 1024,
+        })
+        original_get = driver.get
+
+        def get(url):
+            self.harvest()
+            return original_get(url)
+
+        driver.get = get
+
+    def _store(self, request_id):
+        request = self._requests.pop(request_id, None)
+        response = self._responses.pop(request_id, None)
+        if request is None or response is None:
+            return
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        except Exception:
+            # Evicted or no body (e.g. 204)
+            result = {"body": "", "base64Encoded": False}
+        body = base64.b64decode(result["body"]) if result.get("base64Encoded") else result["body"].encode("utf-8")
+
+        post_data = request.get("postData")
+        if post_data is None and request.get("hasPostData"):
+            try:
+                post_data = self.driver.execute_cdp_cmd(
+                    "Network.getRequestPostData", {"requestId": request_id})["postData"]
+            except Exception:
+                post_data = ""
+        headers = {name.lower(): value for name, value in response.get("headers", {}).items()}
+        self.writer.add(request["method"], request["url"], post_data or "", response["status"],
+                        headers.get("content-type", response.get("mimeType")), body)
+        self.recorded += 1
+
+    def harvest(self):
+        """Store every API response that finished loading since the last harvest."""
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            return
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            method, params = message.get("method"), message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                request = params["request"]
+                if request["method"] != "OPTIONS" and urlsplit(request["url"]).path.lower().startswith(API_PREFIX):
+                    self._requests[params["requestId"]] = request
+            elif method == "Network.responseReceived" and params["requestId"] in self._requests:
+                self._responses[params["requestId"]] = params["response"]
+            elif method == "Network.loadingFinished" and params["requestId"] in self._responses:
+                self._store(params["requestId"])
+
+    def finish(self):
+        self.harvest()
+        return self.recorded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or serve a recorded API cassette")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    serve = subparsers.add_parser("serve", help="Replay a cassette over HTTP")
+    serve.add_argument("cassette")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=5001)
+    info = subparsers.add_parser("info", help="Summarize a cassette")
+    info.add_argument("cassette")
+    args = parser.parse_args()
+
+    if args.command == "info":
+        index = _load_index(args.cassette)
+        size = os.path.getsize(os.path.join(args.cassette, BODIES_FILE))
+        responses = sum(len(entries) for entries in index.values())
+        print(f"{len(index)} keys, {responses} responses, {size / 1024:.1f}KB of bodies")
+        for key in sorted(index):
+            print(f"  {len(index[key]):>4}  {key}")
+        return
+
+    server = CassetteServer(args.cassette, args.host, args.port)
+    print(f"Replaying {args.cassette} on {server.url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
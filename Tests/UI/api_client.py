@@ -0,0 +1,210 @@
+"""
+Minimal JSON client for the MediSync backend API.
+
+Used by the benchmark and load tests to call the backend directly (without a
+browser). Built on http.client so connections can be kept alive and so the
+time-to-first-byte of a response can be measured separately from the time it
+takes to read the full body.
+
+A client holds one connection and is NOT thread-safe - create one client per
+worker thread.
+"""
+import http.client
+import json
+import os
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+
+DEFAULT_API_BASE_URL = "http://localhost:5001"
+
+
+def get_api_base_url():
+    """Backend base URL, overridable with the API_BASE_URL environment variable."""
+    return os.getenv("API_BASE_URL", DEFAULT_API_BASE_URL).rstrip("/")
+
+
+class ApiResponse:
+    """Result of a single API call together with its timings."""
+
+    def __init__(self, status, headers, body, ttfb, elapsed):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.ttfb = ttfb
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return 200 <= self.status < 300
+
+    @property
+    def size(self):
+        """Size of the response body in bytes."""
+        return len(self.body)
+
+    def json(self):
+        """Decode the response body as JSON (None for an empty body)."""
+        if not self.body:
+            return None
+        return json.loads(self.body)
+
+
+class ApiClient:
+    """
+    Small keep-alive HTTP client for the backend API.
+
+    Args:
+        base_url: Backend base URL (defaults to get_api_base_url())
+        token: Optional JWT sent as a Bearer token
+        timeout: Socket timeout in seconds
+        keep_alive: Reuse one connection across requests. Pass False to open
+            a fresh connection per request (cold-connection measurements).
+    """
+
+    def __init__(self, base_url=None, token=None, timeout=30, keep_alive=True):
+        self.base_url = (base_url or get_api_base_url()).rstrip("/")
+        self.token = token
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+
+        parts = urlsplit(self.base_url)
+        self._scheme = parts.scheme
+        self._host = parts.hostname
+        self._port = parts.port
+        self._prefix = parts.path.rstrip("/")
+        self._conn = None
+
+    def _new_connection(self):
+        conn_class = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+        return conn_class(self._host, self._port, timeout=self.timeout)
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = self._new_connection()
+        return self._conn
+
+    def close(self):
+        """Close the underlying connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def request(self, method, path, json_body=None, headers=None):
+        """
+        Send a request and read the full response.
+
+        Args:
+            method: HTTP method
+            path: API path, e.g. "/api/Doctors"
+            json_body: Optional object serialized as the JSON request body
+            headers: Optional extra request headers
+
+        Returns:
+            ApiResponse with status, body and timings (seconds)
+        """
+        request_headers = self._headers(headers)
+        body = None
+        if json_body is not None:
+            body = json.dumps(json_body).encode("utf-8")
+            request_headers["Content-Type"] = "application/json"
+        if not self.keep_alive:
+            request_headers["Connection"] = "close"
+
+        start = time.perf_counter()
+        try:
+            conn = self._connection()
+            conn.request(method, self._prefix + path, body=body, headers=request_headers)
+            response = conn.getresponse()
+        except (http.client.HTTPException, OSError):
+            # Stale keep-alive connection - reconnect once and retry
+            self.close()
+            start = time.perf_counter()
+            conn = self._connection()
+            conn.request(method, self._prefix + path, body=body, headers=request_headers)
+            response = conn.getresponse()
+        ttfb = time.perf_counter() - start
+        data = response.read()
+        elapsed = time.perf_counter() - start
+
+        if not self.keep_alive or response.will_close:
+            self.close()
+        return ApiResponse(response.status, dict(response.getheaders()), data, ttfb, elapsed)
+
+    def _headers(self, headers=None):
+        request_headers = {"Accept": "application/json"}
+        if self.token:
+            request_headers["Authorization"] = f"Bearer {self.token}"
+        if headers:
+            request_headers.update(headers)
+        return request_headers
+
+    @contextmanager
+    def stream(self, method, path, headers=None):
+        """
+        Send a request and hand back the response before its body is read,
+        for bodies too large to hold in memory. Uses its own connection,
+        closed when the block exits.
+
+        Yields:
+            (http.client.HTTPResponse, ttfb in seconds) - read the body in chunks
+        """
+        conn = self._new_connection()
+        try:
+            start = time.perf_counter()
+            conn.request(method, self._prefix + path, headers=self._headers(headers))
+            response = conn.getresponse()
+            yield response, time.perf_counter() - start
+        finally:
+            conn.close()
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, json_body=None, **kwargs):
+        return self.request("POST", path, json_body=json_body, **kwargs)
+
+    def put(self, path, json_body=None, **kwargs):
+        return self.request("PUT", path, json_body=json_body, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def login(self, email, password):
+        """
+        Log in through /api/Auth/login and keep the returned JWT on the client.
+
+        Returns:
+            The JWT, or None if login failed
+        """
+        response = self.post("/api/Auth/login", {"email": email, "password": password})
+        if not response.ok:
+            return None
+        payload = response.json() or {}
+        self.token = payload.get("token") or (payload.get("data") or {}).get("token")
+        return self.token
+
+
+def booking_request(schedule_id, patient_name="Test Patient", email="patient@example.com", amount=2500):
+    """Body for POST /api/Booking (BookingRequestDto) with dummy payment details."""
+    return {
+        "scheduleId": schedule_id,
+        "patientName": patient_name,
+        "nic": "123456789V",
+        "email": email,
+        "contactNo": "0701234567",
+        "payment": {
+            "accountName": patient_name,
+            "accountNumber": "0001234567",
+            "bankName": "Test Bank",
+            "bankBranch": "Colombo",
+            "amount": amount,
+        },
+    }
@@ -0,0 +1,182 @@
+"""
+Shared helpers for the benchmark tests (percentiles, load generation, reports).
+"""
+import bisect
+import itertools
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from results_sink import record
+
+
+def percentile(sorted_values, pct):
+    """
+    Return the pct-th percentile (0-100) of an already sorted list using
+    linear interpolation between the closest ranks.
+    """
+    if not sorted_values:
+        return 0.0
+    if len(sorted_values) == 1:
+        return float(sorted_values[0])
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize(latencies, wall_time=None, errors=0):
+    """
+    Summarize a list of latencies (seconds).
+
+    Returns:
+        Dict with count, errors, throughput (req/s, if wall_time given) and
+        mean/p50/p90/p95/p99/max latency in milliseconds
+    """
+    values = sorted(latencies)
+    count = len(values)
+    summary = {
+        "count": count,
+        "errors": errors,
+        "throughput": (count / wall_time) if wall_time else 0.0,
+        "mean_ms": (sum(values) / count * 1000) if count else 0.0,
+    }
+    for pct in (50, 90, 95, 99):
+        summary[f"p{pct}_ms"] = percentile(values, pct) * 1000
+    summary["max_ms"] = (values[-1] * 1000) if count else 0.0
+    return summary
+
+
+def format_summary(name, summary):
+    """One-line human readable rendering of a summarize() result."""
+    return (
+        f"{name:<32} n={summary['count']:<6} err={summary['errors']:<4} "
+        f"{summary['throughput']:8.1f} req/s  "
+        f"p50={summary['p50_ms']:7.1f}ms p95={summary['p95_ms']:7.1f}ms "
+        f"p99={summary['p99_ms']:7.1f}ms max={summary['max_ms']:7.1f}ms"
+    )
+
+
+def print_report(title, rows):
+    """Print a titled block of (name, summary) rows."""
+    print("\n" + "=" * 80)
+    print(title)
+    print("=" * 80)
+    for name, summary in rows:
+        print(format_summary(name, summary))
+
+
+def linear_slope(xs, ys):
+    """Least-squares slope of ys against xs (e.g. bytes per iteration)."""
+    points = [(x, y) for x, y in zip(xs, ys) if x is not None and y is not None]
+    if len(points) < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def loglog_slope(sizes, values):
+    """
+    Least-squares slope of log(values) against log(sizes).
+
+    This is the empirical scaling exponent: ~0 means constant time, ~1 linear,
+    ~2 quadratic. Points with a non-positive size or value are ignored.
+    """
+    points = [(math.log(x), math.log(y)) for x, y in zip(sizes, values) if x > 0 and y > 0]
+    return linear_slope([x for x, _ in points], [y for _, y in points])
+
+
+class ZipfSampler:
+    """
+    Draws items with Zipf-distributed popularity: the k-th item (1-based) is
+    picked with probability proportional to 1 / k**s.
+
+    Args:
+        items: Items ordered from most to least popular
+        s: Zipf exponent (larger = more skewed towards the head)
+        seed: Optional random seed for reproducible runs
+    """
+
+    def __init__(self, items, s=1.1, seed=None):
+        if not items:
+            raise ValueError("ZipfSampler needs at least one item")
+        self.items = list(items)
+        self.s = s
+        self._random = random.Random(seed)
+        weights = [1.0 / (rank ** s) for rank in range(1, len(self.items) + 1)]
+        self._cum_weights = list(itertools.accumulate(weights))
+        self._lock = threading.Lock()
+
+    def sample(self):
+        with self._lock:
+            point = self._random.random() * self._cum_weights[-1]
+        return self.items[bisect.bisect_left(self._cum_weights, point)]
+
+    def head(self, fraction=0.1):
+        """The most popular items (at least one) - the "hot" set."""
+        return self.items[:max(1, int(len(self.items) * fraction))]
+
+
+def run_load(task, total, concurrency, client_factory, name=None):
+    """
+    Run task(client, index) `total` times spread over `concurrency` threads.
+
+    Each worker thread gets its own client from client_factory(), which is
+    closed when the run finishes. task returns a truthy value on success and
+    a falsy value (or raises) on failure; its latency is recorded either way.
+    When `name` is given every sample is also streamed to the results sink.
+
+    Returns:
+        (latencies, errors, wall_time) where latencies are seconds
+    """
+    local = threading.local()
+    clients = []
+    clients_lock = threading.Lock()
+    latencies = []
+    errors = [0]
+    results_lock = threading.Lock()
+    counter = itertools.count()
+
+    def client_for_thread():
+        if not hasattr(local, "client"):
+            local.client = client_factory()
+            with clients_lock:
+                clients.append(local.client)
+        return local.client
+
+    def worker():
+        client = client_for_thread()
+        while True:
+            index = next(counter)
+            if index >= total:
+                return
+            start = time.perf_counter()
+            try:
+                ok = task(client, index)
+            except Exception:
+                ok = False
+            elapsed = time.perf_counter() - start
+            with results_lock:
+                latencies.append(elapsed)
+                if not ok:
+                    errors[0] += 1
+            if name:
+                record("sample", name, duration=elapsed, ok=bool(ok))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker) for _ in range(concurrency)]:
+            future.result()
+    wall_time = time.perf_counter() - start
+
+    for client in clients:
+        close = getattr(client, "close", None)
+        if close:
+            close()
+    return latencies, errors[0], wall_time
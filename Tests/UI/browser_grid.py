@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Local browser grid shared by the Python (Tests/UI) and C# (SeleniumTests) suites.
+
+Both suites normally start a chromedriver and a fresh Chrome per test and run
+one test at a time. This launches a pool of chromedriver processes behind a
+small WebDriver router; any client that speaks the W3C protocol targets it as
+a remote WebDriver URL:
+
+    Python   BROWSER_GRID_URL=http://127.0.0.1:4444 pytest -n 4
+    C#       BROWSER_GRID_URL=http://127.0.0.1:4444 dotnet test
+
+The router
+  - places each new session on the least loaded chromedriver, up to
+    nodes x sessions-per-node browsers (default about one per core); further
+    session requests wait for a free slot, so both suites share the cores
+  - keeps a browser warm when its test quits it: the window is replaced by a
+    fresh tab, cookies and the storage of the reset origins are cleared and
+    timeouts are restored, and the next new-session request with identical
+    capabilities gets that browser back instead of a cold start
+  - quits warm browsers after an idle timeout, or earlier when their slot is
+    needed for different capabilities
+
+Environment variables:
+    BROWSER_GRID_NODES               chromedriver processes (default cores / 2)
+    BROWSER_GRID_SESSIONS_PER_NODE   browsers per chromedriver (default 2)
+    BROWSER_GRID_RESET_ORIGINS       origins whose storage is cleared between tests
+                                     (default "http://localhost:5173,http://localhost:4173")
+
+Usage:
+    python browser_grid.py --port 4444
+    python browser_grid.py --port 4444 --nodes 4 --sessions-per-node 1 --no-reuse
+    curl http://127.0.0.1:4444/status
+"""
+import argparse
+import http.client
+import json
+import os
+import socket
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import driver_cache
+
+
+DEFAULT_NODES = int(os.getenv("BROWSER_GRID_NODES", str(max(1, (os.cpu_count() or 2) // 2))))
+DEFAULT_SESSIONS_PER_NODE = int(os.getenv("BROWSER_GRID_SESSIONS_PER_NODE", "2"))
+RESET_ORIGINS = [
+    origin for origin in
+    os.getenv("BROWSER_GRID_RESET_ORIGINS", "http://localhost:5173,http://localhost:4173").split(",") if origin
+]
+# Storage cleared for the reset origins; the HTTP cache is kept on purpose
+CLEARED_STORAGE = "cookies,local_storage,indexeddb,websql,service_workers,cache_storage"
+DEFAULT_TIMEOUTS = {"implicit": 0, "pageLoad": 300000, "script": 30000}
+HUB_PREFIX = "/wd/hub"
+# What a dying or restarted chromedriver raises from Node.request()
+NODE_ERRORS = (OSError, http.client.HTTPException)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _error(status, error, message):
+    return status, json.dumps({"value": {"error": error, "message": message}}).encode("utf-8")
+
+
+class Node:
+    """One chromedriver process and the number of browsers it is running."""
+
+    def __init__(self, driver_path, max_sessions):
+        self.port = _free_port()
+        self.max_sessions = max_sessions
+        self.sessions = 0
+        self.process = subprocess.Popen(
+            [driver_path, f"--port={self.port}"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        self._local = threading.local()
+
+    def request(self, method, path, body=None, timeout=300):
+        """
+        Send one WebDriver command to this chromedriver (keep-alive per thread).
+
+        Returns:
+            (status, body bytes)
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=timeout)
+        headers = {"Content-Type": "application/json; charset=utf-8"} if body is not None else {}
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            return response.status, response.read()
+        except NODE_ERRORS:
+            conn.close()
+            self._local.conn = None
+            raise
+
+    def command(self, method, path, payload=None):
+        """request() with a JSON payload; returns the decoded "value" or raises on an error status."""
+        status, body = self.request(method, path, json.dumps(payload).encode("utf-8") if payload is not None else None)
+        if status >= 400:
+            raise RuntimeError(f"{method} {path}: {status} {body[:200]!r}")
+        return json.loads(body or b"{}").get("value")
+
+    def wait_ready(self, timeout=30):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                if self.command("GET", "/status").get("ready"):
+                    return
+            except (*NODE_ERRORS, RuntimeError, ValueError):
+                pass
+            time.sleep(0.1)
+        raise RuntimeError(f"chromedriver on port {self.port} did not become ready")
+
+    def stop(self):
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+class Session:
+    """A browser on a node; `response` is its new-session reply, replayed on reuse."""
+
+    def __init__(self, node, session_id, key, response):
+        self.node = node
+        self.session_id = session_id
+        self.key = key
+        self.response = response
+        self.idle_since = None
+
+
+class BrowserGrid:
+    """
+    Pool of chromedriver processes behind a WebDriver router.
+
+    Args:
+        nodes: Number of chromedriver processes
+        sessions_per_node: Browsers per chromedriver
+        host, port: Where the router listens; port 0 picks a free port
+        reuse: Keep quit browsers warm for the next identical session request
+        idle_timeout: Seconds a warm browser is kept
+        queue_timeout: Seconds a new-session request waits for a free slot
+        reset_origins: Origins whose storage is cleared before reuse
+    """
+
+    def __init__(self, nodes=DEFAULT_NODES, sessions_per_node=DEFAULT_SESSIONS_PER_NODE, host="127.0.0.1", port=0,
+                 reuse=True, idle_timeout=300, queue_timeout=300, reset_origins=None):
+        self.node_count = nodes
+        self.sessions_per_node = sessions_per_node
+        self.reuse = reuse
+        self.idle_timeout = idle_timeout
+        self.queue_timeout = queue_timeout
+        self.reset_origins = RESET_ORIGINS if reset_origins is None else reset_origins
+        self.nodes = []
+        self._busy = {}
+        self._warm = []
+        self._cond = threading.Condition()
+        self._stopping = threading.Event()
+        self.stats = {"created": 0, "reused": 0, "evicted": 0, "expired": 0, "reset_failed": 0, "queued": 0}
+
+        self._server = ThreadingHTTPServer((host, port), _RouterHandler)
+        self._server.daemon_threads = True
+        self._server.grid = self
+        self.url = f"http://{host}:{self._server.server_address[1]}"
+        self._threads = []
+
+    def start(self):
+        driver_path = driver_cache.resolve_chromedriver()["driver_path"]
+        self.nodes = [Node(driver_path, self.sessions_per_node) for _ in range(self.node_count)]
+        for node in self.nodes:
+            node.wait_ready()
+        for target, name in ((self._server.serve_forever, "grid-router"), (self._reap_idle, "grid-reaper")):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        self._stopping.set()
+        self._server.shutdown()
+        self._server.server_close()
+        with self._cond:
+            sessions = list(self._busy.values()) + self._warm
+            self._busy.clear()
+            self._warm = []
+        for session in sessions:
+            self._quit(session)
+        for node in self.nodes:
+            node.stop()
+
+    # --- slots -------------------------------------------------------------
+
+    def _free_node(self):
+        candidates = [node for node in self.nodes if node.sessions < node.max_sessions]
+        return min(candidates, key=lambda node: node.sessions) if candidates else None
+
+    def _quit(self, session):
+        try:
+            session.node.request("DELETE", f"/session/{session.session_id}")
+        except NODE_ERRORS:
+            pass
+        finally:
+            with self._cond:
+                session.node.sessions -= 1
+                self._cond.notify_all()
+
+    def new_session(self, body):
+        """
+        Hand out a warm browser with the same capabilities, or start one on
+        the least loaded node, waiting for a free slot if needed.
+
+        Returns:
+            (status, response body)
+        """
+        try:
+            key = json.dumps(json.loads(body or b"{}").get("capabilities"), sort_keys=True)
+        except ValueError:
+            return _error(400, "invalid argument", "Request body is not JSON")
+        deadline = time.monotonic() + self.queue_timeout
+        with self._cond:
+            waited = False
+            while True:
+                warm = next((s for s in self._warm if s.key == key), None)
+                if warm is not None:
+                    self._warm.remove(warm)
+                    self._busy[warm.session_id] = warm
+                    self.stats["reused"] += 1
+                    return 200, warm.response
+                node = self._free_node()
+                if node is not None:
+                    node.sessions += 1
+                    evicted = None
+                    break
+                if self._warm:
+                    # Slot held by a warm browser with other capabilities
+                    evicted = self._warm.pop(0)
+                    node = evicted.node
+                    self.stats["evicted"] += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return _error(500, "session not created", f"No free browser slot within {self.queue_timeout}s")
+                if not waited:
+                    self.stats["queued"] += 1
+                    waited = True
+                self._cond.wait(remaining)
+        if evicted is not None:
+            # The evicted browser's slot passes straight to the new session
+            try:
+                evicted.node.request("DELETE", f"/session/{evicted.session_id}")
+            except NODE_ERRORS:
+                pass
+
+        try:
+            status, response = node.request("POST", "/session", body)
+            session_id = json.loads(response)["value"]["sessionId"] if status == 200 else None
+        except (*NODE_ERRORS, ValueError, KeyError, TypeError) as e:
+            status, response, session_id = *_error(500, "session not created", str(e)), None
+        with self._cond:
+            if session_id is None:
+                node.sessions -= 1
+                self._cond.notify_all()
+            else:
+                self._busy[session_id] = Session(node, session_id, key, response)
+                self.stats["created"] += 1
+        return status, response
+
+    def session(self, session_id):
+        with self._cond:
+            return self._busy.get(session_id)
+
+    def release(self, session):
+        """Client quit `session`: reset it and keep it warm, or quit it."""
+        with self._cond:
+            if self._busy.pop(session.session_id, None) is None:
+                return
+        if not self.reuse or self._stopping.is_set():
+            self._quit(session)
+            return
+        try:
+            self._reset(session)
+        except (*NODE_ERRORS, RuntimeError, ValueError):
+            self.stats["reset_failed"] += 1
+            self._quit(session)
+            return
+        with self._cond:
+            session.idle_since = time.monotonic()
+            self._warm.append(session)
+            self._cond.notify_all()
+
+    def _reset(self, session):
+        """Leave the browser as a new session would find it (HTTP cache aside)."""
+        node, base = session.node, f"/session/{session.session_id}"
+        old_handles = node.command("GET", f"{base}/window/handles")
+        # A new tab drops sessionStorage, history and per-tab CDP state (injected
+        # scripts, request interception) along with the old windows
+        handle = node.command("POST", f"{base}/window/new", {"type": "tab"})["handle"]
+        for old_handle in old_handles:
+            node.command("POST", f"{base}/window", {"handle": old_handle})
+            node.command("DELETE", f"{base}/window")
+        node.command("POST", f"{base}/window", {"handle": handle})
+        node.command("POST", f"{base}/goog/cdp/execute", {"cmd": "Network.clearBrowserCookies", "params": {}})
+        for origin in self.reset_origins:
+            node.command("POST", f"{base}/goog/cdp/execute", {
+                "cmd": "Storage.clearDataForOrigin",
+                "params": {"origin": origin, "storageTypes": CLEARED_STORAGE},
+            })
+        node.command("POST", f"{base}/timeouts", DEFAULT_TIMEOUTS)
+        try:
+            # Drop performance log entries of the previous test (only with goog:loggingPrefs)
+            node.command("POST", f"{base}/se/log", {"type": "performance"})
+        except RuntimeError:
+            pass
+
+    def _reap_idle(self):
+        while not self._stopping.wait(5):
+            now = time.monotonic()
+            with self._cond:
+                expired = [s for s in self._warm if now - s.idle_since > self.idle_timeout]
+                self._warm = [s for s in self._warm if s not in expired]
+                self.stats["expired"] += len(expired)
+            for session in expired:
+                self._quit(session)
+
+    def status(self):
+        with self._cond:
+            return {
+                "ready": True,
+                "message": f"{len(self._busy)} busy, {len(self._warm)} warm, "
+                           f"{self.node_count * self.sessions_per_node} slots",
+                "nodes": [{"port": node.port, "sessions": node.sessions, "max": node.max_sessions}
+                          for node in self.nodes],
+                "busy": len(self._busy),
+                "warm": len(self._warm),
+                "stats": dict(self.stats),
+            }
+
+
+class _RouterHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY every
+    # command waits for the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self):
+        grid = self.server.grid
+        path = self.path[len(HUB_PREFIX):] if self.path.startswith(HUB_PREFIX) else self.path
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        parts = path.split("?")[0].strip("/").split("/")
+
+        if parts == ["status"]:
+            self._reply(200, json.dumps({"value": grid.status()}).encode("utf-8"))
+            return
+        if parts == ["session"] and self.command == "POST":
+            self._reply(*grid.new_session(body))
+            return
+        if len(parts) < 2 or parts[0] != "session":
+            self._reply(*_error(404, "unknown command", f"{self.command} {path}"))
+            return
+
+        session = grid.session(parts[1])
+        if session is None:
+            self._reply(*_error(404, "invalid session id", f"Unknown session {parts[1]}"))
+            return
+        if len(parts) == 2 and self.command == "DELETE":
+            # Answer first; resetting the browser for reuse is not the client's wait
+            self._reply(200, b'{"value":null}')
+            grid.release(session)
+            return
+        try:
+            self._reply(*session.node.request(self.command, path, body))
+        except NODE_ERRORS as e:
+            self._reply(*_error(500, "unknown error", f"chromedriver unreachable: {str(e)}"))
+
+    do_GET = do_POST = do_DELETE = _route
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local chromedriver pool behind a WebDriver router")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4444)
+    parser.add_argument("--nodes", type=int, default=DEFAULT_NODES, help="chromedriver processes")
+    parser.add_argument("--sessions-per-node", type=int, default=DEFAULT_SESSIONS_PER_NODE)
+    parser.add_argument("--no-reuse", action="store_true", help="Quit browsers instead of keeping them warm")
+    parser.add_argument("--idle-timeout", type=float, default=300, help="Seconds a warm browser is kept")
+    parser.add_argument("--reset-origin", action="append", default=None,
+                        help="Origin whose storage is cleared between tests (repeatable)")
+    args = parser.parse_args()
+
+    grid = BrowserGrid(args.nodes, args.sessions_per_node, args.host, args.port, reuse=not args.no_reuse,
+                       idle_timeout=args.idle_timeout, reset_origins=args.reset_origin).start()
+    print(f"{args.nodes} chromedriver x {args.sessions_per_node} browsers behind {grid.url} (Ctrl+C to stop)")
+    print(f"  export BROWSER_GRID_URL={grid.url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        grid.stop()
+
+
+if __name__ == "__main__":
+    main()
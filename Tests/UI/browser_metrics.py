@@ -0,0 +1,104 @@
+"""
+Browser memory and responsiveness metrics for soak tests and benchmarks.
+
+JS heap, DOM node and event listener counts come from the Chrome DevTools
+Protocol (Performance.getMetrics). Chrome process RSS is read with psutil when
+it is installed (otherwise reported as None). Long tasks are collected with a
+PerformanceObserver injected into every new document.
+"""
+_psutil = None
+
+
+def load_psutil():
+    """Import psutil on first use (it is optional and only RSS sampling needs it)."""
+    global _psutil
+    if _psutil is None:
+        try:
+            import psutil
+        except ImportError:  # optional - RSS is simply not reported without it
+            psutil = False
+        _psutil = psutil
+    return _psutil or None
+
+
+def chrome_rss_bytes(driver):
+    """
+    Total resident memory of all processes started by the local chromedriver
+    (browser, renderers, GPU process), or None if it cannot be determined.
+    """
+    psutil = load_psutil()
+    if psutil is None:
+        return None
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None) if service else None
+    if process is None:
+        return None
+    try:
+        children = psutil.Process(process.pid).children(recursive=True)
+    except psutil.Error:
+        return None
+    total = 0
+    for child in children:
+        try:
+            total += child.memory_info().rss
+        except psutil.Error:
+            # Renderer processes come and go between listing and reading
+            continue
+    return total
+
+
+def sample_browser_metrics(driver, collect_garbage=True):
+    """
+    Sample memory metrics of the current page.
+
+    Args:
+        driver: Chrome WebDriver instance
+        collect_garbage: Force a GC first so the heap reflects retained memory
+
+    Returns:
+        Dict with js_heap_used, dom_nodes, listeners and rss (bytes / counts)
+    """
+    if collect_garbage:
+        driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+    driver.execute_cdp_cmd("Performance.enable", {})
+    metrics = {
+        metric["name"]: metric["value"]
+        for metric in driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+    }
+    return {
+        "js_heap_used": metrics.get("JSHeapUsedSize"),
+        "dom_nodes": metrics.get("Nodes"),
+        "listeners": metrics.get("JSEventListeners"),
+        "rss": chrome_rss_bytes(driver),
+    }
+
+
+LONG_TASK_OBSERVER_JS = """
+window.__longTasks = [];
+try {
+  new PerformanceObserver(function (list) {
+    list.getEntries().forEach(function (entry) {
+      window.__longTasks.push({start: entry.startTime, duration: entry.duration});
+    });
+  }).observe({type: 'longtask', buffered: true});
+} catch (e) {}
+"""
+
+
+def install_long_task_observer(driver):
+    """
+    Record long tasks (main-thread work over 50ms) on every page loaded from
+    now on into window.__longTasks.
+    """
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": LONG_TASK_OBSERVER_JS})
+
+
+def collect_long_tasks(driver, reset=True):
+    """
+    Return the long tasks recorded since the page loaded (or the last reset)
+    as a list of {'start', 'duration'} dicts in milliseconds.
+    """
+    script = "var tasks = window.__longTasks || []; "
+    if reset:
+        script += "window.__longTasks = []; "
+    return driver.execute_script(script + "return tasks;")
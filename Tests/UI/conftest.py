@@ -2,41 +2,256 @@
 Pytest configuration and fixtures for Selenium UI tests.
 """
 import pytest
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import time
 
+from api_client import get_api_base_url
+import driver_cache
+import results_sink
+
+# api_cassette, frontend_server, locators, form_fill and network_budgets are
+# imported where they are used, so runs (and xdist workers) that never touch
+# them do not pay for the import
+
+
+# driver fixture -> pytest_runtest_makereport: the test's network budget check
+NETWORK_BUDGET_CHECK = pytest.StashKey()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Run the benchmark tests (marked with @pytest.mark.benchmark)",
+    )
+    parser.addoption(
+        "--soak",
+        action="store_true",
+        default=False,
+        help="Run the long-running soak tests (marked with @pytest.mark.soak)",
+    )
+    parser.addoption(
+        "--results-jsonl",
+        default=None,
+        help="Stream test, WebDriver command and benchmark results to this JSONL file (.gz to compress)",
+    )
+    parser.addoption(
+        "--network-budgets",
+        action="store_true",
+        default=False,
+        help="Check the API calls of every page a test visits against network_budgets.json",
+    )
+    parser.addoption(
+        "--record-cassette",
+        default=None,
+        help="Record every API response the frontend receives into this cassette directory",
+    )
+    parser.addoption(
+        "--replay-cassette",
+        default=None,
+        help="Serve API responses from this cassette directory instead of the backend",
+    )
+    parser.addoption(
+        "--production-frontend",
+        action="store_true",
+        default=False,
+        help="Serve the built frontend bundle in-process instead of using the Vite dev server",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: performance benchmark, only runs with --benchmark")
+    config.addinivalue_line("markers", "soak: long-running soak test, only runs with --soak")
+    if config.getoption("--record-cassette") and config.getoption("--replay-cassette"):
+        raise pytest.UsageError("--record-cassette and --replay-cassette cannot be used together")
+    # Workers appending to one bodies.bin would record offsets into each other's
+    # bytes and overwrite each other's index.json
+    if config.getoption("--record-cassette") and (
+            getattr(config.option, "numprocesses", None) or hasattr(config, "workerinput")):
+        raise pytest.UsageError("--record-cassette records from one process; run it without -n")
+    results_path = config.getoption("--results-jsonl")
+    if results_path:
+        # One file per xdist worker; concurrent appends to one file interleave
+        if hasattr(config, "workerinput"):
+            results_path = results_sink.worker_path(results_path, config.workerinput["workerid"])
+        results_sink.set_active_writer(results_sink.ResultsWriter(results_path))
+    # Resolve chromedriver once in the main process; xdist workers read the cache
+    if not hasattr(config, "workerinput") and not config.option.collectonly and not driver_cache.GRID_URL:
+        try:
+            driver_cache.resolve_chromedriver()
+        except Exception as e:
+            print(f"chromedriver preflight failed: {str(e)}")
+    # Build a missing or stale bundle once here, not in every xdist worker
+    if config.getoption("--production-frontend") and not hasattr(config, "workerinput") \
+            and not config.option.collectonly:
+        from frontend_server import ensure_bundle
+        ensure_bundle()
+
+
+def pytest_unconfigure(config):
+    writer = results_sink.active_writer()
+    if writer is not None:
+        writer.close()
+        results_sink.set_active_writer(None)
+
+
+def pytest_runtest_logreport(report):
+    """Stream one record per test (its call phase, or the phase that skipped/failed it)."""
+    if getattr(report, "node", None) is not None:
+        return  # relayed to the xdist controller; the worker already recorded it
+    if report.when == "call" or (report.when == "setup" and report.outcome != "passed"):
+        results_sink.record("test", report.nodeid, outcome=report.outcome, duration=report.duration)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Fail a passing test that exceeded its network budget (--network-budgets),
+    while its browser is still open, so the overrun is reported as that test's
+    failure and not as a teardown error.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    check = item.stash.get(NETWORK_BUDGET_CHECK, None)
+    if report.when != "call" or check is None or not report.passed:
+        return
+    violations = check()
+    if violations:
+        report.outcome = "failed"
+        report.longrepr = "Network budget exceeded:\n" + "\n".join(violations)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmark and soak tests unless their option was given."""
+    for marker in ("benchmark", "soak"):
+        if config.getoption(f"--{marker}"):
+            continue
+        skip_marked = pytest.mark.skip(reason=f"{marker} test, run with --{marker}")
+        for item in items:
+            if marker in item.keywords:
+                item.add_marker(skip_marked)
+
+
+@pytest.fixture(scope="session")
+def cassette_writer(request):
+    """CassetteWriter for --record-cassette, else None."""
+    path = request.config.getoption("--record-cassette")
+    if not path:
+        yield None
+        return
+    from api_cassette import CassetteWriter
+    writer = CassetteWriter(path)
+    yield writer
+    writer.close()
+
+
+@pytest.fixture(scope="session")
+def cassette_server(request):
+    """Running CassetteServer for --replay-cassette, else None."""
+    path = request.config.getoption("--replay-cassette")
+    if not path:
+        yield None
+        return
+    from api_cassette import CassetteServer
+    server = CassetteServer(path).start()
+    yield server
+    server.stop()
+    if server.cassette.misses:
+        print(f"\n{len(server.cassette.misses)} API calls were not in the cassette: "
+              f"{sorted(set(server.cassette.misses))}")
+
+
+@pytest.fixture(scope="session")
+def dev_frontend(request):
+    """True when pages come from the Vite dev server (StrictMode), False with --production-frontend."""
+    return not request.config.getoption("--production-frontend")
+
 
 @pytest.fixture(scope="function")
-def driver():
+def driver(request, cassette_writer, cassette_server, dev_frontend):
     """
     Create and return a Chrome WebDriver instance.
     Automatically cleanup after test.
+    With --network-budgets, every page the test visits is checked against
+    its request and payload budget when the test body finishes (see
+    pytest_runtest_makereport). With --record-cassette or
+    --replay-cassette the API responses are recorded or served from the
+    cassette (see api_cassette.py).
     """
     chrome_options = Options()
     # Uncomment the line below to run headless (without UI)
     # chrome_options.add_argument("--headless")
     chrome_options.add_argument("--disable-blink-features=AutomationControlled")
     chrome_options.add_argument("user-agent=Mozilla/5.0")
+    if cassette_writer is not None:
+        from api_cassette import enable_performance_log
+        enable_performance_log(chrome_options)
     
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = driver_cache.create_chrome(chrome_options)
     driver.implicitly_wait(10)
+    if results_sink.active_writer() is not None:
+        results_sink.instrument_driver(driver)
+    if cassette_server is not None:
+        from api_cassette import install_replay
+        install_replay(driver, cassette_server.url)
+    cassette_recorder = None
+    if cassette_writer is not None:
+        from api_cassette import CassetteRecorder
+        cassette_recorder = CassetteRecorder(driver, cassette_writer)
+    if request.config.getoption("--network-budgets"):
+        from network_budgets import NetworkRecorder, check_budgets
+        recorder = NetworkRecorder(driver)
+        request.node.stash[NETWORK_BUDGET_CHECK] = lambda: check_budgets(recorder.finish(), dev_server=dev_frontend)
     
     yield driver
     
+    if cassette_recorder is not None:
+        cassette_recorder.finish()
     driver.quit()
 
 
+@pytest.fixture(scope="session")
+def frontend_server(request, cassette_server):
+    """
+    In-process server for the production bundle (--production-frontend),
+    proxying /api to the backend or the replayed cassette; else None.
+    """
+    if not request.config.getoption("--production-frontend"):
+        yield None
+        return
+    from frontend_server import FrontendServer, ensure_bundle
+    api_url = cassette_server.url if cassette_server is not None else get_api_base_url()
+    # pytest_configure already built it; FRONTEND_REBUILD must not rebuild again per worker
+    server = FrontendServer(ensure_bundle(rebuild=False), api_url).start()
+    yield server
+    server.stop()
+
+
 @pytest.fixture
-def base_url():
+def base_url(frontend_server):
     """Base URL for the frontend application."""
+    if frontend_server is not None:
+        return frontend_server.url
     return "http://localhost:5173"
 
 
+@pytest.fixture
+def api_base_url():
+    """Base URL for the backend API (API_BASE_URL env var, default http://localhost:5001)."""
+    return get_api_base_url()
+
+
+@pytest.fixture
+def locate(driver):
+    """LocatorResolver for the test's driver (ranked strategies, cached winners)."""
+    from locators import LocatorResolver
+    return LocatorResolver(driver)
+
+
 @pytest.fixture
 def wait(driver):
     """WebDriverWait instance for explicit waits."""
@@ -66,7 +281,7 @@ def wait_for_element_clickable(driver, locator, timeout=10):
     return wait.until(EC.element_to_be_clickable(locator))
 
 
-def login_user(driver, base_url, test_user):
+def login_user(driver, base_url, test_user, realistic=None):
     """
     Helper function to log in a user before accessing protected routes.
     
@@ -74,10 +289,13 @@ def login_user(driver, base_url, test_user):
         driver: Selenium WebDriver instance
         base_url: Base URL of the application
         test_user: Dictionary with 'email' and 'password' keys
+        realistic: Type the credentials with send_keys instead of one script call
     
     Returns:
         True if login successful, False otherwise
     """
+    from form_fill import fill_form
+
     try:
         driver.get(f"{base_url}/login")
         time.sleep(2)
@@ -88,10 +306,10 @@ def login_user(driver, base_url, test_user):
         )
         password_input = driver.find_element(By.XPATH, "//input[@type='password']")
         
-        email_input.clear()
-        email_input.send_keys(test_user['email'])
-        password_input.clear()
-        password_input.send_keys(test_user['password'])
+        fill_form(driver, [
+            (email_input, test_user['email']),
+            (password_input, test_user['password']),
+        ], realistic=realistic)
         
         # Click login button
         login_button = driver.find_element(By.XPATH, "//button[contains(text(), 'Sign In')]")
@@ -0,0 +1,142 @@
+"""
+Resolve the chromedriver binary once per machine and reuse it.
+
+webdriver.Chrome() without a driver path runs Selenium Manager, which
+spawns a helper binary (and may go to the network) on every call - about a
+second per browser. The first resolution is stored in a small JSON cache;
+later runs, and every xdist worker, read it back and pass the path to
+Service() directly. If Chrome was updated past the cached driver, session
+creation fails once, the cache is refreshed and the browser is retried.
+
+With BROWSER_GRID_URL set, create_chrome() asks that WebDriver endpoint
+(browser_grid.py) for the browser instead and nothing is resolved locally.
+
+Environment variables:
+    CHROMEDRIVER_PATH    use this driver and skip resolution entirely
+    CHROMEDRIVER_CACHE   cache file (default ~/.cache/medisync-ui-tests/chromedriver.json)
+    BROWSER_GRID_URL     remote WebDriver URL, e.g. http://127.0.0.1:4444
+"""
+import functools
+import json
+import os
+import sys
+
+try:
+    import fcntl
+except ImportError:  # Windows: workers may resolve concurrently, writes stay atomic
+    fcntl = None
+
+
+CACHE_PATH = os.getenv(
+    "CHROMEDRIVER_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "medisync-ui-tests", "chromedriver.json"),
+)
+GRID_URL = os.getenv("BROWSER_GRID_URL")
+
+
+def _read_cache(path):
+    try:
+        with open(path, encoding="utf-8") as cache_file:
+            entry = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+    if not os.path.isfile(entry.get("driver_path") or ""):
+        return None
+    return entry
+
+
+def _write_cache(path, entry):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as cache_file:
+        json.dump(entry, cache_file, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _run_selenium_manager():
+    """Ask Selenium Manager for the driver (and browser) paths - the slow call we cache."""
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.selenium_manager import SeleniumManager
+
+    options = Options()
+    driver_path = SeleniumManager().driver_location(options)
+    return {"driver_path": driver_path, "browser_path": options.binary_location or None}
+
+
+def resolve_chromedriver(refresh=False, cache_path=CACHE_PATH):
+    """
+    Return {'driver_path', 'browser_path'} for Chrome, running Selenium
+    Manager only when the cache is missing, stale or `refresh` is set.
+    """
+    if os.getenv("CHROMEDRIVER_PATH"):
+        return {"driver_path": os.environ["CHROMEDRIVER_PATH"], "browser_path": None}
+    if not refresh:
+        entry = _read_cache(cache_path)
+        if entry is not None:
+            return entry
+
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    with open(cache_path + ".lock", "w") as lock_file:
+        # Only one process resolves; the others wait and read its result
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        entry = None if refresh else _read_cache(cache_path)
+        if entry is None:
+            entry = _run_selenium_manager()
+            _write_cache(cache_path, entry)
+    return entry
+
+
+@functools.lru_cache(maxsize=None)
+def _remote_chrome_class():
+    """Remote WebDriver with the Chrome-only execute_cdp_cmd() the cassette code relies on."""
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+    class RemoteChrome(WebDriver):
+        def execute_cdp_cmd(self, cmd, cmd_args):
+            return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+    return RemoteChrome
+
+
+def create_remote_chrome(options, grid_url=None):
+    """A Chrome session on the browser grid at `grid_url` (default BROWSER_GRID_URL)."""
+    from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+
+    connection = ChromiumRemoteConnection(
+        grid_url or GRID_URL, vendor_prefix="goog", browser_name="chrome", keep_alive=True,
+    )
+    return _remote_chrome_class()(command_executor=connection, options=options)
+
+
+def create_chrome(options):
+    """webdriver.Chrome(options) using the cached driver instead of a per-call lookup."""
+    if GRID_URL:
+        return create_remote_chrome(options)
+
+    from selenium import webdriver
+    from selenium.common.exceptions import SessionNotCreatedException
+    from selenium.webdriver.chrome.service import Service
+
+    entry = resolve_chromedriver()
+    requested_binary = options.binary_location
+    for attempt in range(2):
+        options.binary_location = requested_binary or entry["browser_path"] or ""
+        try:
+            return webdriver.Chrome(options=options, service=Service(executable_path=entry["driver_path"]))
+        except SessionNotCreatedException:
+            if attempt or os.getenv("CHROMEDRIVER_PATH"):
+                raise
+            # Chrome was probably updated past the cached driver
+            entry = resolve_chromedriver(refresh=True)
+
+
+def main():
+    """Preflight: resolve (or refresh with --refresh) and print the cached driver."""
+    entry = resolve_chromedriver(refresh="--refresh" in sys.argv)
+    print(f"chromedriver: {entry['driver_path']}")
+    print(f"chrome:       {entry['browser_path'] or '(system default)'}")
+    print(f"cache:        {CACHE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
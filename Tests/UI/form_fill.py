@@ -0,0 +1,82 @@
+"""
+Fill React-controlled forms in one WebDriver call.
+
+clear() + send_keys() costs a few round-trips per field and one synthetic key
+event per character, and clear() alone does not reach React's onChange. The
+fast path sets every field of a form in a single script: the value goes
+through the native HTMLInputElement/HTMLSelectElement/HTMLTextAreaElement
+setter (React's own setter would swallow the change) and input, change and
+blur events are dispatched, so controlled components update their state as
+if the user had typed.
+
+Pass realistic=True (or set FORM_FILL_REALISTIC=1 for a whole run) where a
+test really needs key events - key handlers, input masks, autocomplete.
+
+Usage:
+    values = fill_form(driver, [
+        ((By.XPATH, "//input[@type='email']"), "user@example.com"),
+        (password_element, "secret"),
+    ])
+"""
+import os
+import sys
+
+from selenium.webdriver.common.keys import Keys
+
+
+REALISTIC = os.getenv("FORM_FILL_REALISTIC", "0") == "1"
+# Select-all modifier for the local browser (Ctrl+A does not select all on macOS)
+SELECT_ALL_MODIFIER = Keys.COMMAND if sys.platform == "darwin" else Keys.CONTROL
+
+FILL_SCRIPT = """
+const values = [];
+for (const [element, value] of arguments[0]) {
+    const prototype = element instanceof HTMLSelectElement ? HTMLSelectElement.prototype
+        : element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    element.focus();
+    Object.getOwnPropertyDescriptor(prototype, 'value').set.call(element, value);
+    element.dispatchEvent(new Event('input', {bubbles: true}));
+    element.dispatchEvent(new Event('change', {bubbles: true}));
+    element.blur();
+    values.push(element.value);
+}
+return values;
+"""
+
+
+def fill_form(driver, fields, realistic=None):
+    """
+    Set several form fields at once.
+
+    Args:
+        driver: WebDriver
+        fields: (field, value) pairs; field is a WebElement or a (By, selector) locator
+        realistic: Type with send_keys instead (default FORM_FILL_REALISTIC)
+
+    Returns:
+        The fields' values after filling, in order (React may reformat or reject a value)
+    """
+    if realistic is None:
+        realistic = REALISTIC
+    pairs = [
+        (driver.find_element(*field) if isinstance(field, tuple) else field, str(value))
+        for field, value in fields
+    ]
+    if not realistic:
+        return driver.execute_script(FILL_SCRIPT, pairs)
+    for element, value in pairs:
+        # clear() does not fire React's onChange, so select and delete with keys;
+        # the backspace also empties the field when `value` is ""
+        element.send_keys(SELECT_ALL_MODIFIER, "a")
+        element.send_keys(Keys.BACKSPACE)
+        if value:
+            element.send_keys(value)
+    return [element.get_attribute("value") for element, _ in pairs]
+
+
+def set_react_value(driver, element, value):
+    """
+    Set a single React-controlled input, select or textarea in one script call.
+    Needed for date/time inputs, whose typed format depends on the locale.
+    """
+    fill_form(driver, [(element, value)], realistic=False)
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Serve the production frontend bundle in-process for UI tests.
+
+The Vite dev server compiles modules on demand, so the first load of every
+page measures compile time rather than the app. This server serves the built
+bundle (Frontend/medisync/dist, built with `npm run build` if missing or
+older than the frontend sources) instead:
+
+  - every file is loaded and gzip-compressed once at start-up, responses are
+    plain memory copies
+  - hashed files under /assets/ get "Cache-Control: immutable, max-age=1y";
+    index.html is always revalidated
+  - unknown paths fall back to index.html (client-side routes)
+  - /api/* is proxied to the backend (or a cassette server), and index.html
+    points the app's API_BASE at this server so calls stay same-origin
+
+Environment variables:
+    FRONTEND_DIST    built bundle to serve (default ../../Frontend/medisync/dist)
+    FRONTEND_BUILD   set to 0 to fail instead of running npm run build
+    FRONTEND_REBUILD set to 1 to rebuild even if the bundle looks current
+
+Usage:
+    pytest --production-frontend
+    python frontend_server.py --port 4173
+"""
+import argparse
+import gzip
+import http.client
+import mimetypes
+import os
+import shutil
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from api_client import get_api_base_url
+
+try:
+    import fcntl
+except ImportError:  # Windows: workers may build concurrently
+    fcntl = None
+
+
+FRONTEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "Frontend", "medisync"))
+DIST_DIR = os.getenv("FRONTEND_DIST", os.path.join(FRONTEND_DIR, "dist"))
+ALLOW_BUILD = os.getenv("FRONTEND_BUILD", "1") == "1"
+FORCE_REBUILD = os.getenv("FRONTEND_REBUILD", "0") == "1"
+BUILD_LOCK = os.path.join(os.path.expanduser("~"), ".cache", "medisync-ui-tests", "frontend-build.lock")
+# What goes into the bundle; newer than dist/index.html means the bundle is stale
+BUILD_INPUTS = ("src", "public", "index.html", "package.json", "package-lock.json", "vite.config.js")
+
+COMPRESSIBLE = (".html", ".js", ".mjs", ".css", ".svg", ".json", ".txt", ".map", ".ico")
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+# Runs before the bundle; a value set by the test (e.g. cassette replay) wins
+API_BASE_SCRIPT = b"<script>window.__API_BASE = window.__API_BASE || window.location.origin;</script>"
+HOP_BY_HOP = {"connection", "keep-alive", "transfer-encoding", "te", "trailer", "upgrade",
+              "proxy-authorization", "proxy-authenticate", "host"}
+
+
+def _newest_source_mtime(frontend_dir=FRONTEND_DIR):
+    newest = 0.0
+    for name in BUILD_INPUTS:
+        path = os.path.join(frontend_dir, name)
+        if os.path.isfile(path):
+            newest = max(newest, os.path.getmtime(path))
+        for directory, _, filenames in os.walk(path):
+            for filename in filenames:
+                newest = max(newest, os.path.getmtime(os.path.join(directory, filename)))
+    return newest
+
+
+def bundle_status(dist_dir=DIST_DIR):
+    """
+    "missing", "stale" or "current". Only the default dist directory is
+    compared with the sources; a FRONTEND_DIST build is taken as it is.
+    """
+    index_path = os.path.join(dist_dir, "index.html")
+    if not os.path.isfile(index_path):
+        return "missing"
+    if os.path.abspath(dist_dir) == os.path.join(FRONTEND_DIR, "dist"):
+        if os.path.getmtime(index_path) < _newest_source_mtime():
+            return "stale"
+    return "current"
+
+
+def ensure_bundle(dist_dir=DIST_DIR, allow_build=ALLOW_BUILD, rebuild=FORCE_REBUILD):
+    """
+    Return the bundle directory, running `npm run build` first if there is
+    no index.html yet, the sources changed since the build or `rebuild` is
+    set. Parallel workers build once: the first takes a file lock and builds,
+    the others wait for it and find a current bundle.
+    """
+    status = bundle_status(dist_dir)
+    if status == "current" and not rebuild:
+        return dist_dir
+    npm = shutil.which("npm")
+    if not allow_build or npm is None:
+        reason = "rebuild requested" if status == "current" else status
+        raise RuntimeError(f"Frontend bundle at {dist_dir}: {reason} (run npm run build in {FRONTEND_DIR})")
+
+    started = time.time()
+    os.makedirs(os.path.dirname(BUILD_LOCK), exist_ok=True)
+    with open(BUILD_LOCK, "w") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        # Another worker may have built while we waited for the lock
+        index_path = os.path.join(dist_dir, "index.html")
+        if bundle_status(dist_dir) == "current" and (not rebuild or os.path.getmtime(index_path) >= started):
+            return dist_dir
+        if not os.path.isdir(os.path.join(FRONTEND_DIR, "node_modules")):
+            subprocess.run([npm, "ci"], cwd=FRONTEND_DIR, check=True)
+        # An empty VITE_API_BASE keeps API_BASE overridable through window.__API_BASE
+        subprocess.run([npm, "run", "build"], cwd=FRONTEND_DIR, check=True, env={**os.environ, "VITE_API_BASE": ""})
+    return dist_dir
+
+
+class StaticAsset:
+    """One file of the bundle, held in memory with its gzip version."""
+
+    def __init__(self, body, content_type, cache_control, compress):
+        self.body = body
+        self.content_type = content_type
+        self.cache_control = cache_control
+        self.gzipped = None
+        if compress:
+            compressed = gzip.compress(body, compresslevel=9)
+            if len(compressed) < len(body):
+                self.gzipped = compressed
+
+
+def load_bundle(dist_dir):
+    """Map URL path -> StaticAsset for every file of the bundle."""
+    assets = {}
+    for directory, _, filenames in os.walk(dist_dir):
+        for filename in filenames:
+            full_path = os.path.join(directory, filename)
+            url_path = "/" + os.path.relpath(full_path, dist_dir).replace(os.sep, "/")
+            with open(full_path, "rb") as asset_file:
+                body = asset_file.read()
+            if url_path == "/index.html":
+                body = body.replace(b"<head>", b"<head>" + API_BASE_SCRIPT, 1)
+            content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+            cache_control = IMMUTABLE if url_path.startswith("/assets/") else REVALIDATE
+            assets[url_path] = StaticAsset(body, content_type, cache_control, filename.endswith(COMPRESSIBLE))
+    return assets
+
+
+class _FrontendHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _proxy(self):
+        upstream = urlsplit(self.server.api_url)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        headers = {name: value for name, value in self.headers.items() if name.lower() not in HOP_BY_HOP}
+        connection_class = http.client.HTTPSConnection if upstream.scheme == "https" else http.client.HTTPConnection
+        connection = connection_class(upstream.netloc, timeout=60)
+        try:
+            connection.request(self.command, self.path, body=body, headers=headers)
+            response = connection.getresponse()
+            payload = response.read()
+        except OSError as e:
+            self.send_error(502, f"API upstream {self.server.api_url} unreachable: {str(e)}")
+            return
+        finally:
+            connection.close()
+        self.send_response(response.status)
+        for name, value in response.getheaders():
+            if name.lower() not in HOP_BY_HOP and name.lower() != "content-length":
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _static(self, head=False):
+        path = urlsplit(self.path).path
+        asset = self.server.assets.get(path)
+        if asset is None:
+            if path.startswith("/assets/") or os.path.splitext(path)[1]:
+                self.send_error(404)
+                return
+            asset = self.server.assets["/index.html"]
+        use_gzip = asset.gzipped is not None and "gzip" in self.headers.get("Accept-Encoding", "")
+        body = asset.gzipped if use_gzip else asset.body
+        self.send_response(200)
+        self.send_header("Content-Type", asset.content_type)
+        self.send_header("Cache-Control", asset.cache_control)
+        if asset.gzipped is not None:
+            self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def _route(self):
+        if urlsplit(self.path).path.lower().startswith("/api/"):
+            self._proxy()
+        elif self.command in ("GET", "HEAD"):
+            self._static(head=self.command == "HEAD")
+        else:
+            self.send_error(405)
+
+    do_GET = do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = do_OPTIONS = _route
+
+
+class FrontendServer:
+    """
+    In-process server for the production bundle.
+
+    Args:
+        dist_dir: Built bundle (see ensure_bundle)
+        api_url: Where /api is proxied (default API_BASE_URL)
+        host, port: Where to listen; port 0 picks a free port
+    """
+
+    def __init__(self, dist_dir=DIST_DIR, api_url=None, host="127.0.0.1", port=0):
+        self._server = ThreadingHTTPServer((host, port), _FrontendHandler)
+        self._server.daemon_threads = True
+        self._server.assets = load_bundle(dist_dir)
+        self.api_url = self._server.api_url = api_url or get_api_base_url()
+        self.url = f"http://{host}:{self._server.server_address[1]}"
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="frontend-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve in the calling thread (for the command line)."""
+        self._server.serve_forever()
+
+    def stop(self):
+        if self._thread is not None:
+            self._server.shutdown()
+        self._server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the production frontend bundle with /api proxied")
+    parser.add_argument("--dist", default=DIST_DIR, help="Built bundle directory")
+    parser.add_argument("--api-url", default=None, help="Backend URL (default API_BASE_URL)")
+    parser.add_argument("--port", type=int, default=4173)
+    args = parser.parse_args()
+
+    server = FrontendServer(ensure_bundle(args.dist), args.api_url, port=args.port)
+    print(f"Serving {args.dist} on {server.url}, /api -> {server.api_url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Import-time profile of the UI test package.
+
+Imports conftest and every test module in a fresh interpreter with
+`python -X importtime` (what each xdist worker pays before running a test)
+and prints the slowest imports, cumulative and self time.
+
+Run with:
+    python import_profile.py
+    python import_profile.py --modules conftest test_authentication --top 30
+"""
+import argparse
+import glob
+import os
+import subprocess
+import sys
+import time
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def default_modules():
+    tests = sorted(os.path.splitext(os.path.basename(path))[0] for path in glob.glob(os.path.join(HERE, "test_*.py")))
+    return ["conftest"] + tests
+
+
+def parse_importtime(stderr):
+    """
+    Parse `-X importtime` output.
+
+    Returns:
+        List of (module, self_us, cumulative_us, depth) in import order
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def profile_imports(modules):
+    """Import `modules` in a fresh interpreter; returns (parsed rows, wall seconds)."""
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + ", ".join(modules)],
+        cwd=HERE, capture_output=True, text=True,
+    )
+    wall_time = time.perf_counter() - started
+    if completed.returncode:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    return parse_importtime(completed.stderr), wall_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile import time of the UI test modules")
+    parser.add_argument("--modules", nargs="+", default=None, help="Modules to import (default conftest + test_*)")
+    parser.add_argument("--top", type=int, default=20, help="Rows per table")
+    args = parser.parse_args()
+
+    modules = args.modules or default_modules()
+    rows, wall_time = profile_imports(modules)
+    total_us = sum(cumulative for _, _, cumulative, depth in rows if depth == 0)
+
+    print(f"Imported {len(modules)} modules ({len(rows)} imports) in {total_us / 1000:.1f}ms "
+          f"(interpreter wall time {wall_time * 1000:.0f}ms)")
+
+    print("\nSlowest top-level imports (cumulative):")
+    top_level = sorted((r for r in rows if r[3] == 0), key=lambda r: r[2], reverse=True)
+    for name, _, cumulative, _ in top_level[:args.top]:
+        print(f"  {cumulative / 1000:8.1f}ms  {name}")
+
+    print("\nSlowest modules (self time):")
+    for name, self_us, _, _ in sorted(rows, key=lambda r: r[1], reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:8.1f}ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,16 @@ UI Inspector Tool - Helps identify correct selectors for your frontend.
 Run this to inspect actual HTML elements and their selectors.
 """
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
+import argparse
 import time
 import json
 
+import results_sink
+from driver_cache import create_chrome
+from locators import class_token
+
 
 def inspect_page(url, element_descriptions):
     """
@@ -27,7 +31,9 @@ def inspect_page(url, element_descriptions):
     # chrome_options.add_argument("--headless")
     chrome_options.add_argument("--disable-blink-features=AutomationControlled")
     
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = create_chrome(chrome_options)
+    if results_sink.active_writer() is not None:
+        results_sink.instrument_driver(driver)
     driver.get(url)
     time.sleep(2)
     
@@ -127,6 +133,10 @@ def inspect_page(url, element_descriptions):
             print(f"  ❌ Element '{name}' not found")
         
         results[name] = element_info
+        results_sink.record(
+            "inspect", name, url=url, found=element_info['found'],
+            elements=element_info['elements'],
+        )
     
     driver.quit()
     print("\n" + "=" * 80)
@@ -135,6 +145,11 @@ def inspect_page(url, element_descriptions):
 
 def main():
     """Run inspections on all major pages."""
+    parser = argparse.ArgumentParser(description="Inspect MediSync pages for Selenium selectors")
+    parser.add_argument("--results", help="Stream results to this JSONL file (.gz to compress)")
+    args = parser.parse_args()
+    if args.results:
+        results_sink.set_active_writer(results_sink.ResultsWriter(args.results))
     
     # Define what elements to look for on each page
     pages = [
@@ -163,7 +178,7 @@ def main():
             'name': 'Patient Dashboard',
             'elements': [
                 {'name': 'Search Input', 'xpath': "//input[@placeholder='Search doctors'] | //input[@type='search']"},
-                {'name': 'Doctor Card', 'xpath': "//div[@class='doctor-card'] | //div[@class='doctor-item']"},
+                {'name': 'Doctor Card', 'xpath': f"//div[{class_token('doctor-card')}] | //div[{class_token('doctor-item')}]"},
                 {'name': 'Filter Button', 'xpath': "//button[contains(text(), 'Filter')] | //button[contains(text(), 'Specialization')]"},
                 {'name': 'Book Button', 'xpath': "//button[contains(text(), 'Book')]"},
             ]
@@ -199,6 +214,10 @@ def main():
         except Exception as e:
             print(f"\n❌ Error inspecting {page['url']}: {str(e)}")
             print("   Make sure the frontend is running at http://localhost:5173")
+    
+    if results_sink.active_writer() is not None:
+        results_sink.active_writer().close()
+        results_sink.set_active_writer(None)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Ranked locators that remember the fastest working strategy per page.
+
+Exact-class XPaths such as //div[@class='card'] stop matching as soon as an
+element gets a second class, and every miss then costs the driver's 10s
+implicit wait before the test skips. Here a logical element is described by
+a ranked list of strategies instead:
+
+    testid   [data-testid="..."]
+    role     ARIA role (explicit or implicit) + accessible name, e.g. ("button", "Book Now")
+    css      CSS selector
+    xpath    XPath expression
+
+LocatorResolver evaluates the strategies inside the page, one script call
+per poll, so a strategy that does not match costs microseconds rather than
+an implicit wait. testid, role and css also search open shadow roots.
+
+The first time an element is found on a page every strategy is timed, and
+the fastest one that matched (the same number of elements as the best
+ranked match) is stored in the cache file under the page path ("/book/{id}")
+and element name, with that number of elements. Later lookups - in this and
+every later run - try it alone first and fall back to the full ranking when
+it stops matching or matches a different number of elements.
+
+Environment variables:
+    LOCATOR_CACHE   cache file (default ~/.cache/medisync-ui-tests/locators.json)
+
+Usage:
+    resolver = LocatorResolver(driver)
+    cards = resolver.find_all("doctor_card")
+    resolver.find("book_now", clickable=True).click()
+    python locators.py            # print the cached winners
+"""
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError:  # Windows: concurrent writers may drop an entry, writes stay atomic
+    fcntl = None
+
+from network_capture import normalize_path
+import results_sink
+
+
+CACHE_PATH = os.getenv(
+    "LOCATOR_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "medisync-ui-tests", "locators.json"),
+)
+
+def class_token(name):
+    """XPath predicate matching `name` as a whole class token, unlike @class='name'
+    which breaks when a class is added."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+CARD_CLASS = class_token("card")
+
+LOCATORS = {
+    "doctor_search_input": [
+        ("testid", "doctor-search-input"),
+        ("role", ("textbox", "Search doctors...")),
+        ("css", "input[placeholder='Search doctors...']"),
+        ("xpath", "//input[@placeholder='Search doctors...']"),
+    ],
+    "doctor_search_button": [
+        ("testid", "doctor-search-button"),
+        ("role", ("button", "Search")),
+        ("xpath", "//button[normalize-space()='Search']"),
+    ],
+    "doctor_card": [
+        ("testid", "doctor-card"),
+        ("css", "div.card:has(> .card-body > button.btn-primary)"),
+        ("xpath", f"//div[{CARD_CLASS}][.//button[contains(text(), 'Book Now')]]"),
+    ],
+    "book_now": [
+        ("testid", "book-now"),
+        ("role", ("button", "Book Now")),
+        ("xpath", "//button[contains(text(), 'Book Now')]"),
+    ],
+    "slot_card": [
+        ("testid", "slot-card"),
+        ("css", "div.slot-card"),
+        ("xpath", "//div[contains(@class, 'slot-card')]"),
+    ],
+    "slot_book": [
+        ("testid", "slot-book"),
+        ("css", "div.slot-card .slot-actions button"),
+        ("xpath", "//div[contains(@class, 'slot-card')]//button"),
+    ],
+    "appointment_card": [
+        ("testid", "appointment-card"),
+        ("css", ".appointment-card, .appointment-item"),
+        ("xpath", "//div[contains(@class, 'appointment-card') or contains(@class, 'appointment-item')]"),
+    ],
+    "appointment_details": [
+        ("css", "div.details, div.appointment-details"),
+        ("xpath", f"//div[{class_token('details')} or {class_token('appointment-details')}]"),
+    ],
+    "cancel_appointment": [
+        # Scoped to the appointment card: a bare 'Cancel' also matches modal and form buttons
+        ("testid", "appointment-cancel"),
+        ("css", ".appointment-card .appointment-cancel-btn, .appointment-card .cancel-btn"),
+        ("xpath", f"//div[{class_token('appointment-card')}]//button[contains(text(), 'Cancel')]"),
+    ],
+    "confirm_cancel": [
+        ("xpath", f"//button[contains(text(), 'Confirm')] | //button[{class_token('confirm-cancel')}]"),
+        ("css", "button.confirm-cancel"),
+    ],
+    "date_picker": [
+        ("css", "input[type='date'], button.date-picker"),
+        ("xpath", f"//input[@type='date'] | //button[{class_token('date-picker')}]"),
+    ],
+    "date_available": [
+        ("css", "button.date-available"),
+        ("xpath", f"//button[{class_token('date-available')}]"),
+    ],
+    "time_slot": [
+        ("css", "button.time-slot, div.time-slot-available"),
+        ("xpath", f"//button[{class_token('time-slot')}] | //div[{class_token('time-slot-available')}]"),
+    ],
+    "profile_email": [
+        ("xpath", f"//*[contains(text(), '@')] | //span[{class_token('email')}]"),
+        ("css", "span.email"),
+    ],
+    "edit_profile": [
+        ("testid", "profile-edit"),
+        ("role", ("button", "Edit Profile")),
+        ("xpath", "//button[normalize-space()='Edit Profile']"),
+    ],
+    "save_profile": [
+        ("testid", "profile-save"),
+        ("xpath", "//form//button[@type='submit'][normalize-space()='Save']"),
+    ],
+    "password_section": [
+        ("xpath", f"//button[contains(text(), 'Change Password')] | //*[{class_token('password-section')}]"),
+        ("css", ".password-section"),
+    ],
+}
+
+# Runs every strategy in order inside the page. Returns per-strategy timings
+# (count -1 = not evaluated) and the elements of the first match, or of every
+# match when probing.
+RESOLVE_SCRIPT = """
+const [strategies, probe, filter] = arguments;
+// Collected before any timer starts, so the DOM walk is not charged to
+// whichever of testid/role/css happens to run first
+const roots = [document];
+for (let i = 0; i < roots.length; i++) {
+    for (const el of roots[i].querySelectorAll('*')) {
+        if (el.shadowRoot) roots.push(el.shadowRoot);
+    }
+}
+function deepQuery(selector) {
+    const found = [];
+    for (const root of roots) found.push(...root.querySelectorAll(selector));
+    return found;
+}
+const IMPLICIT_ROLES = {
+    button: 'button, input[type=button], input[type=submit], input[type=reset]',
+    link: 'a[href]',
+    textbox: 'input:not([type]), input[type=text], input[type=email], input[type=password], '
+        + 'input[type=search], input[type=tel], input[type=url], textarea',
+    heading: 'h1, h2, h3, h4, h5, h6',
+    combobox: 'select',
+    checkbox: 'input[type=checkbox]',
+};
+function accessibleName(el) {
+    const label = el.getAttribute('aria-label');
+    if (label) return label;
+    if (el.labels && el.labels.length) return el.labels[0].textContent;
+    return el.getAttribute('placeholder') || el.textContent || '';
+}
+function byRole(role, name) {
+    const selector = `[role="${role}"]` + (IMPLICIT_ROLES[role] ? ', ' + IMPLICIT_ROLES[role] : '');
+    const wanted = name.replace(/\\s+/g, ' ').trim();
+    return deepQuery(selector).filter(el => accessibleName(el).replace(/\\s+/g, ' ').trim() === wanted);
+}
+function byXPath(expression) {
+    const snapshot = document.evaluate(expression, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const found = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) found.push(snapshot.snapshotItem(i));
+    return found;
+}
+function evaluate(kind, value) {
+    if (kind === 'testid') return deepQuery(`[data-testid="${value}"]`);
+    if (kind === 'role') return byRole(value[0], value[1]);
+    if (kind === 'css') return deepQuery(value);
+    return byXPath(value);
+}
+function usable(el) {
+    if (filter === 'present') return true;
+    const visible = el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+    return filter === 'visible' ? visible : visible && !el.disabled;
+}
+const timings = [];
+const matches = [];
+for (const [kind, value] of strategies) {
+    const start = performance.now();
+    let found;
+    try {
+        found = evaluate(kind, value).filter(usable);
+    } catch (e) {
+        found = [];
+    }
+    timings.push({ms: performance.now() - start, count: found.length});
+    matches.push(found.length ? found : null);
+    if (found.length && !probe) break;
+}
+while (timings.length < strategies.length) timings.push({ms: 0, count: -1});
+return {timings, matches};
+"""
+
+
+def strategy_label(strategy):
+    """Human readable "kind:value" of a strategy (cache and report key)."""
+    kind, value = strategy
+    if kind == "role":
+        return f"role:{value[0]}|{value[1]}"
+    return f"{kind}:{value}"
+
+
+_caches = {}
+_cache_lock = threading.Lock()
+
+
+def _read_cache(path):
+    try:
+        with open(path, encoding="utf-8") as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def load_cache(path=CACHE_PATH):
+    """Page -> element -> {'strategy', 'ms', 'count'} cache, read once per process."""
+    with _cache_lock:
+        if path not in _caches:
+            _caches[path] = _read_cache(path)
+        return _caches[path]
+
+
+def store_winner(page, name, label, ms, count, path=CACHE_PATH):
+    """
+    Remember `label` as the fastest strategy for `name` on `page`, with the
+    number of elements it agreed on, merged into the file.
+    """
+    entry = {"strategy": label, "ms": round(ms, 3), "count": count}
+    cache = load_cache(path)
+    with _cache_lock:
+        cache.setdefault(page, {})[name] = entry
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".lock", "w") as lock_file:
+            # xdist workers update the same file; re-read so their entries survive
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            merged = _read_cache(path)
+            merged.setdefault(page, {})[name] = entry
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as cache_file:
+                json.dump(merged, cache_file, indent=1, sort_keys=True)
+            os.replace(tmp_path, path)
+
+
+class LocatorResolver:
+    """
+    Find logical elements (keys of LOCATORS) through their ranked strategies.
+
+    Args:
+        driver: WebDriver on the page to search
+        locators: Element name -> ranked strategies (default LOCATORS)
+        cache_path: Winner cache file (default LOCATOR_CACHE)
+    """
+
+    def __init__(self, driver, locators=None, cache_path=CACHE_PATH):
+        self.driver = driver
+        self.locators = locators or LOCATORS
+        self.cache_path = cache_path
+
+    def page(self):
+        return normalize_path(urlsplit(self.driver.current_url).path) or "/"
+
+    def _run(self, strategies, probe, filter_):
+        result = self.driver.execute_script(RESOLVE_SCRIPT, [list(s) for s in strategies], probe, filter_)
+        return result["timings"], result["matches"]
+
+    def find_all(self, name, timeout=10, visible=False, clickable=False, poll=0.1):
+        """
+        All elements matching `name`, waiting up to `timeout` seconds.
+
+        Raises:
+            TimeoutException if no strategy matched in time
+        """
+        from selenium.common.exceptions import TimeoutException
+
+        strategies = self.locators[name]
+        filter_ = "clickable" if clickable else ("visible" if visible else "present")
+        page = self.page()
+        cached = load_cache(self.cache_path).get(page, {}).get(name)
+        cached_strategy = next(
+            (s for s in strategies if cached and strategy_label(s) == cached["strategy"]), None)
+
+        deadline = time.monotonic() + timeout
+        attempts = 0
+        while True:
+            attempts += 1
+            if cached_strategy is not None:
+                timings, matches = self._run([cached_strategy], False, filter_)
+                # A different count than when it won may mean the selector now
+                # matches other elements; re-probe so the ranking decides again
+                if matches[0] and len(matches[0]) == cached.get("count"):
+                    results_sink.record("locator", name, page=page, strategy=cached["strategy"],
+                                        cached=True, attempts=attempts, ms=timings[0]["ms"])
+                    return matches[0]
+            timings, matches = self._run(strategies, True, filter_)
+            matched = [i for i, found in enumerate(matches) if found]
+            if matched:
+                # Only strategies that agree with the best ranked match may win
+                agreeing = [i for i in matched if len(matches[i]) == len(matches[matched[0]])]
+                winner = min(agreeing, key=lambda i: timings[i]["ms"])
+                label = strategy_label(strategies[winner])
+                store_winner(page, name, label, timings[winner]["ms"], len(matches[winner]), self.cache_path)
+                results_sink.record("locator", name, page=page, strategy=label,
+                                    cached=False, attempts=attempts, ms=timings[winner]["ms"])
+                return matches[winner]
+            if time.monotonic() >= deadline:
+                tried = ", ".join(strategy_label(s) for s in strategies)
+                raise TimeoutException(f"No strategy for '{name}' matched on {page} within {timeout}s ({tried})")
+            time.sleep(poll)
+
+    def find(self, name, **kwargs):
+        """First element matching `name` (see find_all)."""
+        return self.find_all(name, **kwargs)[0]
+
+
+def main():
+    cache = _read_cache(CACHE_PATH)
+    print(f"Locator cache: {CACHE_PATH}")
+    if not cache:
+        print("  (empty)")
+    for page in sorted(cache):
+        print(f"  {page}")
+        for name, entry in sorted(cache[page].items()):
+            print(f"    {name:<24} {entry['ms']:7.3f}ms  {entry['strategy']}")
+
+
+if __name__ == "__main__":
+    main()
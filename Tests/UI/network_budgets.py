@@ -0,0 +1,157 @@
+"""
+Per-page API request-count and payload budgets.
+
+Budgets live in network_budgets.json (override with NETWORK_BUDGETS_FILE).
+Pages are keyed by their normalized path ("/book/{id}"); every budget is
+merged over "default", and over "dev_server" too when the run targets the
+dev build (React StrictMode fetches twice there). A page violates its
+budget when it:
+  - makes more distinct API calls than max_requests
+  - downloads more than max_bytes of response bodies
+  - repeats the exact same call more than max_identical_calls times
+  - calls one endpoint (ids normalized) more than max_calls_per_endpoint
+    times - the N+1 pattern - unless the endpoint has an allowance
+
+An allowance is either a higher limit or "warn" for a known N+1 whose count
+follows the data (one call per rendered card): it is reported as a
+NetworkBudgetWarning instead of failing and does not count towards
+max_requests. Its repeated identical calls still count against
+max_identical_calls.
+"""
+import json
+import os
+import warnings
+from collections import Counter, defaultdict
+
+import results_sink
+from network_capture import collect_requests, endpoint_key, install_network_capture, normalize_path
+
+
+BUDGETS_PATH = os.getenv(
+    "NETWORK_BUDGETS_FILE", os.path.join(os.path.dirname(__file__), "network_budgets.json")
+)
+
+
+class NetworkBudgetWarning(UserWarning):
+    """A known N+1 endpoint (allowance "warn") was called once per item."""
+
+
+def load_budgets(path=BUDGETS_PATH):
+    with open(path, encoding="utf-8") as budgets_file:
+        return json.load(budgets_file)
+
+
+def budget_for(budgets, page, dev_server=False):
+    """Budget of a normalized page path, merged over the default (and dev server) budget."""
+    budget = dict(budgets.get("default", {}))
+    if dev_server:
+        budget.update(budgets.get("dev_server", {}))
+    budget.update(budgets.get("pages", {}).get(page, {}))
+    return budget
+
+
+def group_by_page(requests):
+    """Map normalized page path -> list of requests made while on that page."""
+    pages = defaultdict(list)
+    for request in requests:
+        pages[normalize_path(request.get("page") or "/")].append(request)
+    return pages
+
+
+def page_stats(requests):
+    """Distinct calls, total calls, bytes and per-endpoint counts of one page's requests."""
+    calls = Counter((r["method"], r["url"]) for r in requests)
+    endpoints = Counter(endpoint_key(method, url) for method, url in calls)
+    return {
+        "distinct_requests": len(calls),
+        "total_requests": len(requests),
+        "bytes": sum(r.get("bytes") or 0 for r in requests),
+        "calls": calls,
+        "endpoints": endpoints,
+    }
+
+
+def check_budgets(requests, budgets=None, dev_server=False):
+    """
+    Check captured requests against the budgets; known N+1 endpoints are
+    reported as NetworkBudgetWarning.
+
+    Args:
+        requests: Captured calls (NetworkRecorder / collect_requests)
+        budgets: Parsed budgets (default: load_budgets())
+        dev_server: The pages came from the StrictMode dev build
+
+    Returns:
+        List of human readable violations (empty when every page is in budget)
+    """
+    budgets = budgets if budgets is not None else load_budgets()
+    violations = []
+    for page, page_requests in sorted(group_by_page(requests).items()):
+        budget = budget_for(budgets, page, dev_server)
+        stats = page_stats(page_requests)
+        results_sink.record(
+            "page", page, requests=stats["distinct_requests"],
+            total_requests=stats["total_requests"], bytes=stats["bytes"],
+        )
+
+        allowances = budget.get("endpoint_allowances", {})
+        warned = sum(count for endpoint, count in stats["endpoints"].items() if allowances.get(endpoint) == "warn")
+        if stats["distinct_requests"] - warned > budget.get("max_requests", float("inf")):
+            violations.append(
+                f"{page}: {stats['distinct_requests'] - warned} API calls (budget {budget['max_requests']}): "
+                f"{dict(stats['endpoints'])}"
+            )
+        if stats["bytes"] > budget.get("max_bytes", float("inf")):
+            violations.append(f"{page}: {stats['bytes']} bytes downloaded (budget {budget['max_bytes']})")
+
+        for (method, url), count in stats["calls"].items():
+            if count > budget.get("max_identical_calls", float("inf")):
+                violations.append(
+                    f"{page}: {method} {url} called {count} times (max {budget['max_identical_calls']})"
+                )
+
+        for endpoint, count in stats["endpoints"].items():
+            limit = allowances.get(endpoint, budget.get("max_calls_per_endpoint", float("inf")))
+            if limit == "warn":
+                if count > budget.get("max_calls_per_endpoint", float("inf")):
+                    results_sink.record("budget_warning", page, endpoint=endpoint, count=count)
+                    warnings.warn(NetworkBudgetWarning(
+                        f"{page}: {endpoint} called for {count} different ids - known N+1"
+                    ))
+            elif count > limit:
+                violations.append(f"{page}: {endpoint} called for {count} different ids (max {limit}) - N+1?")
+    return violations
+
+
+class NetworkRecorder:
+    """
+    Capture every API call a driver's pages make across navigations.
+
+    Page loads replace window.__netLog, so driver.get is wrapped to harvest
+    the current page's log before navigating away.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.requests = []
+        install_network_capture(driver)
+        self._original_get = driver.get
+
+        def get(url):
+            self.harvest()
+            return self._original_get(url)
+
+        driver.get = get
+
+    def harvest(self):
+        """Move the current page's captured calls into self.requests."""
+        try:
+            self.requests.extend(collect_requests(self.driver) or [])
+        except Exception:
+            # No page loaded yet (about:blank) or the window is gone
+            pass
+
+    def finish(self):
+        """Harvest the last page and return everything captured."""
+        self.harvest()
+        return self.requests
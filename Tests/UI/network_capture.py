@@ -0,0 +1,99 @@
+"""
+In-page capture of the API calls the frontend makes.
+
+A small script injected into every new document (through CDP) wraps
+window.fetch and records method, URL, status, duration, response size and
+the page (location.pathname) that made each call in window.__netLog. Tests
+read the log back to count requests and bytes per endpoint and per page.
+"""
+import re
+import time
+from urllib.parse import urlsplit
+
+
+NETWORK_CAPTURE_JS = """
+(function () {
+  if (window.__netLog) return;
+  window.__netLog = [];
+  window.__netPending = 0;
+  var originalFetch = window.fetch;
+  window.fetch = function (input, init) {
+    var method = ((init && init.method) || (input && input.method) || 'GET').toUpperCase();
+    var url = typeof input === 'string' ? input : ((input && input.url) || String(input));
+    var page = window.location.pathname;
+    var start = performance.now();
+    window.__netPending++;
+    return originalFetch.apply(this, arguments).then(function (response) {
+      var entry = {method: method, url: response.url || url, status: response.status, page: page,
+                   start: start, duration: performance.now() - start, bytes: 0};
+      window.__netLog.push(entry);
+      // Size of the decoded body; read from a clone so the app's own read is untouched
+      response.clone().arrayBuffer().then(function (body) {
+        entry.bytes = body.byteLength;
+        window.__netPending--;
+      }, function () {
+        window.__netPending--;
+      });
+      return response;
+    }, function (error) {
+      window.__netPending--;
+      window.__netLog.push({method: method, url: url, status: 0, page: page,
+                            start: start, duration: performance.now() - start, bytes: 0});
+      throw error;
+    });
+  };
+})();
+"""
+
+
+def install_network_capture(driver):
+    """Capture fetch calls on every page loaded from now on."""
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_CAPTURE_JS})
+
+
+def collect_requests(driver, reset=True):
+    """
+    Return the fetch calls recorded on the current page (since load or the
+    last reset) as dicts with method, url, status, page, start and duration
+    (ms) and bytes.
+    """
+    script = "var log = window.__netLog || []; "
+    if reset:
+        script += "window.__netLog = []; "
+    return driver.execute_script(script + "return log;")
+
+
+def wait_for_network_idle(driver, timeout=10, idle_time=0.5):
+    """
+    Wait until no captured fetch has been in flight for `idle_time` seconds.
+
+    Returns:
+        True if the page went idle, False on timeout
+    """
+    deadline = time.monotonic() + timeout
+    idle_since = None
+    while time.monotonic() < deadline:
+        pending = driver.execute_script("return window.__netPending || 0;")
+        if pending == 0:
+            idle_since = idle_since or time.monotonic()
+            if time.monotonic() - idle_since >= idle_time:
+                return True
+        else:
+            idle_since = None
+        time.sleep(0.05)
+    return False
+
+
+def normalize_path(path):
+    """Lower-case a path and replace numeric segments by {id}: "/book/{id}"."""
+    return re.sub(r"/\d+(?=/|$)", "/{id}", path.lower())
+
+
+def endpoint_key(method, url):
+    """
+    Group a request by endpoint: "GET /api/favorites/check/{id}".
+
+    The path is lower-cased because the frontend mixes /api/booking and
+    /api/Booking.
+    """
+    return f"{method.upper()} {normalize_path(urlsplit(url).path)}"
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Streaming JSONL results sink for long test and benchmark runs.
+
+Every result (a finished test, a WebDriver command, a benchmark sample) is
+written as one JSON line as soon as it happens, so a soak run never keeps its
+results in memory. Files ending in .gz are gzip-compressed.
+
+Under pytest-xdist every worker writes its own file next to the requested
+one (results.gw0.jsonl.gz, ...), since several processes appending to one
+file - gzip members especially - interleave into garbage. The reader merges
+them back.
+
+The reader side aggregates percentiles from these files with bounded memory
+using fixed log-scale histograms instead of keeping every value.
+
+Usage:
+    pytest --results-jsonl results.jsonl.gz
+    python results_sink.py results.jsonl.gz
+"""
+import glob
+import gzip
+import io
+import json
+import math
+import os
+import sys
+import threading
+import time
+import zlib
+
+
+_active_writer = None
+
+
+def set_active_writer(writer):
+    """Make `writer` the process-wide sink used by record() (None disables it)."""
+    global _active_writer
+    _active_writer = writer
+
+
+def active_writer():
+    """The process-wide ResultsWriter, or None when results are not streamed."""
+    return _active_writer
+
+
+def record(kind, name, **fields):
+    """Write a record to the active writer, if there is one."""
+    if _active_writer is not None:
+        _active_writer.write(kind, name, **fields)
+
+
+def _split_suffix(path):
+    """'results.jsonl.gz' -> ('results', '.jsonl.gz')"""
+    stem, suffix = str(path), ""
+    for ext in (".gz", ".jsonl"):
+        if stem.endswith(ext):
+            stem, suffix = stem[:-len(ext)], ext + suffix
+    return stem, suffix
+
+
+def worker_path(path, worker_id):
+    """Per-worker results file for `path`, e.g. results.gw0.jsonl.gz for gw0."""
+    stem, suffix = _split_suffix(path)
+    return f"{stem}.{worker_id}{suffix}"
+
+
+def result_files(path):
+    """`path` followed by the per-worker files written next to it, those that exist."""
+    stem, suffix = _split_suffix(path)
+    workers = sorted(glob.glob(f"{glob.escape(stem)}.gw*{glob.escape(suffix)}"))
+    return [name for name in [str(path)] + workers if os.path.exists(name)]
+
+
+def _open_text(path, mode):
+    if str(path).endswith(".gz"):
+        return io.TextIOWrapper(gzip.open(path, mode + "b"), encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class ResultsWriter:
+    """
+    Thread-safe JSONL writer with periodic flushing.
+
+    Args:
+        path: Output file; a .gz suffix enables gzip compression
+        flush_every: Flush after this many records
+        flush_interval: Flush when this many seconds passed since the last flush
+    """
+
+    def __init__(self, path, flush_every=200, flush_interval=2.0):
+        self.path = str(path)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._file = _open_text(self.path, "a")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def write(self, kind, name, **fields):
+        """
+        Append one record.
+
+        Args:
+            kind: Record type, e.g. "test", "command" or "sample"
+            name: What was measured (test node id, command name, benchmark phase)
+            **fields: Any JSON-serializable values (durations in seconds)
+        """
+        line = json.dumps({"ts": time.time(), "kind": kind, "name": name, **fields}, default=str)
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line + "\n")
+            self._pending += 1
+            now = time.monotonic()
+            if self._pending >= self.flush_every or now - self._last_flush >= self.flush_interval:
+                self._flush_locked(now)
+
+    def _flush_locked(self, now=None):
+        self._file.flush()
+        self._pending = 0
+        self._last_flush = now or time.monotonic()
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._flush_locked()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def instrument_driver(driver, writer=None):
+    """
+    Record the duration of every WebDriver command sent by `driver`.
+
+    Wraps driver.execute so each command becomes a "command" record named
+    after the WebDriver command (e.g. "findElement", "get").
+    """
+    original_execute = driver.execute
+
+    def timed_execute(driver_command, params=None):
+        sink = writer or _active_writer
+        start = time.perf_counter()
+        ok = False
+        try:
+            result = original_execute(driver_command, params)
+            ok = True
+            return result
+        finally:
+            if sink is not None:
+                sink.write("command", driver_command, duration=time.perf_counter() - start, ok=ok)
+
+    driver.execute = timed_execute
+    return driver
+
+
+def iter_records(path, kind=None):
+    """
+    Yield records from a results file and its per-worker files one at a time
+    (optionally one kind).
+    """
+    for name in result_files(path):
+        with _open_text(name, "r") as results:
+            lines = iter(results)
+            while True:
+                try:
+                    line = next(lines)
+                except StopIteration:
+                    break
+                except (EOFError, zlib.error, OSError):
+                    # A .gz from a killed run ends without the gzip trailer;
+                    # everything flushed before that is still readable
+                    break
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A run killed mid-write can leave a truncated last line
+                    continue
+                if kind is None or entry.get("kind") == kind:
+                    yield entry
+
+
+class LogHistogram:
+    """
+    Fixed-memory histogram of positive values with ~1% relative precision.
+
+    Values are counted in logarithmic buckets, so percentiles can be
+    estimated from any number of samples without storing them.
+    """
+
+    GROWTH = 1.02
+    MIN_VALUE = 1e-6
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        value = max(float(value), self.MIN_VALUE)
+        index = int(math.log(value / self.MIN_VALUE, self.GROWTH))
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, pct):
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * pct / 100.0))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                # Midpoint of the bucket, capped by the real maximum
+                return min(self.MIN_VALUE * self.GROWTH ** (index + 0.5), self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+
+def aggregate(path, field="duration", kind=None):
+    """
+    Aggregate `field` per (kind, name) across a results file and its
+    per-worker files.
+
+    Returns:
+        Dict mapping (kind, name) to a LogHistogram
+    """
+    histograms = {}
+    for entry in iter_records(path, kind):
+        value = entry.get(field)
+        if not isinstance(value, (int, float)):
+            continue
+        key = (entry.get("kind"), entry.get("name"))
+        if key not in histograms:
+            histograms[key] = LogHistogram()
+        histograms[key].add(value)
+    return histograms
+
+
+def main(argv=None):
+    """Print duration percentiles per record kind and name."""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Usage: python results_sink.py RESULTS_FILE [FIELD]")
+        return 1
+    field = argv[1] if len(argv) > 1 else "duration"
+    histograms = aggregate(argv[0], field)
+    print(f"{'kind':<10} {'name':<60} {'n':>7} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+    for (kind, name), hist in sorted(histograms.items(), key=lambda item: (str(item[0][0]), str(item[0][1]))):
+        print(
+            f"{str(kind):<10} {str(name)[:60]:<60} {hist.count:>7} "
+            f"{hist.percentile(50):>9.4f} {hist.percentile(95):>9.4f} "
+            f"{hist.percentile(99):>9.4f} {hist.max:>9.4f}"
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
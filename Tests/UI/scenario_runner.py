@@ -0,0 +1,311 @@
+"""
+Multi-user scenario runner: many headless browsers at once, each logged in as
+a distinct patient and driving the existing UI flows.
+
+Every virtual user runs SCENARIO_ITERATIONS rounds of three journeys:
+  search   doctor search on /patient (as in TestDoctorSearch)
+  book     the popular doctor's booking page -> modal -> payment
+           (as in TestAppointmentBooking)
+  profile  edit the profile name on /account (as in TestUserProfile)
+
+All browsers are started before the clock starts and released together, so
+journey latencies reflect the system under concurrent real-browser load, not
+Chrome start-up. Every booking targets one "hot" schedule with fewer slots
+than there are users; the report shows how many attempts were booked,
+rejected by the backend or found the schedule full, and whether the backend
+oversold it.
+
+Run with:
+    python scenario_runner.py --users 20
+    pytest test_concurrent_users.py --benchmark -s
+
+Environment variables (defaults for both):
+    SCENARIO_USERS        concurrent browsers / patients (default 10)
+    SCENARIO_ITERATIONS   journey rounds per user (default 2)
+    SCENARIO_HOT_SLOTS    slots on the contended schedule (default users // 2)
+    SCENARIO_HEADLESS     set to 0 to watch the browsers (default 1)
+"""
+import argparse
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+
+import results_sink
+from api_client import ApiClient, get_api_base_url
+from bench_utils import format_summary, summarize
+from conftest import login_user
+from driver_cache import create_chrome
+from frontend_server import FrontendServer, ensure_bundle
+from seed_data import create_schedule, ensure_user, first_doctor_id, free_schedule_date
+from ui_flows import (
+    complete_booking, edit_profile, open_booking_modal, open_booking_page, search_doctors, slot_card_xpath,
+)
+
+
+DEFAULT_BASE_URL = "http://localhost:5173"
+USERS = int(os.getenv("SCENARIO_USERS", "10"))
+ITERATIONS = int(os.getenv("SCENARIO_ITERATIONS", "2"))
+HOT_SLOTS = int(os.getenv("SCENARIO_HOT_SLOTS", "0")) or None
+HEADLESS = os.getenv("SCENARIO_HEADLESS", "1") == "1"
+PASSWORD = "ScenarioPass123!"
+# How long browsers wait for each other to start before giving up
+START_TIMEOUT = 300
+
+
+def scenario_user(index):
+    """Credentials and contact details of virtual patient `index`."""
+    # The booking form only accepts letters in names
+    suffix = "".join(chr(ord("a") + int(digit)) for digit in str(index)).capitalize()
+    return {
+        "email": f"scenario-user-{index}@example.com",
+        "password": PASSWORD,
+        "firstName": "Scenario",
+        "lastName": suffix,
+        "nic": f"{199000000000 + index}",
+        "phone": f"07{index:08d}",
+    }
+
+
+def new_driver(headless=HEADLESS):
+    """Chrome with the suite's options; headless by default so dozens can run at once."""
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--window-size=1280,900")
+    chrome_options.add_argument("user-agent=Mozilla/5.0")
+
+    driver = create_chrome(chrome_options)
+    driver.implicitly_wait(10)
+    if results_sink.active_writer() is not None:
+        results_sink.instrument_driver(driver)
+    return driver
+
+
+def book_journey(driver, base_url, hot, patient):
+    """
+    Try to book the hot schedule through the UI.
+
+    Returns:
+        "booked", "rejected" (backend refused), "full" (the page already
+        showed no slots) or None when the UI failed
+    """
+    if not open_booking_page(driver, base_url, hot["doctor_id"]):
+        return None
+    buttons = driver.find_elements(By.XPATH, slot_card_xpath(hot["date"]) + "//button")
+    if not buttons:
+        print(f"Hot schedule on {hot['date']} not shown on the booking page")
+        return None
+    if "Full" in buttons[0].text:
+        return "full"
+    if not open_booking_modal(driver, slot_date=hot["date"]):
+        return None
+    outcome, message = complete_booking(driver, patient)
+    if outcome == "rejected":
+        print(f"Booking rejected: {message}")
+    return outcome
+
+
+def run_user(index, base_url, hot, iterations, start):
+    """
+    One virtual patient: start a browser, wait for the others, log in and
+    run the journeys.
+
+    Returns:
+        Dict with per-journey latencies (seconds), failure and booking counts
+    """
+    user = scenario_user(index)
+    patient = {
+        "name": f"{user['firstName']} {user['lastName']}",
+        "nic": user["nic"],
+        "email": user["email"],
+        "contact": user["phone"],
+    }
+    result = {"latencies": defaultdict(list), "failures": Counter(), "bookings": Counter()}
+
+    try:
+        driver = new_driver()
+    except Exception as e:
+        print(f"User {index}: browser failed to start: {str(e)}")
+        driver = None
+    try:
+        # Everyone arrives at the barrier, even without a browser, so nobody waits forever
+        start.wait(timeout=START_TIMEOUT)
+    except threading.BrokenBarrierError:
+        pass
+    if driver is None:
+        result["failures"]["start"] += 1
+        return result
+
+    def timed(name, step):
+        started = time.perf_counter()
+        outcome = step()
+        duration = time.perf_counter() - started
+        ok = outcome not in (None, False)
+        if ok:
+            key = name if outcome is True else f"{name} ({outcome})"
+            result["latencies"][key].append(duration)
+        else:
+            result["failures"][name] += 1
+        results_sink.record("journey", name, duration=duration, ok=ok, user=index, outcome=str(outcome))
+        return outcome
+
+    try:
+        if not timed("login", lambda: login_user(driver, base_url, user)):
+            return result
+        for iteration in range(iterations):
+            timed("search", lambda: search_doctors(driver, base_url))
+            outcome = timed("book", lambda: book_journey(driver, base_url, hot, patient))
+            result["bookings"][outcome or "error"] += 1
+            new_name = f"{patient['name']} {'ABCDEFGHIJ'[iteration % 10]}"
+            timed("profile", lambda: edit_profile(driver, base_url, new_name))
+    finally:
+        driver.quit()
+    return result
+
+
+def prepare_scenario(api_base_url, users, hot_slots):
+    """
+    Register the virtual patients and create the contended schedule.
+
+    Returns:
+        Dict describing the hot schedule: doctor_id, date (YYYY-MM-DD),
+        schedule_id and slots
+    """
+    with ApiClient(api_base_url) as client:
+        for index in range(users):
+            if not ensure_user(client, scenario_user(index)):
+                raise RuntimeError(f"Could not log in or register {scenario_user(index)['email']}")
+        doctor_id = first_doctor_id(client)
+        if doctor_id is None:
+            raise RuntimeError("No doctors to book")
+        schedule_date = free_schedule_date(client, doctor_id)
+        schedule_id = create_schedule(client, doctor_id, hot_slots, schedule_date)
+        if schedule_id is None:
+            raise RuntimeError("Failed to create the contended schedule")
+    return {"doctor_id": doctor_id, "date": schedule_date.isoformat(), "schedule_id": schedule_id, "slots": hot_slots}
+
+
+def available_slots(api_base_url, hot):
+    """Remaining slots of the hot schedule according to the backend, or None."""
+    with ApiClient(api_base_url) as client:
+        for schedule in client.get(f"/api/Schedules/doctor/{hot['doctor_id']}").json() or []:
+            if schedule["id"] == hot["schedule_id"]:
+                return schedule["availableSlots"]
+    return None
+
+
+def run_scenario(base_url=DEFAULT_BASE_URL, api_base_url=None, users=USERS, iterations=ITERATIONS, hot_slots=HOT_SLOTS):
+    """
+    Run `users` concurrent browsers through `iterations` journey rounds.
+
+    Returns:
+        Report dict: users, iterations, wall_time, journeys (name ->
+        summarize() result), failures and contention on the hot schedule
+    """
+    api_base_url = api_base_url or get_api_base_url()
+    hot = prepare_scenario(api_base_url, users, hot_slots or max(1, users // 2))
+
+    # One extra party: this thread starts the clock when every browser is up
+    start = threading.Barrier(users + 1)
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        futures = [pool.submit(run_user, index, base_url, hot, iterations, start) for index in range(users)]
+        try:
+            start.wait(timeout=START_TIMEOUT)
+        except threading.BrokenBarrierError:
+            pass
+        started = time.perf_counter()
+        results = [future.result() for future in futures]
+        wall_time = time.perf_counter() - started
+
+    latencies, failures, bookings = defaultdict(list), Counter(), Counter()
+    for result in results:
+        for name, values in result["latencies"].items():
+            latencies[name].extend(values)
+        failures.update(result["failures"])
+        bookings.update(result["bookings"])
+
+    remaining = available_slots(api_base_url, hot)
+    booked = bookings["booked"]
+    contention = {
+        "schedule_id": hot["schedule_id"],
+        "slots": hot["slots"],
+        "attempts": sum(bookings.values()),
+        "booked": booked,
+        "rejected": bookings["rejected"],
+        "full": bookings["full"],
+        "errors": bookings["error"],
+        "available_after": remaining,
+        "oversold": max(0, booked - hot["slots"]),
+        # Bookings whose slot decrement was overwritten by a concurrent booking
+        "lost_updates": (booked - (hot["slots"] - remaining)) if remaining is not None else None,
+    }
+    return {
+        "users": users,
+        "iterations": iterations,
+        "wall_time": wall_time,
+        "journeys": {
+            name: summarize(values, wall_time, failures.get(name, 0))
+            for name, values in sorted(latencies.items())
+        },
+        "failures": dict(failures),
+        "contention": contention,
+    }
+
+
+def print_scenario_report(report):
+    print("\n" + "=" * 80)
+    print(f"Concurrent users: {report['users']} browsers x {report['iterations']} rounds "
+          f"in {report['wall_time']:.1f}s")
+    print("=" * 80)
+    for name, summary in report["journeys"].items():
+        print(format_summary(name, summary))
+    if report["failures"]:
+        print(f"Failed steps: {report['failures']}")
+
+    contention = report["contention"]
+    print(f"\nHot schedule {contention['schedule_id']} ({contention['slots']} slots): "
+          f"{contention['attempts']} attempts, {contention['booked']} booked, "
+          f"{contention['rejected']} rejected, {contention['full']} saw it full, {contention['errors']} UI errors")
+    print(f"Slots left {contention['available_after']}, oversold {contention['oversold']}, "
+          f"lost slot updates {contention['lost_updates']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive many concurrent browsers through the patient journeys")
+    parser.add_argument("--users", type=int, default=USERS, help="Concurrent browsers / patients")
+    parser.add_argument("--iterations", type=int, default=ITERATIONS, help="Journey rounds per user")
+    parser.add_argument("--hot-slots", type=int, default=HOT_SLOTS, help="Slots on the contended schedule")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL, help="Frontend URL")
+    parser.add_argument("--api-base-url", default=None, help="Backend URL (default API_BASE_URL)")
+    parser.add_argument("--production-frontend", action="store_true",
+                        help="Serve the built frontend bundle in-process instead of --base-url")
+    parser.add_argument("--results", help="Stream results to this JSONL file (.gz to compress)")
+    args = parser.parse_args()
+    if args.results:
+        results_sink.set_active_writer(results_sink.ResultsWriter(args.results))
+
+    frontend = None
+    base_url = args.base_url
+    if args.production_frontend:
+        frontend = FrontendServer(ensure_bundle(), args.api_base_url).start()
+        base_url = frontend.url
+    try:
+        report = run_scenario(base_url, args.api_base_url, args.users, args.iterations, args.hot_slots)
+        print_scenario_report(report)
+    finally:
+        if frontend is not None:
+            frontend.stop()
+        if results_sink.active_writer() is not None:
+            results_sink.active_writer().close()
+            results_sink.set_active_writer(None)
+
+
+if __name__ == "__main__":
+    main()
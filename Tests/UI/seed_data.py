@@ -0,0 +1,101 @@
+"""
+Helpers that grow the backend database through its public API.
+
+Used by benchmarks that need production-like table sizes locally. Everything
+goes through the normal endpoints (admin schedules, auth, booking) so the
+rows look exactly like the ones real users create.
+"""
+import datetime
+
+from api_client import ApiClient, booking_request
+from bench_utils import run_load
+
+
+def ensure_user(client, user):
+    """
+    Log the client in as `user`, registering the account first if needed.
+
+    Args:
+        client: ApiClient to authenticate
+        user: Dict with 'email', 'password' and optionally 'firstName'/'lastName'
+
+    Returns:
+        The JWT, or None if the user could neither log in nor register
+    """
+    token = client.login(user["email"], user["password"])
+    if token:
+        return token
+    name = f"{user.get('firstName', 'Test')} {user.get('lastName', 'User')}"
+    client.post("/api/Auth/register", {
+        "name": name,
+        "email": user["email"],
+        "password": user["password"],
+        "nic": user.get("nic", "199012345678"),
+        "phone": user.get("phone", "0701234567"),
+    })
+    return client.login(user["email"], user["password"])
+
+
+def create_schedule(client, doctor_id, total_slots, schedule_date=None, start_time="08:00", end_time="20:00"):
+    """
+    Create a schedule through the admin API and return its ID.
+
+    The admin POST does not return the new ID, so it is looked up afterwards
+    as the newest schedule of the doctor on that date.
+
+    Returns:
+        The schedule ID, or None if creation failed
+    """
+    schedule_date = schedule_date or (datetime.date.today() + datetime.timedelta(days=30))
+    date_text = schedule_date.isoformat()
+    response = client.post("/api/admin/AdminSchedules", {
+        "doctorId": doctor_id,
+        "scheduleDate": date_text,
+        "startTime": start_time,
+        "endTime": end_time,
+        "totalSlots": total_slots,
+    })
+    if not response.ok:
+        return None
+
+    schedules = client.get("/api/admin/AdminSchedules").json() or []
+    matching = [
+        s["scheduleId"] for s in schedules
+        if s["doctorId"] == doctor_id and str(s["scheduleDate"]).startswith(date_text)
+    ]
+    return max(matching) if matching else None
+
+
+def free_schedule_date(client, doctor_id, start_days=60):
+    """
+    First date, `start_days` or more from today, on which the doctor has no
+    schedule yet, so a schedule created there is the only one on that date.
+    """
+    schedules = client.get("/api/admin/AdminSchedules").json() or []
+    taken = {str(s["scheduleDate"])[:10] for s in schedules if s["doctorId"] == doctor_id}
+    schedule_date = datetime.date.today() + datetime.timedelta(days=start_days)
+    while schedule_date.isoformat() in taken:
+        schedule_date += datetime.timedelta(days=1)
+    return schedule_date
+
+
+def first_doctor_id(client):
+    """ID of the first doctor returned by the admin doctor picker, or None."""
+    doctors = client.get("/api/admin/AdminSchedules/doctors").json() or []
+    return doctors[0]["doctorId"] if doctors else None
+
+
+def seed_bookings(api_base_url, token, schedule_id, count, concurrency=8, patient_name="Seeded Patient"):
+    """
+    Book `count` appointments on one schedule. Each booking creates one
+    Appointment and one Transaction row.
+
+    Returns:
+        (created, failed)
+    """
+    latencies, errors, _ = run_load(
+        lambda client, i: client.post("/api/Booking", booking_request(schedule_id, patient_name)).ok,
+        count, concurrency,
+        lambda: ApiClient(api_base_url, token=token),
+    )
+    return len(latencies) - errors, errors
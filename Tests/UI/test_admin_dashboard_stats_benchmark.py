@@ -0,0 +1,107 @@
+"""
+Load profile and regression guard for GET /api/admin/AdminDashboard/stats.
+
+The stats endpoint counts appointments, schedules, patients and doctors and
+loads the five most recent appointments. This benchmark grows the
+Appointment/Transaction tables step by step (through real bookings), measures
+the stats latency at each size and fails if latency grows faster than the
+configured scaling exponent.
+
+Run with:
+    pytest test_admin_dashboard_stats_benchmark.py --benchmark -s
+
+Tuning (environment variables):
+    BENCH_STATS_SIZES         appointment counts to grow the table to (default "1000,2000,4000,8000")
+    BENCH_STATS_SAMPLES       stats requests measured per size (default 50)
+    BENCH_STATS_MAX_EXPONENT  max allowed log-log slope of p50 latency vs rows (default 1.0)
+    BENCH_STATS_MAX_P95_MS    max allowed p95 latency at the largest size (default 1000)
+    BENCH_CONCURRENCY         concurrent clients used for seeding (default 8)
+"""
+import os
+
+import pytest
+
+from api_client import ApiClient
+from bench_utils import loglog_slope, print_report, run_load, summarize
+from seed_data import create_schedule, ensure_user, first_doctor_id, seed_bookings
+
+
+STATS_SIZES = [int(size) for size in os.getenv("BENCH_STATS_SIZES", "1000,2000,4000,8000").split(",")]
+STATS_SAMPLES = int(os.getenv("BENCH_STATS_SAMPLES", "50"))
+MAX_EXPONENT = float(os.getenv("BENCH_STATS_MAX_EXPONENT", "1.0"))
+MAX_P95_MS = float(os.getenv("BENCH_STATS_MAX_P95_MS", "1000"))
+CONCURRENCY = int(os.getenv("BENCH_CONCURRENCY", "8"))
+
+STATS_PATH = "/api/admin/AdminDashboard/stats"
+
+
+def appointment_count(client):
+    """Current number of appointments according to the stats endpoint."""
+    return client.get(STATS_PATH).json()["totalAppointments"]
+
+
+def measure_stats(api_base_url, appointments):
+    """Measure STATS_SAMPLES sequential stats requests (one admin refreshing)."""
+    latencies, errors, wall_time = run_load(
+        lambda client, i: client.get(STATS_PATH).ok,
+        STATS_SAMPLES, 1,
+        lambda: ApiClient(api_base_url),
+        name=f"stats.{appointments}",
+    )
+    return summarize(latencies, wall_time, errors)
+
+
+@pytest.mark.benchmark
+class TestAdminDashboardStatsBenchmark:
+    """Stats endpoint latency as the appointment and transaction tables grow."""
+
+    def test_stats_latency_scaling(self, api_base_url, test_user):
+        """Grow the tables and check that stats latency scales within bounds."""
+        client = ApiClient(api_base_url)
+        try:
+            try:
+                start_count = appointment_count(client)
+            except (OSError, ValueError, KeyError) as e:
+                pytest.skip(f"Stats endpoint not available at {api_base_url}: {str(e)}")
+
+            token = ensure_user(client, test_user)
+            if not token:
+                pytest.skip("Failed to login - seeding bookings needs a test user")
+            doctor_id = first_doctor_id(client)
+            if doctor_id is None:
+                pytest.skip("No doctors to attach seeded schedules to")
+            schedule_id = create_schedule(client, doctor_id, total_slots=max(STATS_SIZES) * 2)
+            if schedule_id is None:
+                pytest.skip("Failed to create a schedule for seeding")
+
+            rows = []
+            sizes = []
+            p50s = []
+            for target in sorted(STATS_SIZES):
+                current = appointment_count(client)
+                if current < target:
+                    seed_bookings(api_base_url, token, schedule_id, target - current, CONCURRENCY)
+                    current = appointment_count(client)
+
+                summary = measure_stats(api_base_url, current)
+                rows.append((f"{current} appointments", summary))
+                sizes.append(current)
+                p50s.append(summary["p50_ms"])
+        finally:
+            client.close()
+
+        exponent = loglog_slope(sizes, p50s)
+        print_report(
+            f"Admin dashboard stats - started at {start_count} appointments, "
+            f"scaling exponent {exponent:.2f} (max {MAX_EXPONENT})",
+            rows,
+        )
+
+        largest = rows[-1][1]
+        assert largest["errors"] == 0, f"Stats requests failed: {largest['errors']}"
+        assert exponent <= MAX_EXPONENT, (
+            f"Stats latency scales as rows^{exponent:.2f}, above the allowed rows^{MAX_EXPONENT}"
+        )
+        assert largest["p95_ms"] <= MAX_P95_MS, (
+            f"Stats p95 {largest['p95_ms']:.1f}ms at {sizes[-1]} appointments exceeds {MAX_P95_MS}ms"
+        )
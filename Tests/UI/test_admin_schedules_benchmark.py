@@ -0,0 +1,305 @@
+"""
+Bulk schedule administration benchmark for /api/admin/AdminSchedules.
+
+The admin API (and the admin Schedules page on top of it) creates, updates
+and deletes one schedule per request. Publishing a roster - every doctor,
+every day of a week, every session - therefore takes doctors x 7 x sessions
+requests, and the page reloads the full schedule list after each save. This
+benchmark gives the baseline a batch endpoint would be compared against:
+
+  API   publishes BENCH_ROSTER_WEEKS weekly rosters for all doctors at each
+        concurrency level, then updates and deletes every created schedule.
+        Reports per-operation latency, the wall time to publish each week,
+        and GET list / GET doctors (picker) latency as the table grows.
+  UI    logs in as the admin, creates and then edits BENCH_ROSTER_UI_OPS
+        schedules through the Schedules page form, timing each save until
+        the table shows the change, and projects the time to publish one
+        week's roster by hand.
+
+Created schedules are dated BENCH_ROSTER_START_DAYS ahead and deleted at
+the end, so patient-facing tests are not affected.
+
+Run with:
+    pytest test_admin_schedules_benchmark.py --benchmark -s
+
+Tuning (environment variables):
+    BENCH_ROSTER_WEEKS        weeks published per concurrency level (default 4)
+    BENCH_ROSTER_SESSIONS     sessions per doctor and day (default "08:00-12:00,14:00-18:00")
+    BENCH_ROSTER_DOCTORS      max doctors in the roster, 0 = all (default 0)
+    BENCH_ROSTER_CONCURRENCY  API concurrency levels (default "1,8")
+    BENCH_ROSTER_START_DAYS   first roster day, days from today (default 400)
+    BENCH_ROSTER_UI_OPS       schedules created and edited through the UI (default 30)
+"""
+import datetime
+import os
+import time
+
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import Select, WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from api_client import ApiClient
+from bench_utils import print_report, run_load, summarize
+from conftest import login_user
+from form_fill import set_react_value
+
+
+ROSTER_WEEKS = int(os.getenv("BENCH_ROSTER_WEEKS", "4"))
+ROSTER_SESSIONS = [
+    tuple(session.split("-")) for session in os.getenv("BENCH_ROSTER_SESSIONS", "08:00-12:00,14:00-18:00").split(",")
+]
+ROSTER_DOCTORS = int(os.getenv("BENCH_ROSTER_DOCTORS", "0"))
+CONCURRENCY_LEVELS = [int(level) for level in os.getenv("BENCH_ROSTER_CONCURRENCY", "1,8").split(",")]
+START_DAYS = int(os.getenv("BENCH_ROSTER_START_DAYS", "400"))
+UI_OPS = int(os.getenv("BENCH_ROSTER_UI_OPS", "30"))
+
+SCHEDULES_PATH = "/api/admin/AdminSchedules"
+# Hardcoded admin login of the frontend (Login.jsx)
+ADMIN_USER = {"email": "admin@medisync.com", "password": "admin123"}
+SLOTS = 20
+ROW_SELECTOR = "tr[data-testid='schedule-row']"
+
+
+def roster_week(doctor_ids, week_start):
+    """POST bodies for one week: every doctor, every day, every session."""
+    return [
+        {
+            "doctorId": doctor_id,
+            "scheduleDate": (week_start + datetime.timedelta(days=day)).isoformat(),
+            "startTime": start_time,
+            "endTime": end_time,
+            "totalSlots": SLOTS,
+        }
+        for day in range(7) for doctor_id in doctor_ids for start_time, end_time in ROSTER_SESSIONS
+    ]
+
+
+def schedules_in(client, first_day, last_day):
+    """Schedules dated first_day..last_day (inclusive), from the full admin list."""
+    schedules = client.get(SCHEDULES_PATH).json() or []
+    return [s for s in schedules if first_day.isoformat() <= str(s["scheduleDate"])[:10] <= last_day.isoformat()]
+
+
+def update_body(schedule):
+    """PUT body changing the slot count of a listed schedule."""
+    return {
+        "doctorId": schedule["doctorId"],
+        "scheduleDate": str(schedule["scheduleDate"])[:10],
+        "startTime": schedule["startTime"],
+        "endTime": schedule["endTime"],
+        "totalSlots": schedule["totalSlots"] + 5,
+    }
+
+
+def timed_get(client, path):
+    """(latency ms, row count) of one GET returning a list."""
+    response = client.get(path)
+    return response.elapsed * 1000, (len(response.json() or []) if response.ok else -1)
+
+
+def delete_schedules(api_base_url, schedule_ids, concurrency=8, name=None):
+    """DELETE each schedule; returns run_load's (latencies, errors, wall_time)."""
+    return run_load(
+        lambda client, i: client.delete(f"{SCHEDULES_PATH}/{schedule_ids[i]}").ok,
+        len(schedule_ids), concurrency,
+        lambda: ApiClient(api_base_url),
+        name=name,
+    )
+
+
+def open_schedule_form(driver, button_xpath, timeout):
+    """Click the Add/Edit button and return the form of the modal it opens."""
+    WebDriverWait(driver, timeout).until(EC.element_to_be_clickable((By.XPATH, button_xpath))).click()
+    return WebDriverWait(driver, timeout).until(
+        EC.visibility_of_element_located((By.CSS_SELECTOR, ".modal form"))
+    )
+
+
+def fill_schedule_form(driver, form, body):
+    """Fill the Schedules page form (doctor picker, date, times, slots)."""
+    Select(form.find_element(By.TAG_NAME, "select")).select_by_value(str(body["doctorId"]))
+    set_react_value(driver, form.find_element(By.CSS_SELECTOR, "input[type='date']"), body["scheduleDate"])
+    start_input, end_input = form.find_elements(By.CSS_SELECTOR, "input[type='time']")
+    set_react_value(driver, start_input, body["startTime"])
+    set_react_value(driver, end_input, body["endTime"])
+    set_react_value(driver, form.find_element(By.CSS_SELECTOR, "input[type='number']"), body["totalSlots"])
+    form.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+
+
+@pytest.mark.benchmark
+class TestAdminSchedulesBenchmark:
+    """Schedule create/update/delete cost, one request per schedule, via API and UI."""
+
+    def test_api_roster_publish(self, api_base_url):
+        """Publish weekly rosters at each concurrency level, then update and delete them."""
+        client = ApiClient(api_base_url)
+        try:
+            try:
+                picker = client.get(f"{SCHEDULES_PATH}/doctors")
+            except OSError as e:
+                pytest.skip(f"Backend not reachable at {api_base_url}: {str(e)}")
+            doctors = picker.json() or []
+            doctor_ids = [doctor["doctorId"] for doctor in doctors][:ROSTER_DOCTORS or None]
+            if not doctor_ids:
+                pytest.skip("No doctors to build a roster for")
+
+            first_day = datetime.date.today() + datetime.timedelta(days=START_DAYS)
+            last_day = first_day + datetime.timedelta(days=7 * ROSTER_WEEKS - 1)
+            leftovers = [s["scheduleId"] for s in schedules_in(client, first_day, last_day)]
+            if leftovers:
+                delete_schedules(api_base_url, leftovers)
+
+            levels = {}
+            for concurrency in CONCURRENCY_LEVELS:
+                create_latencies, create_errors, week_times, list_sizes = [], 0, [], []
+                for week in range(ROSTER_WEEKS):
+                    bodies = roster_week(doctor_ids, first_day + datetime.timedelta(days=7 * week))
+                    latencies, errors, wall_time = run_load(
+                        lambda api, i: api.post(SCHEDULES_PATH, bodies[i]).ok,
+                        len(bodies), concurrency,
+                        lambda: ApiClient(api_base_url),
+                        name=f"schedules.create.c{concurrency}",
+                    )
+                    create_latencies += latencies
+                    create_errors += errors
+                    week_times.append(wall_time)
+                    # What the admin page reloads after every save
+                    list_sizes.append(timed_get(client, SCHEDULES_PATH))
+
+                created = schedules_in(client, first_day, last_day)
+                latencies, update_errors, update_wall = run_load(
+                    lambda api, i: api.put(f"{SCHEDULES_PATH}/{created[i]['scheduleId']}", update_body(created[i])).ok,
+                    len(created), concurrency,
+                    lambda: ApiClient(api_base_url),
+                    name=f"schedules.update.c{concurrency}",
+                )
+                update_summary = summarize(latencies, update_wall, update_errors)
+                updated = {s["scheduleId"]: s["totalSlots"] for s in schedules_in(client, first_day, last_day)}
+                stale = [s["scheduleId"] for s in created if updated.get(s["scheduleId"]) != s["totalSlots"] + 5]
+
+                latencies, delete_errors, delete_wall = delete_schedules(
+                    api_base_url, [s["scheduleId"] for s in created], concurrency,
+                    name=f"schedules.delete.c{concurrency}",
+                )
+                levels[concurrency] = {
+                    "create": summarize(create_latencies, sum(week_times), create_errors),
+                    "update": update_summary,
+                    "delete": summarize(latencies, delete_wall, delete_errors),
+                    "week_times": week_times,
+                    "list_sizes": list_sizes,
+                    "created": len(created),
+                    "stale": stale,
+                }
+        finally:
+            client.close()
+
+        week_size = len(doctor_ids) * 7 * len(ROSTER_SESSIONS)
+        print(f"\nRoster: {len(doctor_ids)} doctors x 7 days x {len(ROSTER_SESSIONS)} sessions "
+              f"= {week_size} schedules per week, {ROSTER_WEEKS} weeks per level")
+        print(f"Doctor picker (GET doctors, {len(doctors)} doctors): {picker.elapsed * 1000:.1f}ms")
+        for concurrency, level in levels.items():
+            print_report(f"Schedule operations - concurrency {concurrency}", [
+                (f"create ({level['created']} created)", level["create"]),
+                ("update", level["update"]),
+                ("delete", level["delete"]),
+            ])
+            week_times = level["week_times"]
+            print(f"Publish one week: mean {sum(week_times) / len(week_times):.1f}s, "
+                  f"max {max(week_times):.1f}s ({week_size / (sum(week_times) / len(week_times)):.0f} schedules/s)")
+            print("GET list after each week: " + ", ".join(
+                f"{rows} rows {ms:.0f}ms" for ms, rows in level["list_sizes"]))
+
+        for concurrency, level in levels.items():
+            for operation in ("create", "update", "delete"):
+                assert level[operation]["errors"] == 0, (
+                    f"{level[operation]['errors']} schedule {operation}s failed at concurrency {concurrency}"
+                )
+            assert level["created"] == week_size * ROSTER_WEEKS, (
+                f"Expected {week_size * ROSTER_WEEKS} schedules at concurrency {concurrency}, listed {level['created']}"
+            )
+            assert not level["stale"], f"Updates not visible for schedules {level['stale'][:10]}"
+
+    def test_ui_bulk_edit(self, driver, base_url, api_base_url):
+        """Create then edit schedules through the admin Schedules page, one form save each."""
+        client = ApiClient(api_base_url)
+        try:
+            doctors = client.get(f"{SCHEDULES_PATH}/doctors").json() or []
+        except OSError as e:
+            pytest.skip(f"Backend not reachable at {api_base_url}: {str(e)}")
+        if not doctors:
+            pytest.skip("No doctors to schedule")
+        if not login_user(driver, base_url, ADMIN_USER):
+            pytest.skip("Failed to log in as admin")
+
+        # One day per doctor after the API roster range, so both tests can run together
+        first_day = datetime.date.today() + datetime.timedelta(days=START_DAYS + 7 * ROSTER_WEEKS)
+        bodies = [
+            {
+                "doctorId": doctors[i % len(doctors)]["doctorId"],
+                "scheduleDate": (first_day + datetime.timedelta(days=i // len(doctors))).isoformat(),
+                "startTime": ROSTER_SESSIONS[0][0],
+                "endTime": ROSTER_SESSIONS[0][1],
+                "totalSlots": SLOTS,
+            }
+            for i in range(UI_OPS)
+        ]
+        last_day = first_day + datetime.timedelta(days=(UI_OPS - 1) // len(doctors))
+        timeout = 30
+        create_latencies, update_latencies, failures = [], [], []
+        created = []
+        try:
+            driver.get(f"{base_url}/admin/schedules")
+            WebDriverWait(driver, timeout).until(
+                EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Add New Schedule')]"))
+            )
+            for body in bodies:
+                rows_before = len(driver.find_elements(By.CSS_SELECTOR, ROW_SELECTOR))
+                start = time.perf_counter()
+                try:
+                    form = open_schedule_form(driver, "//button[contains(text(), 'Add New Schedule')]", timeout)
+                    fill_schedule_form(driver, form, body)
+                    # Saved once the reloaded list shows the new row
+                    WebDriverWait(driver, timeout).until(
+                        lambda d: len(d.find_elements(By.CSS_SELECTOR, ROW_SELECTOR)) > rows_before
+                    )
+                    create_latencies.append(time.perf_counter() - start)
+                except Exception as e:
+                    failures.append(f"create: {str(e)}")
+
+            created = schedules_in(client, first_day, last_day)
+            for schedule in created:
+                body = update_body(schedule)
+                row_xpath = f"//tr[@data-schedule-id='{schedule['scheduleId']}']"
+                start = time.perf_counter()
+                try:
+                    form = open_schedule_form(driver, row_xpath + "//button[contains(@class, 'btn-edit')]", timeout)
+                    fill_schedule_form(driver, form, body)
+                    WebDriverWait(driver, timeout).until(EC.text_to_be_present_in_element(
+                        (By.XPATH, row_xpath + "/td[5]"), str(body["totalSlots"])
+                    ))
+                    update_latencies.append(time.perf_counter() - start)
+                except Exception as e:
+                    failures.append(f"update {schedule['scheduleId']}: {str(e)}")
+        finally:
+            leftover = [s["scheduleId"] for s in schedules_in(client, first_day, last_day)]
+            if leftover:
+                delete_schedules(api_base_url, leftover)
+            client.close()
+
+        create_summary = summarize(create_latencies)
+        update_summary = summarize(update_latencies)
+        print_report("Admin Schedules page (one form save per schedule)", [
+            ("ui create", create_summary),
+            ("ui update", update_summary),
+        ])
+        week_size = len(doctors) * 7 * len(ROSTER_SESSIONS)
+        if create_latencies:
+            projected = create_summary["mean_ms"] / 1000 * week_size
+            print(f"Projected time to publish one week by hand ({week_size} schedules): "
+                  f"{projected / 60:.1f} min of saves alone")
+        for failure in failures[:10]:
+            print(f"  {failure}")
+
+        assert not failures, f"{len(failures)} UI schedule operations failed"
+        assert len(created) == UI_OPS, f"Created {UI_OPS} schedules in the UI, {len(created)} listed"
@@ -7,12 +7,13 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 from conftest import login_user
+from form_fill import fill_form
 
 
 class TestAppointmentBooking:
     """Appointment booking workflow tests."""
     
-    def test_navigate_to_booking_page(self, driver, base_url, test_user):
+    def test_navigate_to_booking_page(self, driver, base_url, test_user, locate):
         """Test navigating to doctor booking page."""
         # Login first
         if not login_user(driver, base_url, test_user):
@@ -23,9 +24,7 @@ class TestAppointmentBooking:
         
         try:
             # Find a doctor card or booking button
-            book_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Book Now')]"))
-            )
+            book_button = locate.find("book_now", clickable=True)
             book_button.click()
             time.sleep(2)
             
@@ -34,7 +33,7 @@ class TestAppointmentBooking:
         except Exception as e:
             pytest.skip(f"Booking button not found: {str(e)}")
     
-    def test_select_appointment_date(self, driver, base_url):
+    def test_select_appointment_date(self, driver, base_url, locate):
         """Test selecting appointment date."""
         # Assuming we're on the booking page
         driver.get(f"{base_url}/book-appointment/1")
@@ -42,14 +41,12 @@ class TestAppointmentBooking:
         
         try:
             # Find date picker
-            date_picker = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//input[@type='date'] | //button[@class='date-picker']"))
-            )
+            date_picker = locate.find("date_picker")
             date_picker.click()
             time.sleep(1)
             
             # Select a future date (e.g., 5 days from now)
-            future_date_button = driver.find_element(By.XPATH, "//button[@class='date-available']")
+            future_date_button = locate.find("date_available", clickable=True)
             future_date_button.click()
             time.sleep(1)
             
@@ -59,27 +56,23 @@ class TestAppointmentBooking:
         except Exception as e:
             pytest.skip(f"Date picker not available: {str(e)}")
     
-    def test_select_appointment_time_slot(self, driver, base_url):
+    def test_select_appointment_time_slot(self, driver, base_url, locate):
         """Test selecting appointment time slot."""
         driver.get(f"{base_url}/book-appointment/1")
         time.sleep(2)
         
         try:
             # First select a date
-            date_picker = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//input[@type='date'] | //button[@class='date-picker']"))
-            )
+            date_picker = locate.find("date_picker")
             date_picker.click()
             time.sleep(1)
             
-            future_date = driver.find_element(By.XPATH, "//button[@class='date-available']")
+            future_date = locate.find("date_available", clickable=True)
             future_date.click()
             time.sleep(1)
             
             # Select time slot
-            time_slot = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[@class='time-slot'] | //div[@class='time-slot-available']"))
-            )
+            time_slot = locate.find("time_slot", clickable=True)
             time_slot.click()
             time.sleep(1)
             
@@ -95,37 +88,27 @@ class TestAppointmentBooking:
         time.sleep(2)
         
         try:
-            # Fill patient name
+            # Fill patient name, NIC, email and contact in one call
             name_input = WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.XPATH, "//input[@placeholder='Patient Name' or @name='patientName']"))
             )
-            name_input.clear()
-            name_input.send_keys("John Doe")
-            
-            # Fill NIC
-            nic_input = driver.find_element(By.XPATH, "//input[@placeholder='NIC' or @name='nic']")
-            nic_input.clear()
-            nic_input.send_keys("123456789V")
-            
-            # Fill email
-            email_input = driver.find_element(By.XPATH, "//input[@type='email' or @name='email']")
-            email_input.clear()
-            email_input.send_keys("patient@example.com")
-            
-            # Fill contact
-            contact_input = driver.find_element(By.XPATH, "//input[@placeholder='Contact' or @name='contact']")
-            contact_input.clear()
-            contact_input.send_keys("0701234567")
+            values = fill_form(driver, [
+                (name_input, "John Doe"),
+                ((By.XPATH, "//input[@placeholder='NIC' or @name='nic']"), "123456789V"),
+                ((By.XPATH, "//input[@type='email' or @name='email']"), "patient@example.com"),
+                ((By.XPATH, "//input[@placeholder='Contact' or @name='contact']"), "0701234567"),
+            ])
             
             # Verify all fields are filled
-            assert name_input.get_attribute("value") == "John Doe", "Name not filled"
-            assert nic_input.get_attribute("value") == "123456789V", "NIC not filled"
-            assert email_input.get_attribute("value") == "patient@example.com", "Email not filled"
-            assert contact_input.get_attribute("value") == "0701234567", "Contact not filled"
+            name_value, nic_value, email_value, contact_value = values
+            assert name_value == "John Doe", "Name not filled"
+            assert nic_value == "123456789V", "NIC not filled"
+            assert email_value == "patient@example.com", "Email not filled"
+            assert contact_value == "0701234567", "Contact not filled"
         except Exception as e:
             pytest.skip(f"Patient details form not available: {str(e)}")
     
-    def test_booking_confirmation(self, driver, base_url):
+    def test_booking_confirmation(self, driver, base_url, locate):
         """Test booking confirmation flow."""
         driver.get(f"{base_url}/book-appointment/1")
         time.sleep(2)
@@ -137,12 +120,12 @@ class TestAppointmentBooking:
             )
             date_picker.click()
             time.sleep(1)
-            future_date = driver.find_element(By.XPATH, "//button[@class='date-available']")
+            future_date = locate.find("date_available", clickable=True)
             future_date.click()
             time.sleep(1)
             
             # Select time slot
-            time_slot = driver.find_element(By.XPATH, "//button[@class='time-slot']")
+            time_slot = locate.find("time_slot", clickable=True)
             time_slot.click()
             time.sleep(1)
             
@@ -172,35 +155,31 @@ class TestAppointmentBooking:
 class TestAppointmentDetails:
     """Appointment details and history tests."""
     
-    def test_view_appointment_history(self, driver, base_url):
+    def test_view_appointment_history(self, driver, base_url, locate):
         """Test viewing appointment history."""
         driver.get(f"{base_url}/patient/appointments")
         time.sleep(2)
         
         try:
             # Wait for appointments list
-            appointments = WebDriverWait(driver, 10).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//div[@class='appointment-card'] | //div[@class='appointment-item']"))
-            )
+            appointments = locate.find_all("appointment_card")
             assert len(appointments) >= 0, "Appointments list loaded"
         except Exception as e:
             pytest.skip(f"Appointment history not accessible: {str(e)}")
     
-    def test_cancel_appointment(self, driver, base_url):
+    def test_cancel_appointment(self, driver, base_url, locate):
         """Test canceling an appointment."""
         driver.get(f"{base_url}/patient/appointments")
         time.sleep(2)
         
         try:
             # Find cancel button
-            cancel_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Cancel')] | //*[@class='cancel-btn']"))
-            )
+            cancel_button = locate.find("cancel_appointment", clickable=True)
             cancel_button.click()
             time.sleep(1)
             
             # Confirm cancellation in modal
-            confirm_cancel = driver.find_element(By.XPATH, "//button[contains(text(), 'Confirm')] | //button[@class='confirm-cancel']")
+            confirm_cancel = locate.find("confirm_cancel", clickable=True)
             confirm_cancel.click()
             time.sleep(2)
             
@@ -210,23 +189,19 @@ class TestAppointmentDetails:
         except Exception as e:
             pytest.skip(f"Appointment cancellation not available: {str(e)}")
     
-    def test_appointment_details_view(self, driver, base_url):
+    def test_appointment_details_view(self, driver, base_url, locate):
         """Test viewing detailed appointment information."""
         driver.get(f"{base_url}/patient/appointments")
         time.sleep(2)
         
         try:
             # Click on an appointment
-            appointment = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//div[@class='appointment-card'] | //div[@class='appointment-item']"))
-            )
+            appointment = locate.find("appointment_card", clickable=True)
             appointment.click()
             time.sleep(1)
             
             # Verify details are displayed
-            details = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//div[@class='details'] | //div[@class='appointment-details']"))
-            )
+            details = locate.find("appointment_details")
             
             # Check for key details
             doctor_name = details.find_element(By.XPATH, "//*[contains(text(), 'Dr.')]")
@@ -0,0 +1,136 @@
+"""
+Appointment history benchmark with large per-user datasets.
+
+Seeds one dedicated patient with a growing number of appointments (through
+POST /api/Booking) and, at each size, measures:
+  - GET /api/Booking/user response time and payload size
+  - time from navigation until the /appointments list is interactive
+  - scroll jank: long tasks (>50ms main-thread work) while scrolling the list
+
+The results show whether the history view needs server pagination (API time and
+payload) or list virtualization (render time and jank).
+
+Run with:
+    pytest test_appointment_history_benchmark.py --benchmark -s
+
+Tuning (environment variables):
+    BENCH_HISTORY_SIZES       appointment counts to grow the user to (default "1000,5000,20000,50000")
+    BENCH_HISTORY_SAMPLES     API requests measured per size (default 10)
+    BENCH_HISTORY_SCROLLS     viewport-height scroll steps in the browser (default 30)
+    BENCH_CONCURRENCY         concurrent clients used for seeding (default 8)
+"""
+import os
+import time
+
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from api_client import ApiClient
+from bench_utils import run_load, summarize
+from browser_metrics import collect_long_tasks, install_long_task_observer
+from conftest import login_user
+from seed_data import create_schedule, ensure_user, first_doctor_id, seed_bookings
+
+
+HISTORY_SIZES = [int(size) for size in os.getenv("BENCH_HISTORY_SIZES", "1000,5000,20000,50000").split(",")]
+HISTORY_SAMPLES = int(os.getenv("BENCH_HISTORY_SAMPLES", "10"))
+HISTORY_SCROLLS = int(os.getenv("BENCH_HISTORY_SCROLLS", "30"))
+CONCURRENCY = int(os.getenv("BENCH_CONCURRENCY", "8"))
+
+HISTORY_USER = {
+    "email": "history-bench@example.com",
+    "password": "HistoryBench123!",
+    "firstName": "History",
+    "lastName": "Bench",
+}
+
+
+def measure_list_rendering(driver, base_url, timeout):
+    """
+    Load /appointments and scroll through it.
+
+    Returns:
+        (interactive_ms, rendered_cards, long_task_count, long_task_total_ms)
+    """
+    driver.get(f"{base_url}/appointments")
+    WebDriverWait(driver, timeout).until(
+        EC.element_to_be_clickable((By.XPATH, "//button[contains(@class, 'btn-sort')]"))
+    )
+    # performance.now() is relative to the start of navigation
+    interactive_ms = driver.execute_script("return performance.now();")
+    cards = driver.execute_script("return document.querySelectorAll('.appointment-card').length;")
+
+    collect_long_tasks(driver)
+    for _ in range(HISTORY_SCROLLS):
+        driver.execute_script("window.scrollBy(0, window.innerHeight);")
+        time.sleep(0.05)
+    long_tasks = collect_long_tasks(driver)
+    return interactive_ms, cards, len(long_tasks), sum(task["duration"] for task in long_tasks)
+
+
+@pytest.mark.benchmark
+class TestAppointmentHistoryBenchmark:
+    """History API and list rendering cost as one user's appointments grow."""
+
+    def test_history_scaling(self, driver, base_url, api_base_url):
+        """Grow one user's history and measure API, render and scroll costs."""
+        client = ApiClient(api_base_url)
+        try:
+            try:
+                token = ensure_user(client, HISTORY_USER)
+            except OSError as e:
+                pytest.skip(f"Backend not reachable at {api_base_url}: {str(e)}")
+            if not token:
+                pytest.skip("Could not log in or register the history benchmark user")
+            doctor_id = first_doctor_id(client)
+            schedule_id = create_schedule(client, doctor_id, total_slots=max(HISTORY_SIZES) * 2) if doctor_id else None
+            if schedule_id is None:
+                pytest.skip("Failed to create a schedule for seeding")
+
+            install_long_task_observer(driver)
+            if not login_user(driver, base_url, HISTORY_USER):
+                pytest.skip("Failed to login in the browser")
+
+            rows = []
+            for target in sorted(HISTORY_SIZES):
+                current = len(client.get("/api/Booking/user").json() or [])
+                if current < target:
+                    seed_bookings(api_base_url, token, schedule_id, target - current, CONCURRENCY, "History Bench")
+
+                sizes = []
+
+                def fetch_history(api, i):
+                    response = api.get("/api/Booking/user")
+                    sizes.append(response.size)
+                    return response.ok
+
+                latencies, errors, wall_time = run_load(
+                    fetch_history,
+                    HISTORY_SAMPLES, 1,
+                    lambda: ApiClient(api_base_url, token=token),
+                    name=f"history.api.{target}",
+                )
+                api_summary = summarize(latencies, wall_time, errors)
+                # Rendering a large list can take far longer than the default waits
+                interactive_ms, cards, long_task_count, long_task_ms = measure_list_rendering(
+                    driver, base_url, timeout=60 + target / 500,
+                )
+                rows.append((target, api_summary, max(sizes) if sizes else 0, interactive_ms, cards,
+                             long_task_count, long_task_ms))
+        finally:
+            client.close()
+
+        print("\n" + "=" * 80)
+        print("Appointment history benchmark")
+        print("=" * 80)
+        print(f"{'appts':>7} {'api p50':>9} {'api p95':>9} {'payload':>10} {'interactive':>12} "
+              f"{'cards':>7} {'long tasks':>11} {'jank':>9}")
+        for target, api_summary, payload, interactive_ms, cards, long_task_count, long_task_ms in rows:
+            print(f"{target:>7} {api_summary['p50_ms']:>7.1f}ms {api_summary['p95_ms']:>7.1f}ms "
+                  f"{payload / 1024:>8.1f}KB {interactive_ms:>10.0f}ms {cards:>7} "
+                  f"{long_task_count:>11} {long_task_ms:>7.0f}ms")
+
+        for target, api_summary, *_ in rows:
+            assert api_summary["errors"] == 0, f"History API failed at {target} appointments"
@@ -0,0 +1,203 @@
+"""
+Throughput and latency of the auth endpoints (POST /api/Auth/login,
+register, forgot-password and reset-password) at several concurrency levels.
+
+login_user goes through this path for nearly every UI test. AuthService hashes
+passwords with PBKDF2-SHA256 (100k iterations), which is CPU-bound, so the
+share of hashing and JWT issuance is isolated by comparing three logins that
+stop at different points in AuthService.LoginLocalAsync / AuthController:
+
+    unknown email    user lookup only
+    wrong password   lookup + PBKDF2 verify
+    valid login      lookup + PBKDF2 verify + JWT issuance
+
+hashing ~ wrong - unknown and JWT ~ valid - wrong (p50s at one concurrency).
+Since PBKDF2 cost is linear in its iteration count, the measured hashing time
+is projected to other iteration counts to show the login latency and the
+CPU-bound login throughput each setting would give.
+
+Resetting a password needs the token the backend prints when SMTP is not
+configured: point BENCH_BACKEND_LOG at the file the backend's console output
+goes to. Without it only invalid-token resets are measured.
+
+Run with:
+    pytest test_auth_benchmark.py --benchmark -s
+
+Tuning (environment variables):
+    BENCH_AUTH_CONCURRENCY         concurrency levels (default "1,4,8,16,32")
+    BENCH_AUTH_REQUESTS            requests per endpoint and level (default 200)
+    BENCH_AUTH_REGISTERS           registrations per level (default 40)
+    BENCH_AUTH_USERS               accounts the logins rotate over (default 20)
+    BENCH_AUTH_SLA_CONCURRENCY     concurrency the login SLA applies at (default 8)
+    BENCH_AUTH_MAX_LOGIN_P95_MS    login p95 SLA (default 1000)
+    BENCH_AUTH_HASH_ITERATIONS     PBKDF2 iterations in AuthService (default 100000)
+    BENCH_AUTH_PROJECT_ITERATIONS  iteration counts to project (default "50000,100000,210000,600000")
+    BENCH_BACKEND_LOG              backend console log, to read password reset tokens
+"""
+import os
+import re
+import time
+
+import pytest
+
+from api_client import ApiClient
+from bench_utils import print_report, run_load, summarize
+from seed_data import ensure_user
+
+
+CONCURRENCY_LEVELS = [int(level) for level in os.getenv("BENCH_AUTH_CONCURRENCY", "1,4,8,16,32").split(",")]
+REQUESTS = int(os.getenv("BENCH_AUTH_REQUESTS", "200"))
+REGISTERS = int(os.getenv("BENCH_AUTH_REGISTERS", "40"))
+USERS = int(os.getenv("BENCH_AUTH_USERS", "20"))
+SLA_CONCURRENCY = int(os.getenv("BENCH_AUTH_SLA_CONCURRENCY", "8"))
+MAX_LOGIN_P95_MS = float(os.getenv("BENCH_AUTH_MAX_LOGIN_P95_MS", "1000"))
+HASH_ITERATIONS = int(os.getenv("BENCH_AUTH_HASH_ITERATIONS", "100000"))
+PROJECT_ITERATIONS = [
+    int(count) for count in os.getenv("BENCH_AUTH_PROJECT_ITERATIONS", "50000,100000,210000,600000").split(",")
+]
+BACKEND_LOG = os.getenv("BENCH_BACKEND_LOG")
+
+PASSWORD = "AuthBench123!"
+RESET_TOKEN_RE = re.compile(r"Password reset token for (\S+): (\S+)")
+
+
+def bench_user(index):
+    return {"email": f"auth-bench-{index}@example.com", "password": PASSWORD,
+            "firstName": "Auth", "lastName": "Bench", "nic": f"{198000000000 + index}"}
+
+
+def post_status(path, body_for, expected_status):
+    """run_load task posting body_for(index) and succeeding on `expected_status`."""
+    return lambda client, i: client.post(path, body_for(i)).status == expected_status
+
+
+def measure(api_base_url, name, task, total, concurrency):
+    latencies, errors, wall_time = run_load(
+        task, total, concurrency, lambda: ApiClient(api_base_url), name=f"auth.{name}.c{concurrency}",
+    )
+    return summarize(latencies, wall_time, errors)
+
+
+def reset_tokens_since(offset, emails):
+    """Latest reset token per email printed to BENCH_BACKEND_LOG after byte `offset`."""
+    tokens = {}
+    with open(BACKEND_LOG, encoding="utf-8", errors="replace") as log:
+        log.seek(offset)
+        for line in log:
+            match = RESET_TOKEN_RE.search(line)
+            if match and match.group(1) in emails:
+                tokens[match.group(1)] = match.group(2)
+    return tokens
+
+
+def measure_valid_resets(api_base_url, users, concurrency):
+    """Request a reset for every bench user, then redeem the tokens concurrently."""
+    offset = os.path.getsize(BACKEND_LOG)
+    with ApiClient(api_base_url) as client:
+        for user in users:
+            client.post("/api/Auth/forgot-password", {"email": user["email"]})
+    time.sleep(1)  # let the backend flush its console output
+    tokens = list(reset_tokens_since(offset, {user["email"] for user in users}).values())
+    if not tokens:
+        return None
+    # Reset to the same password so the login phases keep working
+    return measure(
+        api_base_url, "reset.valid",
+        post_status("/api/Auth/reset-password", lambda i: {"token": tokens[i], "newPassword": PASSWORD}, 200),
+        len(tokens), min(concurrency, len(tokens)),
+    )
+
+
+@pytest.mark.benchmark
+class TestAuthBenchmark:
+    """Login, register and password reset cost under concurrency."""
+
+    def test_auth_throughput_and_hashing_share(self, api_base_url):
+        """Measure every auth endpoint per concurrency level and split login time."""
+        users = [bench_user(index) for index in range(USERS)]
+        try:
+            with ApiClient(api_base_url) as client:
+                for user in users:
+                    if not ensure_user(client, user):
+                        pytest.skip(f"Could not log in or register {user['email']}")
+        except OSError as e:
+            pytest.skip(f"Backend not reachable at {api_base_url}: {str(e)}")
+
+        run_id = int(time.time())
+        results = {}
+        for concurrency in CONCURRENCY_LEVELS:
+            phases = {
+                "login.valid": (post_status(
+                    "/api/Auth/login", lambda i: {"email": users[i % USERS]["email"], "password": PASSWORD}, 200,
+                ), REQUESTS),
+                "login.wrong_password": (post_status(
+                    "/api/Auth/login", lambda i: {"email": users[i % USERS]["email"], "password": "Wrong123!"}, 401,
+                ), REQUESTS),
+                "login.unknown_email": (post_status(
+                    "/api/Auth/login", lambda i: {"email": f"auth-bench-missing-{i}@example.com", "password": PASSWORD}, 401,
+                ), REQUESTS),
+                "register": (post_status("/api/Auth/register", lambda i: {
+                    "name": "Auth Bench",
+                    "email": f"auth-bench-{run_id}-{concurrency}-{i}@example.com",
+                    "password": PASSWORD,
+                    "nic": f"{(run_id * 10000 + concurrency * 1000 + i) % 10 ** 12:012d}",
+                    "phone": "0701234567",
+                }, 200), REGISTERS),
+                "forgot.existing": (post_status(
+                    "/api/Auth/forgot-password", lambda i: {"email": users[i % USERS]["email"]}, 200,
+                ), REQUESTS),
+                "forgot.unknown": (post_status(
+                    "/api/Auth/forgot-password", lambda i: {"email": f"auth-bench-missing-{i}@example.com"}, 200,
+                ), REQUESTS),
+                "reset.invalid_token": (post_status(
+                    "/api/Auth/reset-password", lambda i: {"token": f"invalid-{run_id}-{i}", "newPassword": PASSWORD}, 400,
+                ), REQUESTS),
+            }
+            level = {name: measure(api_base_url, name, task, total, concurrency)
+                     for name, (task, total) in phases.items()}
+            if BACKEND_LOG:
+                valid_resets = measure_valid_resets(api_base_url, users, concurrency)
+                if valid_resets is not None:
+                    level["reset.valid"] = valid_resets
+            results[concurrency] = level
+            print_report(f"Auth endpoints - concurrency {concurrency}", sorted(level.items()))
+
+        if not BACKEND_LOG:
+            print("\nBENCH_BACKEND_LOG not set: valid password resets were not measured")
+
+        print("\n" + "=" * 80)
+        print("Login time split (p50)")
+        print("=" * 80)
+        print(f"{'conc':>5} {'login':>9} {'lookup':>9} {'hashing':>9} {'jwt':>9} {'hash share':>11} {'logins/s':>9}")
+        splits = {}
+        for concurrency, level in results.items():
+            valid = level["login.valid"]["p50_ms"]
+            wrong = level["login.wrong_password"]["p50_ms"]
+            unknown = level["login.unknown_email"]["p50_ms"]
+            hashing, jwt = max(0.0, wrong - unknown), max(0.0, valid - wrong)
+            splits[concurrency] = (valid, hashing)
+            print(f"{concurrency:>5} {valid:>7.1f}ms {unknown:>7.1f}ms {hashing:>7.1f}ms {jwt:>7.1f}ms "
+                  f"{(hashing / valid if valid else 0):>10.0%} {level['login.valid']['throughput']:>9.1f}")
+
+        # Service time without queueing comes from the lowest concurrency
+        base_login, base_hashing = splits[min(splits)]
+        best_throughput = max(level["login.valid"]["throughput"] for level in results.values())
+        # How many hashes the backend ran in parallel at its best throughput
+        parallel_hashes = best_throughput * base_hashing / 1000.0
+        print("\nProjected login cost per PBKDF2 iteration count (hashing scales linearly):")
+        print(f"{'iterations':>11} {'login p50':>10} {'max logins/s':>13}")
+        for iterations in PROJECT_ITERATIONS:
+            hashing = base_hashing * iterations / HASH_ITERATIONS
+            ceiling = (parallel_hashes * 1000.0 / hashing) if hashing else float("inf")
+            print(f"{iterations:>11} {base_login - base_hashing + hashing:>8.1f}ms {ceiling:>13.1f}")
+
+        for concurrency, level in results.items():
+            for name, summary in level.items():
+                assert summary["errors"] == 0, (
+                    f"{name} at concurrency {concurrency}: {summary['errors']} unexpected responses"
+                )
+        if SLA_CONCURRENCY in results:
+            login_p95 = results[SLA_CONCURRENCY]["login.valid"]["p95_ms"]
+            assert login_p95 <= MAX_LOGIN_P95_MS, (
+                f"Login p95 {login_p95:.0f}ms at concurrency {SLA_CONCURRENCY} exceeds {MAX_LOGIN_P95_MS:.0f}ms"
+            )
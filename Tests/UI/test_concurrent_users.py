@@ -0,0 +1,64 @@
+"""
+Concurrent real-browser load: SCENARIO_USERS headless browsers, each a
+distinct patient, run the search, booking and profile journeys at once
+(see scenario_runner.py).
+
+Run with:
+    SCENARIO_USERS=20 pytest test_concurrent_users.py --benchmark -s
+
+Tuning (environment variables, on top of scenario_runner's):
+    SCENARIO_MAX_FAILURE_RATE     allowed failed journeys (default 0.05)
+    SCENARIO_MAX_JOURNEY_P95_MS   allowed p95 of any journey (default 15000)
+"""
+import os
+
+import pytest
+
+from api_client import ApiClient
+from scenario_runner import HOT_SLOTS, ITERATIONS, USERS, print_scenario_report, run_scenario
+
+
+MAX_FAILURE_RATE = float(os.getenv("SCENARIO_MAX_FAILURE_RATE", "0.05"))
+MAX_JOURNEY_P95_MS = float(os.getenv("SCENARIO_MAX_JOURNEY_P95_MS", "15000"))
+
+
+@pytest.mark.benchmark
+class TestConcurrentUsers:
+    """Journey latency and slot contention with many browsers at once."""
+
+    def test_concurrent_patient_journeys(self, base_url, api_base_url):
+        """Run the multi-user scenario and check failures, latency and overbooking."""
+        try:
+            with ApiClient(api_base_url) as client:
+                client.get("/api/Doctors")
+        except OSError as e:
+            pytest.skip(f"Backend not reachable at {api_base_url}: {str(e)}")
+
+        try:
+            report = run_scenario(base_url, api_base_url, USERS, ITERATIONS, HOT_SLOTS)
+        except RuntimeError as e:
+            pytest.skip(f"Scenario could not be prepared: {str(e)}")
+        print_scenario_report(report)
+
+        attempted = sum(s["count"] for s in report["journeys"].values()) + sum(report["failures"].values())
+        if not report["journeys"]:
+            pytest.skip(f"No journey completed - check the frontend: {report['failures']}")
+        failure_rate = sum(report["failures"].values()) / float(attempted)
+        assert failure_rate <= MAX_FAILURE_RATE, (
+            f"{failure_rate:.1%} of journeys failed (max {MAX_FAILURE_RATE:.1%}): {report['failures']}"
+        )
+
+        for name, summary in report["journeys"].items():
+            assert summary["p95_ms"] <= MAX_JOURNEY_P95_MS, (
+                f"{name} p95 {summary['p95_ms']:.0f}ms exceeds {MAX_JOURNEY_P95_MS:.0f}ms "
+                f"with {report['users']} concurrent browsers"
+            )
+
+        contention = report["contention"]
+        assert contention["oversold"] == 0, (
+            f"Schedule {contention['schedule_id']} oversold by {contention['oversold']} "
+            f"({contention['booked']} bookings for {contention['slots']} slots)"
+        )
+        assert not contention["lost_updates"], (
+            f"{contention['lost_updates']} concurrent bookings did not decrement the available slots"
+        )
@@ -7,12 +7,13 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 from conftest import login_user
+from locators import CARD_CLASS
 
 
 class TestDoctorSearch:
     """Doctor search functionality tests."""
     
-    def test_doctor_search_page_loads(self, driver, base_url, test_user):
+    def test_doctor_search_page_loads(self, driver, base_url, test_user, locate):
         """Test that the doctor search/find page loads successfully."""
         # Login first
         if not login_user(driver, base_url, test_user):
@@ -23,14 +24,12 @@ class TestDoctorSearch:
         
         # Check if search elements are visible
         try:
-            search_input = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//input[@placeholder='Search doctors...']"))
-            )
+            search_input = locate.find("doctor_search_input")
             assert search_input is not None, "Search input not found"
         except Exception as e:
             pytest.skip(f"Doctor search page not accessible: {str(e)}")
     
-    def test_search_doctor_by_name(self, driver, base_url, test_user):
+    def test_search_doctor_by_name(self, driver, base_url, test_user, locate):
         """Test searching for doctor by name."""
         # Login first
         if not login_user(driver, base_url, test_user):
@@ -41,26 +40,22 @@ class TestDoctorSearch:
         
         try:
             # Find and fill search input
-            search_input = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//input[@placeholder='Search doctors...']"))
-            )
+            search_input = locate.find("doctor_search_input")
             search_input.send_keys("John")
             time.sleep(1)
             
             # Click search button
-            search_button = driver.find_element(By.XPATH, "//button[contains(text(), 'Search')]")
+            search_button = locate.find("doctor_search_button", clickable=True)
             search_button.click()
             time.sleep(2)
             
             # Wait for results - doctor cards should appear
-            results = WebDriverWait(driver, 10).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//div[@class='card'][.//button[contains(text(), 'Book Now')]]"))
-            )
+            results = locate.find_all("doctor_card")
             assert len(results) > 0, "No doctor results found"
         except Exception as e:
             pytest.skip(f"Doctor search failed: {str(e)}")
     
-    def test_filter_by_specialization(self, driver, base_url, test_user):
+    def test_filter_by_specialization(self, driver, base_url, test_user, locate):
         """Test filtering doctors by specialization."""
         # Login first
         if not login_user(driver, base_url, test_user):
@@ -87,17 +82,17 @@ class TestDoctorSearch:
                 time.sleep(2)
                 
                 # Click search button to apply filter
-                search_button = driver.find_element(By.XPATH, "//button[contains(text(), 'Search')]")
+                search_button = locate.find("doctor_search_button", clickable=True)
                 search_button.click()
                 time.sleep(2)
                 
                 # Verify results are filtered
-                results = driver.find_elements(By.XPATH, "//div[@class='card'][.//button[contains(text(), 'Book Now')]]")
+                results = locate.find_all("doctor_card")
                 assert len(results) >= 0, "Filter did not work"
         except Exception as e:
             pytest.skip(f"Specialization filter not available: {str(e)}")
     
-    def test_doctor_details_modal(self, driver, base_url, test_user):
+    def test_doctor_details_modal(self, driver, base_url, test_user, locate):
         """Test opening doctor details modal."""
         # Login first
         if not login_user(driver, base_url, test_user):
@@ -108,9 +103,7 @@ class TestDoctorSearch:
         
         try:
             # Wait for first doctor card button to be clickable (Book Now button)
-            book_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Book Now')]"))
-            )
+            book_button = locate.find("book_now", clickable=True)
             book_button.click()
             time.sleep(2)
             
@@ -131,7 +124,7 @@ class TestDoctorSearch:
         try:
             # Find favorite button - look for icon in doctor cards
             favorite_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//div[@class='card'][.//button[contains(text(), 'Book Now')]]//*[contains(text(), '★') or contains(text(), '☆')]"))
+                EC.element_to_be_clickable((By.XPATH, f"//div[{CARD_CLASS}][.//button[contains(text(), 'Book Now')]]//*[contains(text(), '★') or contains(text(), '☆')]"))
             )
             
             # Click favorite button
@@ -147,7 +140,7 @@ class TestDoctorSearch:
 class TestDoctorSortAndFilter:
     """Doctor sorting and filtering tests."""
     
-    def test_sort_by_rating(self, driver, base_url, test_user):
+    def test_sort_by_rating(self, driver, base_url, test_user, locate):
         """Test sorting doctors by rating."""
         # Login first
         if not login_user(driver, base_url, test_user):
@@ -158,15 +151,13 @@ class TestDoctorSortAndFilter:
         
         try:
             # Doctor cards should be displayed
-            doctors = WebDriverWait(driver, 10).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//div[@class='card'][.//button[contains(text(), 'Book Now')]]"))
-            )
+            doctors = locate.find_all("doctor_card")
             assert len(doctors) > 0, "No doctors found"
         except Exception as e:
             pytest.skip(f"Sort functionality not available: {str(e)}")
     
     
-    def test_search_clear(self, driver, base_url, test_user):
+    def test_search_clear(self, driver, base_url, test_user, locate):
         """Test clearing search."""
         # Login first
         if not login_user(driver, base_url, test_user):
@@ -176,9 +167,7 @@ class TestDoctorSortAndFilter:
         time.sleep(2)
         
         try:
-            search_input = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//input[@placeholder='Search doctors...']"))
-            )
+            search_input = locate.find("doctor_search_input")
             search_input.send_keys("Test")
             time.sleep(1)
             
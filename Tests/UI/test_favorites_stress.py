@@ -0,0 +1,175 @@
+"""
+Favorites toggle stress test: throughput, latency and final-state consistency.
+
+API side: many concurrent clients of one patient toggle the same doctor
+(POST/DELETE /api/Favorites/{doctorId}) as fast as they can, then the final
+state is checked for consistency (no duplicate favorite rows, check/{id}
+agrees with the favorites list, explicit add/remove still work).
+
+UI side: the favorite button on a doctor card is clicked rapidly; the number
+of clicks is compared with the API calls actually sent (the button disables
+itself while a request is in flight, which coalesces clicks) and the final
+icon state is compared with the backend. The per-card GET check/{doctorId}
+calls made while rendering the doctor grid are counted and flagged.
+
+Run with:
+    pytest test_favorites_stress.py --benchmark -s
+
+Tuning (environment variables):
+    BENCH_FAVORITE_TOGGLES    API toggles in total (default 500)
+    BENCH_CONCURRENCY         concurrent API clients (default 8)
+    BENCH_FAVORITE_CLICKS     rapid UI clicks (default 20)
+"""
+import os
+import random
+import threading
+import time
+import warnings
+from collections import Counter
+from urllib.parse import urlsplit
+
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from api_client import ApiClient
+from bench_utils import format_summary, print_report, run_load, summarize
+from conftest import login_user
+from network_capture import collect_requests, endpoint_key, install_network_capture, wait_for_network_idle
+from seed_data import ensure_user
+from ui_flows import DOCTOR_CARD_XPATH
+
+
+FAVORITE_TOGGLES = int(os.getenv("BENCH_FAVORITE_TOGGLES", "500"))
+CONCURRENCY = int(os.getenv("BENCH_CONCURRENCY", "8"))
+FAVORITE_CLICKS = int(os.getenv("BENCH_FAVORITE_CLICKS", "20"))
+
+FAVORITE_BUTTON_XPATH = "//button[@title='Add to favorites' or @title='Remove from favorites']"
+CHECK_ENDPOINT = "GET /api/favorites/check/{id}"
+
+
+@pytest.fixture
+def favorites_client(api_base_url, test_user):
+    """Logged-in API client for the test user plus a doctor ID to toggle."""
+    client = ApiClient(api_base_url)
+    try:
+        token = ensure_user(client, test_user)
+    except OSError as e:
+        client.close()
+        pytest.skip(f"Backend not reachable at {api_base_url}: {str(e)}")
+    doctors = client.get("/api/Doctors").json() or []
+    if not token or not doctors:
+        client.close()
+        pytest.skip("Favorites stress needs a test user and at least one doctor")
+    yield client, doctors[0]["doctorId"]
+    client.close()
+
+
+def favorite_state(client, doctor_id):
+    """(check endpoint result, number of rows for the doctor in the favorites list)."""
+    is_favorite = client.get(f"/api/Favorites/check/{doctor_id}").json()["isFavorite"]
+    favorites = client.get("/api/Favorites").json() or []
+    rows = sum(1 for favorite in favorites if favorite["doctor"]["doctorId"] == doctor_id)
+    return is_favorite, rows
+
+
+@pytest.mark.benchmark
+class TestFavoritesStress:
+    """Rapid favorite toggling from the API and the UI."""
+
+    def test_concurrent_api_toggles_stay_consistent(self, api_base_url, favorites_client):
+        """Toggle one doctor from many clients and verify the final state."""
+        client, doctor_id = favorites_client
+        path = f"/api/Favorites/{doctor_id}"
+        latencies = {"POST": [], "DELETE": []}
+        statuses = Counter()
+        lock = threading.Lock()
+
+        def toggle(api, i):
+            method = random.choice(("POST", "DELETE"))
+            response = api.request(method, path)
+            with lock:
+                latencies[method].append(response.elapsed)
+                statuses[f"{method} {response.status}"] += 1
+            # A POST for an existing favorite is rejected with 400 - expected under races
+            return response.ok or (method == "POST" and response.status == 400)
+
+        all_latencies, errors, wall_time = run_load(
+            toggle, FAVORITE_TOGGLES, CONCURRENCY,
+            lambda: ApiClient(api_base_url, token=client.token),
+            name="favorites.toggle",
+        )
+
+        is_favorite, rows = favorite_state(client, doctor_id)
+        print_report(
+            f"Favorites API toggles - doctor {doctor_id}, concurrency {CONCURRENCY}",
+            [
+                ("all toggles", summarize(all_latencies, wall_time, errors)),
+                ("  POST (add)", summarize(latencies["POST"])),
+                ("  DELETE (remove)", summarize(latencies["DELETE"])),
+            ],
+        )
+        print(f"Status codes: {dict(statuses)}")
+        print(f"Final state: check={is_favorite}, rows in list={rows}")
+
+        assert rows <= 1, f"Duplicate favorite rows for doctor {doctor_id}: {rows}"
+        assert is_favorite == (rows == 1), "check/{doctorId} disagrees with the favorites list"
+        assert errors == 0, f"{errors} toggles failed with unexpected status codes: {dict(statuses)}"
+
+        # The endpoints must still converge after the storm
+        client.post(path)
+        assert favorite_state(client, doctor_id) == (True, 1), "Favorite not present after add"
+        client.delete(path)
+        assert favorite_state(client, doctor_id) == (False, 0), "Favorite still present after remove"
+
+    def test_rapid_ui_clicks_coalesce_and_match_backend(self, driver, base_url, test_user, favorites_client):
+        """Click a favorite button rapidly and compare UI, requests and backend."""
+        client, _ = favorites_client
+        install_network_capture(driver)
+        if not login_user(driver, base_url, test_user):
+            pytest.skip("Failed to login")
+
+        driver.get(f"{base_url}/patient")
+        try:
+            cards = WebDriverWait(driver, 10).until(
+                EC.presence_of_all_elements_located((By.XPATH, DOCTOR_CARD_XPATH))
+            )
+        except Exception as e:
+            pytest.skip(f"Doctor grid not available: {str(e)}")
+        wait_for_network_idle(driver)
+
+        # Chatty grid: one check/{doctorId} call per rendered card
+        page_requests = Counter(endpoint_key(r["method"], r["url"]) for r in collect_requests(driver))
+        check_calls = page_requests[CHECK_ENDPOINT]
+        print(f"\nDoctor grid: {len(cards)} cards, {check_calls} {CHECK_ENDPOINT} calls")
+        if check_calls >= len(cards) > 1:
+            warnings.warn(
+                f"Doctor grid makes {check_calls} favorite check calls for {len(cards)} cards "
+                f"(N+1) - the doctor list already carries isFavorite for logged-in users"
+            )
+
+        button = driver.find_element(By.XPATH, DOCTOR_CARD_XPATH + FAVORITE_BUTTON_XPATH)
+        start = time.perf_counter()
+        for _ in range(FAVORITE_CLICKS):
+            # A disabled (in-flight) button ignores clicks - that is the coalescing we measure
+            driver.execute_script("arguments[0].click();", button)
+        wait_for_network_idle(driver)
+        elapsed = time.perf_counter() - start
+
+        toggles = [
+            r for r in collect_requests(driver)
+            if r["method"] in ("POST", "DELETE") and "/api/favorites/" in r["url"].lower()
+        ]
+        print(f"UI: {FAVORITE_CLICKS} clicks -> {len(toggles)} toggle requests in {elapsed * 1000:.0f}ms "
+              f"(coalesced {FAVORITE_CLICKS - len(toggles)})")
+        print(format_summary("  toggle requests", summarize([r["duration"] / 1000 for r in toggles])))
+        assert toggles, "Rapid clicks did not send any favorite requests"
+
+        doctor_id = int(urlsplit(toggles[-1]["url"]).path.rstrip("/").rsplit("/", 1)[-1])
+        ui_is_favorite = button.get_attribute("title") == "Remove from favorites"
+        backend_is_favorite, rows = favorite_state(client, doctor_id)
+        assert rows <= 1, f"Duplicate favorite rows after rapid clicks: {rows}"
+        assert ui_is_favorite == backend_is_favorite, (
+            f"UI shows favorite={ui_is_favorite} but backend has favorite={backend_is_favorite}"
+        )
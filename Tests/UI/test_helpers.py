@@ -0,0 +1,50 @@
+"""
+Offline checks for the suite's own helpers (no browser or backend needed).
+"""
+import os
+
+from results_sink import ResultsWriter, iter_records
+from transaction_export import JsonArrayStream
+
+
+class TestResultsSink:
+    """Results files from interrupted runs stay readable."""
+
+    def test_truncated_gzip_keeps_flushed_records(self, tmp_path):
+        """A .gz cut off after a flush (killed run) yields every flushed record."""
+        path = str(tmp_path / "results.jsonl.gz")
+        writer = ResultsWriter(path)
+        for i in range(500):
+            writer.write("test", f"case-{i}", duration=0.1)
+        writer.flush()
+        flushed_size = os.path.getsize(path)
+        for i in range(10):
+            writer.write("test", f"unflushed-{i}", duration=0.1)
+        writer.close()
+        with open(path, "r+b") as results:
+            results.truncate(flushed_size)
+
+        names = [entry["name"] for entry in iter_records(path)]
+        assert names == [f"case-{i}" for i in range(500)]
+
+
+class TestJsonArrayStream:
+    """Incremental array decoding does not depend on where chunks split."""
+
+    def decode(self, data, chunk_size):
+        decoder = JsonArrayStream()
+        items = []
+        for start in range(0, len(data), chunk_size):
+            items.extend(decoder.feed(data[start:start + chunk_size]))
+        decoder.close()
+        return items
+
+    def test_numbers_split_across_chunks(self):
+        """'[1.5]' fed one byte at a time yields 1.5, not the prefix 1."""
+        assert self.decode(b"[1.5]", 1) == [1.5]
+
+    def test_any_chunk_size(self):
+        data = '[1.5, -2e3, true, null, "a,]", {"x": [1, 2]}, [3], "\u00e9"]'.encode("utf-8")
+        expected = [1.5, -2e3, True, None, "a,]", {"x": [1, 2]}, [3], "\u00e9"]
+        for chunk_size in (1, 2, 3, 7, len(data)):
+            assert self.decode(data, chunk_size) == expected, f"chunk size {chunk_size}"
@@ -0,0 +1,104 @@
+"""
+Request-count and payload budgets for key pages.
+
+Each page is loaded with fetch capture installed and its API calls are
+checked against network_budgets.json, so an N+1 pattern, a duplicated call
+or an over-fetching endpoint fails here before it reaches production. Run
+the whole suite with --network-budgets to check every page any test visits.
+"""
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from conftest import login_user
+
+from network_budgets import budget_for, check_budgets, group_by_page, load_budgets, page_stats
+from network_capture import collect_requests, install_network_capture, wait_for_network_idle
+
+
+def load_page(driver, url, ready_xpath):
+    """Open `url`, wait for `ready_xpath` and for the API calls to settle; returns the calls."""
+    collect_requests(driver)
+    driver.get(url)
+    try:
+        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.XPATH, ready_xpath)))
+    except Exception as e:
+        pytest.skip(f"Page {url} not available: {str(e)}")
+    wait_for_network_idle(driver)
+    return collect_requests(driver)
+
+
+def assert_within_budget(requests, dev_server):
+    budgets = load_budgets()
+    for page, page_requests in sorted(group_by_page(requests).items()):
+        stats = page_stats(page_requests)
+        budget = budget_for(budgets, page, dev_server)
+        print(
+            f"{page:<16} calls={stats['distinct_requests']:>3}/{budget.get('max_requests', '-')} "
+            f"total={stats['total_requests']:>3} bytes={stats['bytes']:>8}/{budget.get('max_bytes', '-')}"
+        )
+
+    violations = check_budgets(requests, budgets, dev_server)
+    assert not violations, "Network budget exceeded:\n" + "\n".join(violations)
+
+
+class TestNetworkBudgets:
+    """API call and payload budgets per page."""
+
+    def test_login_page_budget(self, driver, base_url, dev_frontend):
+        """The login page makes (almost) no API calls."""
+        install_network_capture(driver)
+        requests = load_page(driver, f"{base_url}/login", "//button[contains(text(), 'Sign In')]")
+
+        assert_within_budget(requests, dev_frontend)
+
+    def test_patient_dashboard_budget(self, driver, base_url, test_user, dev_frontend):
+        """The doctor grid stays within its call budget (no new per-card requests)."""
+        install_network_capture(driver)
+        if not login_user(driver, base_url, test_user):
+            pytest.skip("Failed to login")
+        requests = load_page(driver, f"{base_url}/patient", "//button[contains(text(), 'Book Now')]")
+
+        assert_within_budget(requests, dev_frontend)
+
+    def test_booking_page_budget(self, driver, base_url, test_user, dev_frontend):
+        """The booking page does not over-fetch schedules."""
+        install_network_capture(driver)
+        if not login_user(driver, base_url, test_user):
+            pytest.skip("Failed to login")
+        load_page(driver, f"{base_url}/patient", "//button[contains(text(), 'Book Now')]")
+
+        collect_requests(driver)
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Book Now')]"))
+            ).click()
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'booking-container')]"))
+            )
+        except Exception as e:
+            pytest.skip(f"Booking page not available: {str(e)}")
+        wait_for_network_idle(driver)
+
+        assert_within_budget(collect_requests(driver), dev_frontend)
+
+    def test_appointments_page_budget(self, driver, base_url, test_user, dev_frontend):
+        """The appointment history loads in a bounded number of calls."""
+        install_network_capture(driver)
+        if not login_user(driver, base_url, test_user):
+            pytest.skip("Failed to login")
+        requests = load_page(
+            driver, f"{base_url}/appointments",
+            "//button[contains(@class, 'btn-sort')]",
+        )
+
+        assert_within_budget(requests, dev_frontend)
+
+    def test_profile_page_budget(self, driver, base_url, test_user, dev_frontend):
+        """The profile page stays within its call budget."""
+        install_network_capture(driver)
+        if not login_user(driver, base_url, test_user):
+            pytest.skip("Failed to login")
+        requests = load_page(driver, f"{base_url}/account", "//*[contains(text(), '@')] | //input[@type='email']")
+
+        assert_within_budget(requests, dev_frontend)
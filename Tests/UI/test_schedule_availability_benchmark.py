@@ -0,0 +1,150 @@
+"""
+Benchmark for the schedule availability endpoint (GET /api/Schedules/doctor/{doctorId}).
+
+This is the call the booking page makes when a patient clicks "Book Now"
+(see test_navigate_to_booking_page). Doctor popularity is replayed with a
+Zipf distribution so a few "hot" doctors get most of the traffic.
+
+Run with:
+    pytest test_schedule_availability_benchmark.py --benchmark -s
+
+Tuning (environment variables):
+    BENCH_SCHEDULE_REQUESTS  requests per phase (default 2000)
+    BENCH_CONCURRENCY        concurrent API clients (default 8)
+    BENCH_ZIPF_S             Zipf exponent of doctor popularity (default 1.1)
+    BENCH_BOOKINGS           bookings made during the contention phase (default 20)
+"""
+import os
+import threading
+
+import pytest
+
+from api_client import ApiClient, booking_request
+from bench_utils import ZipfSampler, print_report, run_load, summarize
+
+
+SCHEDULE_REQUESTS = int(os.getenv("BENCH_SCHEDULE_REQUESTS", "2000"))
+CONCURRENCY = int(os.getenv("BENCH_CONCURRENCY", "8"))
+ZIPF_S = float(os.getenv("BENCH_ZIPF_S", "1.1"))
+BOOKINGS = int(os.getenv("BENCH_BOOKINGS", "20"))
+MAX_ERROR_RATE = 0.01
+
+
+@pytest.fixture
+def doctor_ids(api_base_url):
+    """IDs of all doctors, skipping the benchmark if the backend is not reachable."""
+    try:
+        with ApiClient(api_base_url) as client:
+            response = client.get("/api/Doctors")
+    except OSError as e:
+        pytest.skip(f"Backend not reachable at {api_base_url}: {str(e)}")
+    if not response.ok or not response.json():
+        pytest.skip("No doctors returned by /api/Doctors")
+    return [doctor["doctorId"] for doctor in response.json()]
+
+
+def fetch_schedules(client, doctor_id):
+    """Call the availability endpoint, returning the response."""
+    return client.get(f"/api/Schedules/doctor/{doctor_id}")
+
+
+@pytest.mark.benchmark
+class TestScheduleAvailabilityBenchmark:
+    """Throughput and latency of doctor schedule lookups under Zipf popularity."""
+
+    def test_schedule_lookup_cold_warm_and_contended(self, api_base_url, doctor_ids, test_user):
+        """Measure cold, warm and booking-contended schedule lookups."""
+        sampler = ZipfSampler(doctor_ids, s=ZIPF_S, seed=42)
+        hot_doctors = set(sampler.head(0.1))
+        rows = []
+
+        # Cold: first touch of every doctor, each over a fresh connection
+        cold_latencies, cold_errors, cold_wall = run_load(
+            lambda client, i: fetch_schedules(client, doctor_ids[i]).ok,
+            len(doctor_ids), 1,
+            lambda: ApiClient(api_base_url, keep_alive=False),
+            name="schedules.cold",
+        )
+        rows.append(("cold (first touch, new conn)", summarize(cold_latencies, cold_wall, cold_errors)))
+
+        # Warm: Zipf replay over keep-alive connections
+        warm_latencies, warm_errors, warm_wall = run_load(
+            lambda client, i: fetch_schedules(client, sampler.sample()).ok,
+            SCHEDULE_REQUESTS, CONCURRENCY,
+            lambda: ApiClient(api_base_url),
+            name="schedules.warm",
+        )
+        warm = summarize(warm_latencies, warm_wall, warm_errors)
+        rows.append(("warm (zipf, keep-alive)", warm))
+
+        # Contended: the same replay while a booker keeps taking slots on hot doctors
+        booker = ApiClient(api_base_url)
+        if not booker.login(test_user["email"], test_user["password"]):
+            booker.close()
+            print_report("Schedule availability benchmark", rows)
+            pytest.skip("Failed to login - contention phase needs a test user")
+
+        stop = threading.Event()
+        booking_latencies = []
+        booking_conflicts = [0]
+        booking_failure = [None]
+        hot_latencies = []
+        tail_latencies = []
+        lock = threading.Lock()
+
+        def book_hot_slots():
+            hot = list(hot_doctors)
+            made = 0
+            try:
+                while not stop.is_set() and made < BOOKINGS:
+                    schedules = fetch_schedules(booker, hot[made % len(hot)]).json() or []
+                    open_slots = [s for s in schedules if s.get("availableSlots", 0) > 0]
+                    made += 1
+                    if not open_slots:
+                        continue
+                    response = booker.post("/api/Booking", booking_request(open_slots[0]["id"], "Benchmark Patient"))
+                    booking_latencies.append(response.elapsed)
+                    if response.status == 409:
+                        booking_conflicts[0] += 1
+            except Exception as e:
+                # Surfaced after join(): without the writer the contended numbers mean nothing
+                booking_failure[0] = e
+
+        def contended_lookup(client, i):
+            doctor_id = sampler.sample()
+            response = fetch_schedules(client, doctor_id)
+            with lock:
+                (hot_latencies if doctor_id in hot_doctors else tail_latencies).append(response.elapsed)
+            return response.ok
+
+        booking_thread = threading.Thread(target=book_hot_slots, daemon=True)
+        booking_thread.start()
+        try:
+            contended_latencies, contended_errors, contended_wall = run_load(
+                contended_lookup, SCHEDULE_REQUESTS, CONCURRENCY,
+                lambda: ApiClient(api_base_url),
+                name="schedules.contended",
+            )
+        finally:
+            stop.set()
+            booking_thread.join(timeout=60)
+            booker.close()
+
+        assert not booking_thread.is_alive(), "Booking thread did not stop within 60s"
+        if booking_failure[0] is not None:
+            raise AssertionError(
+                f"Booking load failed after {len(booking_latencies)} bookings: {booking_failure[0]!r}"
+            ) from booking_failure[0]
+
+        rows.append(("contended (zipf + bookings)", summarize(contended_latencies, contended_wall, contended_errors)))
+        rows.append(("  hot doctors (top 10%)", summarize(hot_latencies)))
+        rows.append(("  tail doctors", summarize(tail_latencies)))
+        rows.append(("  bookings", summarize(booking_latencies, errors=booking_conflicts[0])))
+        print_report(
+            f"Schedule availability benchmark - {len(doctor_ids)} doctors, "
+            f"zipf s={ZIPF_S}, concurrency={CONCURRENCY}",
+            rows,
+        )
+
+        assert warm_errors <= SCHEDULE_REQUESTS * MAX_ERROR_RATE, f"Too many failed lookups: {warm_errors}"
+        assert contended_errors <= SCHEDULE_REQUESTS * MAX_ERROR_RATE, f"Too many failed lookups under bookings: {contended_errors}"
@@ -0,0 +1,108 @@
+"""
+Soak test: repeat the login -> search -> open booking modal -> close modal ->
+logout cycle in one browser for a long time and watch browser memory for
+leaks. Nothing is actually booked or cancelled (the backend has no cancel
+endpoint); the booking modal is opened and dismissed each cycle.
+
+Every SOAK_SAMPLE_EVERY iterations the JS heap (after a forced GC), DOM node
+count, event listener count and Chrome process RSS are sampled. At the end the
+growth per iteration (least-squares slope) of each metric is reported and
+compared against the configured limits. Slopes only mean something when the
+cycles actually ran, so the test also fails when more than
+SOAK_MAX_FAILED_RATIO of them failed part-way.
+
+Run with:
+    pytest test_soak.py --soak -s
+
+Tuning (environment variables):
+    SOAK_MINUTES                  how long to loop (default 60)
+    SOAK_SAMPLE_EVERY             iterations between metric samples (default 10)
+    SOAK_MAX_HEAP_KB_PER_ITER     allowed JS heap growth per iteration (default 50)
+    SOAK_MAX_NODES_PER_ITER       allowed DOM node growth per iteration (default 5)
+    SOAK_MAX_LISTENERS_PER_ITER   allowed listener growth per iteration (default 1)
+    SOAK_MAX_FAILED_RATIO         allowed share of failed cycles (default 0.05)
+"""
+import os
+import time
+from collections import Counter
+
+import pytest
+
+import results_sink
+from bench_utils import linear_slope
+from browser_metrics import sample_browser_metrics
+from ui_flows import booking_cycle
+
+
+SOAK_MINUTES = float(os.getenv("SOAK_MINUTES", "60"))
+SAMPLE_EVERY = int(os.getenv("SOAK_SAMPLE_EVERY", "10"))
+MAX_HEAP_KB_PER_ITER = float(os.getenv("SOAK_MAX_HEAP_KB_PER_ITER", "50"))
+MAX_NODES_PER_ITER = float(os.getenv("SOAK_MAX_NODES_PER_ITER", "5"))
+MAX_LISTENERS_PER_ITER = float(os.getenv("SOAK_MAX_LISTENERS_PER_ITER", "1"))
+MAX_FAILED_RATIO = float(os.getenv("SOAK_MAX_FAILED_RATIO", "0.05"))
+
+
+@pytest.mark.soak
+class TestBookingFlowSoak:
+    """Long-running booking flow memory leak detection."""
+
+    def test_booking_cycle_memory_growth(self, driver, base_url, test_user):
+        """Loop the booking cycle and check memory growth slopes."""
+        deadline = time.monotonic() + SOAK_MINUTES * 60
+        samples = []
+        iteration = 0
+        failed_cycles = 0
+        failed_steps = Counter()
+
+        while time.monotonic() < deadline:
+            timings = booking_cycle(driver, base_url, test_user)
+            iteration += 1
+            if None in timings.values():
+                failed_cycles += 1
+                failed_steps[next(step for step, duration in timings.items() if duration is None)] += 1
+            results_sink.record("soak_cycle", "booking_cycle", iteration=iteration, steps=timings)
+
+            if iteration % SAMPLE_EVERY == 0:
+                # Sample on the same page every time so counts are comparable
+                driver.get(f"{base_url}/patient")
+                time.sleep(2)
+                metrics = sample_browser_metrics(driver)
+                samples.append((iteration, metrics))
+                results_sink.record("soak_sample", "browser_metrics", iteration=iteration, **metrics)
+
+        if len(samples) < 2:
+            pytest.skip(f"Only {iteration} iterations ran - not enough samples to compute growth")
+        if failed_cycles == iteration:
+            pytest.skip("Every booking cycle failed - check the frontend, backend and test user")
+
+        iterations = [i for i, _ in samples]
+        slopes = {
+            name: linear_slope(iterations, [m[name] for _, m in samples])
+            for name in ("js_heap_used", "dom_nodes", "listeners", "rss")
+        }
+
+        print("\n" + "=" * 80)
+        print(f"Soak: {iteration} cycles in {SOAK_MINUTES} min, {failed_cycles} failed, {len(samples)} samples")
+        print("=" * 80)
+        first, last = samples[0][1], samples[-1][1]
+        for name, slope in slopes.items():
+            print(f"{name:<14} first={first[name]} last={last[name]} growth/iter={slope:.2f}")
+        if failed_steps:
+            print(f"failed at: {dict(failed_steps)}")
+
+        failed_ratio = failed_cycles / iteration
+        assert failed_ratio <= MAX_FAILED_RATIO, (
+            f"{failed_cycles}/{iteration} cycles failed ({failed_ratio:.0%}, limit {MAX_FAILED_RATIO:.0%}) - "
+            f"the memory slopes come from mostly idle pages; failed at {dict(failed_steps)}"
+        )
+
+        heap_kb_per_iter = slopes["js_heap_used"] / 1024
+        assert heap_kb_per_iter <= MAX_HEAP_KB_PER_ITER, (
+            f"JS heap grows {heap_kb_per_iter:.1f} KB per cycle (limit {MAX_HEAP_KB_PER_ITER})"
+        )
+        assert slopes["dom_nodes"] <= MAX_NODES_PER_ITER, (
+            f"DOM nodes grow {slopes['dom_nodes']:.2f} per cycle (limit {MAX_NODES_PER_ITER})"
+        )
+        assert slopes["listeners"] <= MAX_LISTENERS_PER_ITER, (
+            f"Event listeners grow {slopes['listeners']:.2f} per cycle (limit {MAX_LISTENERS_PER_ITER})"
+        )
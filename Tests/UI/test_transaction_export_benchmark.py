@@ -0,0 +1,153 @@
+"""
+Transaction listing benchmark at finance-reconciliation scale.
+
+GET /api/admin/AdminTransactions and GET /api/User/transactions return every
+transaction as one JSON array. One dedicated patient is grown to 100k+
+transactions (through POST /api/Booking, one transaction per booking) and at
+each size both listings are read twice (see transaction_export.py):
+
+    buffered   response.read() + json.loads(), as scripts and the frontend do
+    streamed   chunked read, rows decoded and written to a file one at a time
+
+For each, time-to-first-byte, time to the first usable row, time to the last
+row, payload size and peak client heap are reported. A TTFB close to the
+total time means the server materializes the whole list before sending
+anything, so only cursor pagination or a streamed response
+(IAsyncEnumerable) on the server can bring the first row forward.
+
+Run with:
+    pytest test_transaction_export_benchmark.py --benchmark -s
+
+Tuning (environment variables):
+    BENCH_EXPORT_SIZES        transaction counts to grow the user to (default "10000,50000,100000")
+    BENCH_EXPORT_SAMPLES      timed reads per listing, mode and size (default 3)
+    BENCH_EXPORT_BUDGET_MS    full-listing time above which pagination is recommended (default 5000)
+    BENCH_CONCURRENCY         concurrent clients used for seeding (default 8)
+"""
+import os
+import statistics
+
+import pytest
+
+from api_client import ApiClient
+from seed_data import create_schedule, ensure_user, first_doctor_id, seed_bookings
+from transaction_export import (
+    ADMIN_TRANSACTIONS, USER_TRANSACTIONS, export_streamed, fetch_buffered, peak_memory,
+)
+
+
+EXPORT_SIZES = [int(size) for size in os.getenv("BENCH_EXPORT_SIZES", "10000,50000,100000").split(",")]
+EXPORT_SAMPLES = int(os.getenv("BENCH_EXPORT_SAMPLES", "3"))
+EXPORT_BUDGET_MS = float(os.getenv("BENCH_EXPORT_BUDGET_MS", "5000"))
+CONCURRENCY = int(os.getenv("BENCH_CONCURRENCY", "8"))
+
+EXPORT_USER = {
+    "email": "export-bench@example.com",
+    "password": "ExportBench123!",
+    "firstName": "Export",
+    "lastName": "Bench",
+}
+LISTINGS = [("admin", ADMIN_TRANSACTIONS), ("user", USER_TRANSACTIONS)]
+# Seeding and reading 100k rows takes minutes, not the default 30s
+LISTING_TIMEOUT = 600
+
+
+def median_stats(samples):
+    """Per-field median of several export_streamed / fetch_buffered results."""
+    merged = dict(samples[-1])
+    for field in ("ttfb_ms", "first_row_ms", "total_ms"):
+        values = [sample[field] for sample in samples if sample[field] is not None]
+        merged[field] = statistics.median(values) if values else None
+    return merged
+
+
+def measure_listing(client, path, out_path):
+    """
+    Timed buffered and streamed reads of one listing, then one traced pass
+    of each for peak heap.
+
+    Returns:
+        {"buffered": (stats, peak_bytes), "streamed": (stats, peak_bytes)}
+    """
+    buffered = median_stats([fetch_buffered(client, path) for _ in range(EXPORT_SAMPLES)])
+    streamed = median_stats([export_streamed(client, path, out_path) for _ in range(EXPORT_SAMPLES)])
+    _, buffered_peak = peak_memory(fetch_buffered, client, path)
+    _, streamed_peak = peak_memory(export_streamed, client, path, out_path)
+    return {"buffered": (buffered, buffered_peak), "streamed": (streamed, streamed_peak)}
+
+
+@pytest.mark.benchmark
+class TestTransactionExportBenchmark:
+    """Admin and user transaction listings, buffered vs streamed, as rows grow."""
+
+    def test_transaction_listing_scaling(self, api_base_url, tmp_path):
+        """Grow one user's transactions and compare TTFB, full time and client memory."""
+        client = ApiClient(api_base_url, timeout=LISTING_TIMEOUT)
+        try:
+            try:
+                token = ensure_user(client, EXPORT_USER)
+            except OSError as e:
+                pytest.skip(f"Backend not reachable at {api_base_url}: {str(e)}")
+            if not token:
+                pytest.skip("Could not log in or register the export benchmark user")
+            doctor_id = first_doctor_id(client)
+            schedule_id = create_schedule(client, doctor_id, total_slots=max(EXPORT_SIZES) * 2) if doctor_id else None
+            if schedule_id is None:
+                pytest.skip("Failed to create a schedule for seeding")
+
+            rows = []
+            for target in sorted(EXPORT_SIZES):
+                current = export_streamed(client, USER_TRANSACTIONS)["rows"]
+                if current < target:
+                    created, failed = seed_bookings(
+                        api_base_url, token, schedule_id, target - current, CONCURRENCY, "Export Bench"
+                    )
+                    assert current + created >= target, (
+                        f"Seeding reached {current + created} of {target} transactions ({failed} bookings failed)"
+                    )
+                measured = {
+                    listing: measure_listing(client, path, str(tmp_path / f"{listing}.csv"))
+                    for listing, path in LISTINGS
+                }
+                # Label by what the user listing really returned, not by the target
+                size = measured["user"]["streamed"][0]["rows"]
+                rows.extend((size, listing, results) for listing, results in measured.items())
+        finally:
+            client.close()
+
+        print("\n" + "=" * 100)
+        print("Transaction listing benchmark (medians)")
+        print("=" * 100)
+        print(f"{'user tx':>8} {'listing':<7} {'mode':<9} {'rows':>8} {'payload':>9} {'ttfb':>9} "
+              f"{'first row':>10} {'total':>9} {'peak heap':>10}")
+        for size, listing, results in rows:
+            for mode, (stats, peak) in results.items():
+                first_row = f"{stats['first_row_ms']:8.0f}ms" if stats["first_row_ms"] is not None else f"{'-':>10}"
+                print(f"{size:>8} {listing:<7} {mode:<9} {stats['rows']:>8} "
+                      f"{stats['bytes'] / 1024 / 1024:>7.1f}MB {stats['ttfb_ms']:>7.0f}ms {first_row} "
+                      f"{stats['total_ms']:>7.0f}ms {peak / 1024 / 1024:>8.1f}MB")
+
+        largest = max(size for size, _, _ in rows)
+        print(f"\nAt {largest} user transactions:")
+        for size, listing, results in rows:
+            if size != largest:
+                continue
+            streamed = results["streamed"][0]
+            server_share = streamed["ttfb_ms"] / streamed["total_ms"] if streamed["total_ms"] else 0.0
+            advice = []
+            if server_share > 0.5:
+                advice.append(f"{server_share:.0%} of the time passes before the first byte - the server builds "
+                              "the whole list first (stream it or paginate with a cursor)")
+            if streamed["total_ms"] > EXPORT_BUDGET_MS:
+                advice.append(f"full listing takes {streamed['total_ms']:.0f}ms > {EXPORT_BUDGET_MS:.0f}ms budget "
+                              "(cursor pagination)")
+            print(f"  {listing:<6} " + ("; ".join(advice) if advice else "within budget"))
+
+        for size, listing, results in rows:
+            buffered, streamed = results["buffered"][0], results["streamed"][0]
+            assert buffered["status"] == 200 and streamed["status"] == 200, (
+                f"{listing} listing failed at {size} transactions: {buffered['status']}/{streamed['status']}"
+            )
+            assert streamed["rows"] == buffered["rows"], (
+                f"{listing} listing: streamed {streamed['rows']} rows, buffered {buffered['rows']}"
+            )
@@ -7,6 +7,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 
+from form_fill import fill_form
+
 
 class TestUserProfile:
     """User profile management tests."""
@@ -29,40 +31,34 @@ class TestUserProfile:
         except Exception as e:
             pytest.skip(f"Profile link not found: {str(e)}")
     
-    def test_view_profile_information(self, driver, base_url):
+    def test_view_profile_information(self, driver, base_url, locate):
         """Test viewing profile information."""
         driver.get(f"{base_url}/patient/profile")
         time.sleep(2)
         
         try:
             # Check if profile information is displayed
-            email_display = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//*[contains(text(), '@')] | //span[@class='email']"))
-            )
+            email_display = locate.find("profile_email")
             assert email_display is not None, "Profile information not displayed"
         except Exception as e:
             pytest.skip(f"Profile information not accessible: {str(e)}")
     
-    def test_edit_profile(self, driver, base_url):
+    def test_edit_profile(self, driver, base_url, locate):
         """Test editing profile information."""
         driver.get(f"{base_url}/patient/profile")
         time.sleep(2)
         
         try:
             # Find edit button
-            edit_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Edit')] | //*[@class='edit-btn']"))
-            )
+            edit_button = locate.find("edit_profile", clickable=True)
             edit_button.click()
             time.sleep(1)
             
             # Find editable fields
-            first_name_input = driver.find_element(By.XPATH, "//input[@name='firstName' or @placeholder='First Name']")
-            first_name_input.clear()
-            first_name_input.send_keys("UpdatedFirst")
+            fill_form(driver, [((By.XPATH, "//input[@name='firstName' or @placeholder='First Name']"), "UpdatedFirst")])
             
             # Save changes
-            save_button = driver.find_element(By.XPATH, "//button[contains(text(), 'Save')] | //*[@class='save-btn']")
+            save_button = locate.find("save_profile", clickable=True)
             save_button.click()
             time.sleep(2)
             
@@ -74,16 +70,14 @@ class TestUserProfile:
         except Exception as e:
             pytest.skip(f"Profile edit not available: {str(e)}")
     
-    def test_change_password(self, driver, base_url):
+    def test_change_password(self, driver, base_url, locate):
         """Test changing password."""
         driver.get(f"{base_url}/patient/profile")
         time.sleep(2)
         
         try:
             # Find change password section
-            password_section = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//button[contains(text(), 'Change Password')] | //*[@class='password-section']"))
-            )
+            password_section = locate.find("password_section")
             
             if "button" in str(password_section.tag_name).lower():
                 password_section.click()
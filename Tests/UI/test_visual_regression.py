@@ -0,0 +1,97 @@
+"""
+Visual regression checks for key pages.
+
+Each page is compared against a stored baseline with a perceptual-hash fast
+path; the full pixel diff only runs when the hashes differ (see
+visual_regression.py). The first run records the baselines.
+"""
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+import time
+from conftest import login_user
+
+pytest.importorskip("PIL", reason="Pillow is required for visual regression checks")
+from visual_regression import check_screenshot
+
+
+WINDOW_SIZE = (1280, 900)
+
+
+def assert_visual(result):
+    assert result.passed, (
+        f"Visual change on '{result.name}': {result.diff_ratio:.2%} pixels differ "
+        f"(hash distance {result.distance}), screenshot saved to {result.diff_path}"
+    )
+
+
+class TestVisualRegression:
+    """Screenshot comparisons of key pages."""
+
+    def test_login_page_visual(self, driver, base_url):
+        """Login page matches its baseline."""
+        driver.set_window_size(*WINDOW_SIZE)
+        driver.get(f"{base_url}/login")
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.XPATH, "//button[contains(text(), 'Sign In')]"))
+            )
+        except Exception as e:
+            pytest.skip(f"Login page not available: {str(e)}")
+        time.sleep(1)
+
+        assert_visual(check_screenshot(driver, "login"))
+
+    def test_patient_dashboard_visual(self, driver, base_url, test_user):
+        """Patient dashboard matches its baseline (greeting and counters masked)."""
+        driver.set_window_size(*WINDOW_SIZE)
+        if not login_user(driver, base_url, test_user):
+            pytest.skip("Failed to login")
+        driver.get(f"{base_url}/patient")
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.XPATH, "//button[contains(text(), 'Book Now')]"))
+            )
+        except Exception as e:
+            pytest.skip(f"Patient dashboard not available: {str(e)}")
+        time.sleep(1)
+
+        assert_visual(check_screenshot(driver, "patient", mask_selectors=["h1", ".text-xl", ".text-lg"]))
+
+    def test_booking_page_visual(self, driver, base_url, test_user):
+        """Booking page matches its baseline (slot list masked)."""
+        driver.set_window_size(*WINDOW_SIZE)
+        if not login_user(driver, base_url, test_user):
+            pytest.skip("Failed to login")
+        driver.get(f"{base_url}/patient")
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Book Now')]"))
+            ).click()
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'booking-container')]"))
+            )
+        except Exception as e:
+            pytest.skip(f"Booking page not available: {str(e)}")
+        time.sleep(1)
+
+        # Available slots change with every booking
+        assert_visual(check_screenshot(driver, "booking", mask_selectors=[".schedule-list"]))
+
+    def test_profile_page_visual(self, driver, base_url, test_user):
+        """Profile page matches its baseline (field values masked)."""
+        driver.set_window_size(*WINDOW_SIZE)
+        if not login_user(driver, base_url, test_user):
+            pytest.skip("Failed to login")
+        # The profile page is routed at /account (there is no /patient/profile route)
+        driver.get(f"{base_url}/account")
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.XPATH, "//*[contains(text(), '@')] | //input[@type='email']"))
+            )
+        except Exception as e:
+            pytest.skip(f"Profile page not available: {str(e)}")
+        time.sleep(1)
+
+        assert_visual(check_screenshot(driver, "profile", mask_selectors=["input", "h1", "h2"]))
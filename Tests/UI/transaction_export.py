@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Stream transaction listings to a file and compare with buffered reads.
+
+GET /api/admin/AdminTransactions and GET /api/User/transactions return every
+row as one JSON array. Reading that with response.read() + json.loads()
+keeps the raw body and the decoded list in memory at once. This tool reads
+the response in chunks, decodes the array one row at a time and writes each
+row out (CSV or JSON lines, .gz to compress) as soon as it is complete, so
+client memory stays flat however many rows there are.
+
+Both modes report:
+    ttfb       time until the response headers arrived
+    first row  time until the first row was usable
+    total      time until the last row was usable
+    peak       peak Python heap while reading (tracemalloc, in a separate pass
+               so tracing does not slow down the timed pass)
+
+If ttfb is close to total, the server built the whole list before sending a
+byte - streaming on the client alone cannot help, the endpoint needs cursor
+pagination or a streamed response.
+
+Usage:
+    python transaction_export.py admin --out transactions.csv
+    python transaction_export.py admin --search Colombo --out matches.jsonl.gz
+    python transaction_export.py user --email me@example.com --password ... --out mine.csv
+    python transaction_export.py admin --compare
+"""
+import argparse
+import codecs
+import csv
+import getpass
+import gzip
+import io
+import json
+import time
+import tracemalloc
+from urllib.parse import urlencode
+
+from api_client import ApiClient
+
+
+ADMIN_TRANSACTIONS = "/api/admin/AdminTransactions"
+USER_TRANSACTIONS = "/api/User/transactions"
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = " \t\r\n"
+# Items whose closing character ends them; anything else needs a delimiter after it
+SELF_DELIMITED = "{[\""
+
+
+class JsonArrayStream:
+    """
+    Incremental decoder for a top-level JSON array: feed() it chunks of
+    bytes and it returns the items completed so far.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._started = False
+        self.done = False
+
+    def _skip(self, characters):
+        while self._pos < len(self._buffer) and self._buffer[self._pos] in characters:
+            self._pos += 1
+
+    def feed(self, chunk):
+        """Decode `chunk` (bytes) and return the list of completed items."""
+        self._buffer = self._buffer[self._pos:] + self._text.decode(chunk)
+        self._pos = 0
+        items = []
+        if not self._started:
+            self._skip(WHITESPACE)
+            if self._pos == len(self._buffer):
+                return items
+            if self._buffer[self._pos] != "[":
+                raise ValueError(f"Expected a JSON array, got {self._buffer[self._pos:self._pos + 40]!r}")
+            self._pos += 1
+            self._started = True
+        while not self.done:
+            self._skip(WHITESPACE + ",")
+            if self._pos == len(self._buffer):
+                break
+            if self._buffer[self._pos] == "]":
+                self.done = True
+                break
+            try:
+                item, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                break  # item continues in the next chunk
+            if self._buffer[self._pos] not in SELF_DELIMITED and (
+                    end == len(self._buffer) or self._buffer[end] not in WHITESPACE + ",]"):
+                break  # a number or literal may be a prefix ("1" of "1.5"); wait for its delimiter
+            items.append(item)
+            self._pos = end
+        return items
+
+    def close(self):
+        """Check the array was complete."""
+        if not self.done:
+            raise ValueError("Response ended inside the JSON array")
+
+
+def _open_output(path):
+    if path.endswith(".gz"):
+        return io.TextIOWrapper(gzip.open(path, "wb"), encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+class RowWriter:
+    """Write rows as CSV (header from the first row) or JSON lines, by extension."""
+
+    def __init__(self, path):
+        self._file = _open_output(path)
+        self._csv = ".csv" in path
+        self._writer = None
+
+    def write(self, row):
+        if not self._csv:
+            self._file.write(json.dumps(row) + "\n")
+            return
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._file, fieldnames=list(row), extrasaction="ignore")
+            self._writer.writeheader()
+        self._writer.writerow(row)
+
+    def close(self):
+        self._file.close()
+
+
+def export_streamed(client, path, out_path=None, chunk_size=CHUNK_SIZE):
+    """
+    Stream the array at `path` row by row, writing rows to `out_path` if given.
+
+    Returns:
+        Dict with status, rows, bytes, ttfb_ms, first_row_ms, total_ms
+    """
+    writer = RowWriter(out_path) if out_path else None
+    stats = {"status": None, "rows": 0, "bytes": 0, "ttfb_ms": 0.0, "first_row_ms": None, "total_ms": 0.0}
+    start = time.perf_counter()
+    try:
+        with client.stream("GET", path) as (response, ttfb):
+            stats["status"] = response.status
+            stats["ttfb_ms"] = ttfb * 1000
+            if not 200 <= response.status < 300:
+                stats["bytes"] = len(response.read())
+                return stats
+            decoder = JsonArrayStream()
+            while True:
+                chunk = response.read1(chunk_size)
+                if not chunk:
+                    break
+                stats["bytes"] += len(chunk)
+                for row in decoder.feed(chunk):
+                    if stats["first_row_ms"] is None:
+                        stats["first_row_ms"] = (time.perf_counter() - start) * 1000
+                    stats["rows"] += 1
+                    if writer is not None:
+                        writer.write(row)
+            decoder.close()
+    finally:
+        if writer is not None:
+            writer.close()
+    stats["total_ms"] = (time.perf_counter() - start) * 1000
+    return stats
+
+
+def fetch_buffered(client, path):
+    """
+    Read the whole body, then decode it (what the frontend and most scripts do).
+
+    Returns:
+        Dict with the same keys as export_streamed
+    """
+    start = time.perf_counter()
+    response = client.get(path)
+    rows = response.json() if response.ok else None
+    total_ms = (time.perf_counter() - start) * 1000
+    return {
+        "status": response.status,
+        "rows": len(rows or []),
+        "bytes": response.size,
+        "ttfb_ms": response.ttfb * 1000,
+        "first_row_ms": total_ms if rows else None,
+        "total_ms": total_ms,
+    }
+
+
+def peak_memory(function, *args, **kwargs):
+    """
+    Run function(*args, **kwargs) under tracemalloc.
+
+    Returns:
+        (result, peak traced bytes)
+    """
+    tracemalloc.start()
+    try:
+        result = function(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+def format_stats(mode, stats, peak=None):
+    first_row = f"{stats['first_row_ms']:9.0f}ms" if stats["first_row_ms"] is not None else f"{'-':>11}"
+    peak_text = f"{peak / 1024 / 1024:8.1f}MB" if peak is not None else f"{'-':>10}"
+    return (f"{mode:<9} status={stats['status']} rows={stats['rows']:<8} {stats['bytes'] / 1024 / 1024:7.1f}MB "
+            f"ttfb={stats['ttfb_ms']:7.0f}ms first={first_row} total={stats['total_ms']:8.0f}ms peak={peak_text}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export transaction listings without buffering them")
+    parser.add_argument("listing", choices=["admin", "user"], help="AdminTransactions or the user's transactions")
+    parser.add_argument("--out", default=None, help="Output file: .csv or .jsonl, optionally .gz")
+    parser.add_argument("--search", default=None, help="Admin listing search term")
+    parser.add_argument("--email", default=None, help="User to log in as (user listing)")
+    parser.add_argument("--password", default=None, help="Password (prompted if omitted)")
+    parser.add_argument("--api-url", default=None, help="Backend URL (default API_BASE_URL)")
+    parser.add_argument("--compare", action="store_true", help="Measure buffered vs streamed reads, no export")
+    args = parser.parse_args()
+
+    if args.out is None and not args.compare:
+        parser.error("--out or --compare is required")
+    with ApiClient(args.api_url, timeout=600) as client:
+        if args.listing == "user":
+            if not args.email:
+                parser.error("--email is required for the user listing")
+            if not client.login(args.email, args.password or getpass.getpass()):
+                raise SystemExit(f"Login failed for {args.email}")
+            path = USER_TRANSACTIONS
+        else:
+            path = ADMIN_TRANSACTIONS + (f"?{urlencode({'search': args.search})}" if args.search else "")
+
+        if args.compare:
+            print(format_stats("buffered", fetch_buffered(client, path)))
+            print(format_stats("streamed", export_streamed(client, path)))
+            _, buffered_peak = peak_memory(fetch_buffered, client, path)
+            _, streamed_peak = peak_memory(export_streamed, client, path)
+            print(f"peak heap: buffered {buffered_peak / 1024 / 1024:.1f}MB, "
+                  f"streamed {streamed_peak / 1024 / 1024:.1f}MB")
+            return
+        stats = export_streamed(client, path, args.out)
+    print(format_stats("streamed", stats))
+    if stats["status"] == 200:
+        print(f"Wrote {stats['rows']} rows to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
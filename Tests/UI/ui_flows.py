@@ -0,0 +1,224 @@
+"""
+Reusable patient UI flows built from the steps of the existing tests.
+
+Each flow drives an already logged-in (or about to log in) browser through one
+user journey and returns True on success / False on failure instead of
+raising, so long-running and multi-user runners can keep going and count
+failures.
+"""
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from conftest import login_user
+from form_fill import fill_form
+from locators import CARD_CLASS, LocatorResolver
+
+
+DOCTOR_CARD_XPATH = f"//div[{CARD_CLASS}][.//button[contains(text(), 'Book Now')]]"
+BOOK_NOW_XPATH = "//button[contains(text(), 'Book Now')]"
+MODAL_XPATH = "//div[contains(@class, 'modal-box')]"
+BOOKING_SUCCESS_XPATH = "//h2[contains(text(), 'Appointment Booked Successfully')]"
+
+# Bank details accepted by the (simulated) payment form
+TEST_PAYMENT = {
+    "Account Name": "Test Patient",
+    "Account Number": "12345678",
+    "Bank Name": "Test Bank",
+    "Bank Branch": "Colombo",
+    "PIN": "1234",
+}
+
+
+def slot_card_xpath(slot_date=None):
+    """XPath of the booking page's slot cards, optionally only the one for `slot_date` (YYYY-MM-DD)."""
+    if slot_date is None:
+        return "//div[contains(@class, 'slot-card')]"
+    return f"//div[contains(@class, 'slot-card')][.//span[contains(@class, 'slot-value') and text()='{slot_date}']]"
+
+
+def logout(driver, base_url):
+    """Drop the session the same way the Logout button does (clear localStorage)."""
+    try:
+        driver.get(f"{base_url}/login")
+        driver.execute_script("window.localStorage.clear();")
+        return True
+    except Exception as e:
+        print(f"Logout failed: {str(e)}")
+        return False
+
+
+def search_doctors(driver, base_url, query="", timeout=10):
+    """Search doctors on /patient (as in test_search_doctor_by_name)."""
+    try:
+        driver.get(f"{base_url}/patient")
+        resolver = LocatorResolver(driver)
+        search_input = resolver.find("doctor_search_input", timeout=timeout)
+        search_input.clear()
+        if query:
+            search_input.send_keys(query)
+        resolver.find("doctor_search_button", timeout=timeout, clickable=True).click()
+        resolver.find_all("doctor_card", timeout=timeout)
+        return True
+    except Exception as e:
+        print(f"Doctor search failed: {str(e)}")
+        return False
+
+
+def open_booking_page(driver, base_url, doctor_id=None, timeout=10):
+    """
+    Open a doctor's booking page, either directly (/book/{doctor_id}) or by
+    clicking the first "Book Now" on the doctor grid (as in
+    test_navigate_to_booking_page).
+    """
+    try:
+        if doctor_id is not None:
+            driver.get(f"{base_url}/book/{doctor_id}")
+        else:
+            LocatorResolver(driver).find("book_now", timeout=timeout, clickable=True).click()
+        WebDriverWait(driver, timeout).until(EC.url_contains("/book/"))
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'slot-card')] | //div[contains(@class, 'no-slots')]"))
+        )
+        return True
+    except Exception as e:
+        print(f"Booking page not reachable: {str(e)}")
+        return False
+
+
+def open_booking_modal(driver, timeout=10, slot_date=None):
+    """
+    Click "Book Now" on the first open slot of the booking page (or on the
+    slot of `slot_date`) and wait for the modal.
+    """
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.element_to_be_clickable((By.XPATH, slot_card_xpath(slot_date) + BOOK_NOW_XPATH))
+        ).click()
+        WebDriverWait(driver, timeout).until(
+            EC.visibility_of_element_located((By.XPATH, MODAL_XPATH))
+        )
+        return True
+    except Exception as e:
+        print(f"Booking modal not available: {str(e)}")
+        return False
+
+
+def cancel_booking_modal(driver, timeout=10):
+    """Close the booking modal with its Cancel button without paying."""
+    try:
+        driver.find_element(By.XPATH, MODAL_XPATH + "//button[contains(text(), 'Cancel')]").click()
+        WebDriverWait(driver, timeout).until(
+            EC.invisibility_of_element_located((By.XPATH, MODAL_XPATH))
+        )
+        return True
+    except Exception as e:
+        print(f"Booking modal cancel failed: {str(e)}")
+        return False
+
+
+def fill_labelled_input(driver, label, value):
+    """Type into the form-group input labelled `label` (the payment form has no placeholders)."""
+    field = driver.find_element(
+        By.XPATH, f"//div[contains(@class, 'form-group')][label[starts-with(normalize-space(), '{label}')]]//input"
+    )
+    field.clear()
+    field.send_keys(value)
+
+
+def complete_booking(driver, patient, timeout=15):
+    """
+    Fill the open booking modal and pay with TEST_PAYMENT.
+
+    Args:
+        driver: WebDriver with the booking modal open
+        patient: Dict with 'name' (letters only), 'nic' (12 digits), 'email' and 'contact'
+
+    Returns:
+        (outcome, message): outcome is "booked", "rejected" when the backend
+        refused the booking (the page alerts, e.g. "No available slots") or
+        None when the UI failed; message is the alert or error text
+    """
+    try:
+        for placeholder, key in (("Enter full name", "name"), ("12 digit NIC number", "nic"),
+                                 ("example@email.com", "email"), ("Contact number", "contact")):
+            field = driver.find_element(By.XPATH, f"{MODAL_XPATH}//input[@placeholder='{placeholder}']")
+            field.clear()
+            field.send_keys(patient[key])
+        driver.find_element(By.XPATH, MODAL_XPATH + "//button[contains(text(), 'Pay Now')]").click()
+
+        WebDriverWait(driver, timeout).until(
+            EC.visibility_of_element_located((By.XPATH, "//button[contains(text(), 'Checkout')]"))
+        )
+        for label, value in TEST_PAYMENT.items():
+            fill_labelled_input(driver, label, value)
+        driver.find_element(By.XPATH, "//button[contains(text(), 'Checkout')]").click()
+
+        WebDriverWait(driver, timeout).until(EC.any_of(
+            EC.alert_is_present(),
+            EC.presence_of_element_located((By.XPATH, BOOKING_SUCCESS_XPATH)),
+        ))
+        try:
+            alert = driver.switch_to.alert
+        except Exception:
+            return "booked", None
+        message = alert.text
+        alert.accept()
+        return "rejected", message
+    except Exception as e:
+        print(f"Booking failed: {str(e)}")
+        return None, str(e)
+
+
+def edit_profile(driver, base_url, name, timeout=10, realistic=None):
+    """Change the profile name on /account (Edit Profile -> Save) and wait for the confirmation."""
+    try:
+        driver.get(f"{base_url}/account")
+        WebDriverWait(driver, timeout).until(
+            EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Edit Profile')]"))
+        ).click()
+        name_input = WebDriverWait(driver, timeout).until(
+            EC.visibility_of_element_located((By.XPATH, "//input[@name='name']"))
+        )
+        fill_form(driver, [(name_input, name)], realistic=realistic)
+        driver.find_element(By.XPATH, "//button[@type='submit' and contains(text(), 'Save')]").click()
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Profile updated successfully')]"))
+        )
+        return True
+    except Exception as e:
+        print(f"Profile edit failed: {str(e)}")
+        return False
+
+
+def booking_cycle(driver, base_url, test_user, query=""):
+    """
+    One full login -> search -> open booking modal -> close modal -> logout cycle.
+
+    Nothing is booked or cancelled: the backend has no cancel endpoint, so a
+    real booking could not be undone and every cycle would use up a slot.
+    The modal is opened and closed with its Cancel button instead, which
+    still mounts and unmounts the booking UI each cycle.
+
+    Returns:
+        Dict mapping each step name to its duration in seconds, or None for
+        the step that failed (later steps are not attempted).
+    """
+    steps = [
+        ("login", lambda: login_user(driver, base_url, test_user)),
+        ("search", lambda: search_doctors(driver, base_url, query)),
+        ("open_booking", lambda: open_booking_page(driver, base_url)),
+        ("open_modal", lambda: open_booking_modal(driver)),
+        ("close_modal", lambda: cancel_booking_modal(driver)),
+        ("logout", lambda: logout(driver, base_url)),
+    ]
+    timings = {}
+    for name, step in steps:
+        start = time.perf_counter()
+        ok = step()
+        timings[name] = (time.perf_counter() - start) if ok else None
+        if not ok:
+            break
+    return timings
@@ -0,0 +1,205 @@
+"""
+Screenshot-based visual regression checks with a perceptual-hash fast path.
+
+Each check takes a screenshot, blanks out masked regions (dynamic content such
+as the user's name) and compares a 64-bit difference hash (dHash) with the
+baseline's. Only when the hashes differ is the full masked pixel diff run.
+
+Baselines are stored content-addressed: every image is saved once under
+objects/<sha256>.png and index.json maps check names to an object and its
+hash, so identical screenshots are stored only once.
+
+Environment variables:
+    VISUAL_BASELINE_DIR        where baselines live (default ./visual_baselines)
+    VISUAL_UPDATE_BASELINES    set to 1 to overwrite baselines with new screenshots
+    VISUAL_HASH_THRESHOLD      max differing hash bits for the fast path (default 0)
+    VISUAL_PIXEL_TOLERANCE     max fraction of differing pixels (default 0.001)
+"""
+import hashlib
+import io
+import json
+import os
+import threading
+
+from PIL import Image, ImageChops, ImageDraw
+
+
+BASELINE_DIR = os.getenv("VISUAL_BASELINE_DIR", os.path.join(os.path.dirname(__file__), "visual_baselines"))
+UPDATE_BASELINES = os.getenv("VISUAL_UPDATE_BASELINES", "0") == "1"
+HASH_THRESHOLD = int(os.getenv("VISUAL_HASH_THRESHOLD", "0"))
+PIXEL_TOLERANCE = float(os.getenv("VISUAL_PIXEL_TOLERANCE", "0.001"))
+
+# Per-channel difference below which two pixels count as equal (anti-aliasing noise)
+PIXEL_NOISE = 16
+
+
+def dhash(image, size=8):
+    """64-bit difference hash: compares neighbouring pixels of a tiny grayscale copy."""
+    small = image.convert("L").resize((size + 1, size), Image.BILINEAR)
+    pixels = list(small.getdata())
+    bits = 0
+    for row in range(size):
+        for col in range(size):
+            left = pixels[row * (size + 1) + col]
+            right = pixels[row * (size + 1) + col + 1]
+            bits = (bits << 1) | (1 if left > right else 0)
+    return bits
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+def apply_mask(image, regions):
+    """Return a copy of `image` with each (x, y, width, height) region filled black."""
+    if not regions:
+        return image
+    masked = image.copy()
+    draw = ImageDraw.Draw(masked)
+    for x, y, width, height in regions:
+        draw.rectangle([x, y, x + width - 1, y + height - 1], fill="black")
+    return masked
+
+
+def pixel_diff_ratio(image, baseline):
+    """
+    Fraction of pixels that differ by more than PIXEL_NOISE in any channel.
+    Images of different sizes count as completely different.
+    """
+    if image.size != baseline.size:
+        return 1.0
+    diff = ImageChops.difference(image.convert("RGB"), baseline.convert("RGB"))
+    mask = diff.convert("L").point(lambda value: 255 if value > PIXEL_NOISE else 0)
+    changed = mask.histogram()[255]
+    return changed / float(image.size[0] * image.size[1])
+
+
+class BaselineStore:
+    """Content-addressed baseline images with a name -> object index."""
+
+    def __init__(self, root=BASELINE_DIR):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.index_path = os.path.join(root, "index.json")
+        self._lock = threading.Lock()
+        self._index = None
+
+    def _load_index(self):
+        if self._index is None:
+            try:
+                with open(self.index_path, encoding="utf-8") as index_file:
+                    self._index = json.load(index_file)
+            except FileNotFoundError:
+                self._index = {}
+        return self._index
+
+    def get(self, name):
+        """Index entry {'sha256', 'hash', 'size'} for `name`, or None."""
+        with self._lock:
+            return self._load_index().get(name)
+
+    def load_image(self, entry):
+        return Image.open(os.path.join(self.objects_dir, entry["sha256"] + ".png"))
+
+    def save(self, name, png_bytes, image_hash, size):
+        """Store a baseline; the PNG is only written if no identical object exists."""
+        sha256 = hashlib.sha256(png_bytes).hexdigest()
+        with self._lock:
+            os.makedirs(self.objects_dir, exist_ok=True)
+            object_path = os.path.join(self.objects_dir, sha256 + ".png")
+            if not os.path.exists(object_path):
+                with open(object_path, "wb") as object_file:
+                    object_file.write(png_bytes)
+            index = self._load_index()
+            index[name] = {"sha256": sha256, "hash": f"{image_hash:016x}", "size": list(size)}
+            tmp_path = self.index_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as index_file:
+                json.dump(index, index_file, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+
+    def prune(self):
+        """Delete objects no longer referenced by the index. Returns how many were removed."""
+        referenced = {entry["sha256"] + ".png" for entry in self._load_index().values()}
+        removed = 0
+        for filename in os.listdir(self.objects_dir) if os.path.isdir(self.objects_dir) else []:
+            if filename not in referenced:
+                os.remove(os.path.join(self.objects_dir, filename))
+                removed += 1
+        return removed
+
+
+class VisualResult:
+    """Outcome of one visual check."""
+
+    def __init__(self, name, passed, method, distance=0, diff_ratio=0.0, diff_path=None):
+        self.name = name
+        self.passed = passed
+        self.method = method
+        self.distance = distance
+        self.diff_ratio = diff_ratio
+        self.diff_path = diff_path
+
+    def __repr__(self):
+        return (f"VisualResult({self.name!r}, passed={self.passed}, method={self.method!r}, "
+                f"distance={self.distance}, diff_ratio={self.diff_ratio:.5f})")
+
+
+def element_regions(driver, selectors):
+    """Screenshot-pixel rectangles of every element matching the CSS selectors."""
+    if not selectors:
+        return []
+    rects = driver.execute_script(
+        """
+        var ratio = window.devicePixelRatio || 1, out = [];
+        arguments[0].forEach(function (selector) {
+          document.querySelectorAll(selector).forEach(function (el) {
+            var r = el.getBoundingClientRect();
+            out.push([r.left * ratio, r.top * ratio, r.width * ratio, r.height * ratio]);
+          });
+        });
+        return out;
+        """,
+        list(selectors),
+    )
+    return [tuple(int(round(value)) for value in rect) for rect in rects]
+
+
+def check_screenshot(driver, name, mask_selectors=(), mask_regions=(), store=None):
+    """
+    Compare the current viewport against the baseline called `name`.
+
+    Args:
+        driver: WebDriver on the page to check
+        name: Baseline name, e.g. "login"
+        mask_selectors: CSS selectors of dynamic elements to ignore
+        mask_regions: Extra (x, y, width, height) pixel regions to ignore
+        store: BaselineStore (defaults to one at BASELINE_DIR)
+
+    Returns:
+        VisualResult; a missing baseline is recorded and counts as passed
+    """
+    store = store or BaselineStore()
+    regions = list(mask_regions) + element_regions(driver, mask_selectors)
+    image = apply_mask(Image.open(io.BytesIO(driver.get_screenshot_as_png())).convert("RGB"), regions)
+    image_hash = dhash(image)
+
+    baseline = store.get(name)
+    if baseline is None or UPDATE_BASELINES:
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG", optimize=True)
+        store.save(name, buffer.getvalue(), image_hash, image.size)
+        return VisualResult(name, True, "baseline-created")
+
+    distance = hamming(image_hash, int(baseline["hash"], 16))
+    if distance <= HASH_THRESHOLD and list(image.size) == baseline["size"]:
+        return VisualResult(name, True, "hash", distance)
+
+    ratio = pixel_diff_ratio(image, store.load_image(baseline))
+    if ratio <= PIXEL_TOLERANCE:
+        return VisualResult(name, True, "pixel", distance, ratio)
+
+    diff_dir = os.path.join(store.root, "diffs")
+    os.makedirs(diff_dir, exist_ok=True)
+    diff_path = os.path.join(diff_dir, f"{name}.actual.png")
+    image.save(diff_path)
+    return VisualResult(name, False, "pixel", distance, ratio, diff_path)